@@ -0,0 +1,312 @@
+"""Benchmark Athena's parse, validate, execute and report stages at scale.
+
+Synthetic suites of noop tests are generated for each requested size, so the
+numbers reflect framework overhead rather than the cost of real checks. Every
+stage records its best wall time over several rounds and, in a separate round,
+its tracemalloc peak. Results are written as JSON so runs of different
+versions can be compared:
+
+    python benchmarks/bench.py --output before.json
+    python benchmarks/bench.py --output after.json
+    python benchmarks/bench.py --compare before.json after.json
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import yaml
+from rich.console import Console
+
+from athena.cli import create_plugin_manager, create_test_suite_service
+from athena.models.reporter_config import ReporterConfig
+from athena.models.test_suite_config import TestSuiteConfig
+from athena.models.test_suite_summary import TestSuiteSummary
+from athena.services.test_suite_service import TestSuiteService
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+CONFIG_FORMATS = ["yaml", "json"]
+
+
+def generate_config(size: int) -> Dict[str, Any]:
+    """Generate a suite of ``size`` noop tests with typical parameter blocks."""
+    return {
+        "parameters": {
+            "timeout": 30,
+            "environment": "benchmark",
+            "memory": {"threshold": 90},
+        },
+        "tests": [
+            {
+                "name": f"test_{index:06d}",
+                "plugin_identifier": "noop",
+                "parameters": {"disk": {"path": "/tmp", "threshold": index % 100}},
+            }
+            for index in range(size)
+        ],
+        "reports": [],
+    }
+
+
+def write_config(config: Dict[str, Any], directory: Path, config_format: str) -> Path:
+    path = directory / f"suite_{len(config['tests'])}.{config_format}"
+    with path.open("w") as f:
+        if config_format == "json":
+            json.dump(config, f)
+        else:
+            yaml.dump(config, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
+    return path
+
+
+def measure(function: Callable[[], Any], rounds: int) -> Dict[str, float]:
+    """Return the best wall time over ``rounds`` and the tracemalloc peak."""
+    wall_times: List[float] = []
+    for _ in range(rounds):
+        gc.collect()
+        started = time.perf_counter()
+        function()
+        wall_times.append(time.perf_counter() - started)
+
+    # Tracing slows allocations down, so memory is sampled in its own round.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"wall_time": min(wall_times), "peak_memory": peak}
+
+
+def measure_command(command: List[str], rounds: int) -> Dict[str, float]:
+    """Return the best wall time of a subprocess over ``rounds``."""
+    wall_times: List[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True)
+        wall_times.append(time.perf_counter() - started)
+    return {"wall_time": min(wall_times)}
+
+
+@contextmanager
+def working_directory(path: Path) -> Iterator[None]:
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def silence_reporters(test_suite_service: TestSuiteService) -> None:
+    """Send console reporters' output to an in-memory buffer.
+
+    Reporter timeouts are lifted too: a benchmark measures slow reporters
+    instead of abandoning them.
+    """
+    test_suite_service.report_service.timeout = None
+    plugin_service = test_suite_service.report_service.plugin_service
+    for plugin in plugin_service.plugin_registry.values():
+        if hasattr(plugin.executor, "console"):
+            plugin.executor.console = Console(file=io.StringIO(), width=120)
+
+
+def bench_startup(rounds: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "stage": "import",
+            **measure_command([sys.executable, "-c", "import athena.cli"], rounds),
+        },
+        {
+            "stage": "cli_startup",
+            **measure_command(
+                [sys.executable, "-m", "athena.cli", "--help"],
+                rounds,
+            ),
+        },
+    ]
+
+
+def bench_size(
+    test_suite_service: TestSuiteService,
+    size: int,
+    directory: Path,
+    rounds: int,
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    config = generate_config(size)
+
+    parser_service = test_suite_service.data_parser_service
+    for config_format in CONFIG_FORMATS:
+        path = write_config(config, directory, config_format)
+
+        def parse() -> None:
+            # Parsed files are cached by content; measure the cold path.
+            parser_service.clear_cache()
+            parser_service.parse(path)
+
+        results.append(
+            {
+                "stage": f"parse_{config_format}",
+                "size": size,
+                **measure(parse, rounds),
+            }
+        )
+
+    results.append(
+        {
+            "stage": "validate",
+            "size": size,
+            **measure(lambda: TestSuiteConfig(**config), rounds),
+        }
+    )
+
+    suite_config = TestSuiteConfig(**config)
+    plan_service = test_suite_service.plan_service
+    results.append(
+        {
+            "stage": "plan",
+            "size": size,
+            **measure(lambda: plan_service.compile(suite_config), rounds),
+        }
+    )
+
+    plan = plan_service.compile(suite_config)
+    results.append(
+        {
+            "stage": "run_tests",
+            "size": size,
+            **measure(lambda: test_suite_service.test_service.run_tests(plan), rounds),
+        }
+    )
+
+    summary = TestSuiteSummary(results=test_suite_service.test_service.run_tests(plan))
+    baseline = directory / f"baseline_{size}.json"
+    baseline.write_text(summary.model_dump_json())
+
+    report_service = test_suite_service.report_service
+    for identifier, parameters in reporter_parameters(baseline).items():
+        report_config = suite_config.model_copy(
+            update={
+                "reports": [
+                    ReporterConfig(
+                        name=identifier,
+                        plugin_identifier=identifier,
+                        parameters=parameters,
+                    )
+                ]
+            }
+        )
+        # Status lines such as "Report exported to" would garble the output
+        with working_directory(directory), redirect_stdout(io.StringIO()):
+            measured = measure(
+                lambda: report_service.generate_reports(report_config, summary),
+                rounds,
+            )
+        results.append({"stage": f"report_{identifier}", "size": size, **measured})
+
+    return results
+
+
+def reporter_parameters(baseline: Path) -> Dict[str, Dict[str, Any]]:
+    """Parameters used to benchmark each builtin reporter."""
+    return {
+        "json": {},
+        "rich_console": {"format": "table"},
+        "baseline_diff": {"baseline": str(baseline)},
+        "openmetrics": {"path": str(baseline.with_name("athena.prom"))},
+    }
+
+
+def athena_version() -> str:
+    try:
+        return metadata.version("athena")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def run_benchmarks(sizes: List[int], rounds: int) -> Dict[str, Any]:
+    test_suite_service = create_test_suite_service(create_plugin_manager())
+    silence_reporters(test_suite_service)
+
+    results = bench_startup(rounds)
+    with tempfile.TemporaryDirectory(prefix="athena-bench-") as directory:
+        for size in sizes:
+            print(f"Benchmarking {size} tests...", file=sys.stderr)
+            results.extend(
+                bench_size(test_suite_service, size, Path(directory), rounds)
+            )
+
+    return {
+        "athena_version": athena_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now().isoformat(),
+        "rounds": rounds,
+        "results": results,
+    }
+
+
+def compare(before: Path, after: Path) -> None:
+    """Print the relative change of every stage between two result files."""
+
+    def index(path: Path) -> Dict[str, Dict[str, Any]]:
+        data = json.loads(path.read_text())
+        return {f"{r['stage']}[{r.get('size', '-')}]": r for r in data["results"]}
+
+    old, new = index(before), index(after)
+    print(f"{'stage':<32} {'time before':>12} {'time after':>12} {'change':>8}")
+    for key, result in new.items():
+        if key not in old:
+            continue
+        previous = old[key]["wall_time"]
+        current = result["wall_time"]
+        change = (current - previous) / previous * 100 if previous else 0.0
+        print(f"{key:<32} {previous:>11.4f}s {current:>11.4f}s {change:>+7.1f}%")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Suite sizes"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="Timed rounds per measurement"
+    )
+    parser.add_argument(
+        "--output", type=Path, default=Path("bench_output.json"), help="Result file"
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        nargs=2,
+        metavar=("BEFORE", "AFTER"),
+        help="Compare two result files instead of running benchmarks",
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    report = run_benchmarks(args.sizes, args.rounds)
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"Benchmark results written to: {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,45 @@
+import json
 import logging
+import time
+from collections import Counter
 from pathlib import Path
+from typing import List, Optional
 
 import pluggy
 import typer
+from rich import box
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
 
+from athena.exceptions import PlanError
 from athena.models import BaseModel
+from athena.parameters import ParameterResolver, thaw
 from athena.plugins.builtin import (
     BUILTIN_PARSER_PLUGINS,
     BUILTIN_REPORTER_PLUGINS,
     BUILTIN_TEST_RUNNER_PLUGINS,
 )
+from athena.plugins.builtin.reporters.baseline_diff_reporter import (
+    BaselineDiffReporter,
+)
 from athena.plugins.hookspecs import DataParserHooks, ReporterHooks, TestRunnerHooks
+from athena.selection import TestSelector
 from athena.services.config_parser_service import ConfigParserService
+from athena.services.plan_service import PlanService
 from athena.services.plugin_service import PluginService
+from athena.services.report_diff_service import ReportDiffService
+from athena.services.report_merge_service import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MOST_FAILING,
+    ReportMergeService,
+)
 from athena.services.report_service import ReportService
+from athena.services.schedule_service import (
+    DEFAULT_HISTORY,
+    SchedulePolicy,
+    ScheduleService,
+)
 from athena.services.test_service import TestService
 from athena.services.test_suite_service import TestSuiteService
 from athena.types import (
@@ -27,66 +53,309 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def create_plugin_manager() -> pluggy.PluginManager:
+    """Create a plugin manager with the builtin and installed plugins."""
+    plugin_manager = pluggy.PluginManager("athena")
+    plugin_manager.add_hookspecs(DataParserHooks)
+    plugin_manager.add_hookspecs(TestRunnerHooks)
+    plugin_manager.add_hookspecs(ReporterHooks)
+    plugin_manager.load_setuptools_entrypoints("athena.plugins")
+
+    for plugin in (
+        BUILTIN_PARSER_PLUGINS + BUILTIN_TEST_RUNNER_PLUGINS + BUILTIN_REPORTER_PLUGINS
+    ):
+        plugin_manager.register(plugin)
+
+    return plugin_manager
+
+
+def create_test_suite_service(
+    plugin_manager: pluggy.PluginManager,
+    cache_dir: Optional[Path] = None,
+    schedule_service: Optional[ScheduleService] = None,
+) -> TestSuiteService:
+    """Activate the registered plugins and wire the core services together."""
+    # Create plugin services for different plugin types
+    data_parser_plugin_service = PluginService[DataParserPluginResult, BaseModel]()
+    data_parser_plugin_service.register_plugins(
+        plugin_manager.hook.activate_data_parser_plugin()
+    )
+    test_runner_plugin_service = PluginService[TestRunnerPluginResult, BaseModel]()
+    test_runner_plugin_service.register_plugins(
+        plugin_manager.hook.activate_test_plugin()
+    )
+    reporter_plugin_service = PluginService[ReporterPluginResult, BaseModel]()
+    reporter_plugin_service.register_plugins(
+        plugin_manager.hook.activate_reporter_plugin()
+    )
+
+    # Initialize core services, sharing the layers of resolved parameters
+    parameter_resolver = ParameterResolver()
+    data_parser_service = ConfigParserService(
+        data_parser_plugin_service,
+        cache_dir=cache_dir,
+        parameter_resolver=parameter_resolver,
+    )
+    plan_service = PlanService(
+        test_runner_plugin_service,
+        reporter_plugin_service,
+        parameter_resolver=parameter_resolver,
+    )
+    test_service = TestService(schedule_service=schedule_service)
+    report_service = ReportService(reporter_plugin_service)
+
+    # Create the main test suite service with the required service protocols
+    return TestSuiteService(
+        data_parser_service,
+        plan_service,
+        test_service,
+        report_service,
+    )
+
+
+def create_selector(
+    keyword: Optional[str], tags: Optional[List[str]]
+) -> Optional[TestSelector]:
+    """Build the test selection of the command line, None to select all."""
+    if keyword is None and not tags:
+        return None
+    try:
+        return TestSelector(keyword, tags or ())
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="'-k'")
+
+
 @app.command()
 def run(
-    config_file: Path = typer.Argument(..., help="The path to the config file"),
+    config_files: List[Path] = typer.Argument(
+        ..., help="Config files, directories of config files or glob patterns"
+    ),
+    cache_dir: Optional[Path] = typer.Option(
+        None, help="Directory caching parsed config files between runs"
+    ),
+    keyword: Optional[str] = typer.Option(
+        None,
+        "-k",
+        help="Only tests whose name or tags match the expression, "
+        "e.g. 'api and not slow'",
+    ),
+    tags: Optional[List[str]] = typer.Option(
+        None, "--tag", help="Only tests with this tag; repeat for any of several"
+    ),
+    schedule: SchedulePolicy = typer.Option(
+        SchedulePolicy.CONFIG,
+        help="Start tests in config order, longest first or failing first, "
+        "from the history of previous reports",
+    ),
+    history: Optional[List[Path]] = typer.Option(
+        None,
+        help="JSON reports, directories or glob patterns the schedule is based "
+        f"on (default: {DEFAULT_HISTORY})",
+    ),
+    every: Optional[float] = typer.Option(
+        None,
+        min=0,
+        help="Keep running, starting a new run every given number of seconds",
+    ),
     verbose: bool = typer.Option(
         False, "-v", "--verbose", help="Enable verbose logging"
     ),
 ) -> None:
-    """Run tests based on the provided configuration file."""
+    """Run tests based on the provided configuration files as a single run."""
+    selector = create_selector(keyword, tags)
 
     # Set logging level based on verbosity
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
     try:
-        plugin_manager = pluggy.PluginManager("athena")
-        plugin_manager.add_hookspecs(DataParserHooks)
-        plugin_manager.add_hookspecs(TestRunnerHooks)
-        plugin_manager.add_hookspecs(ReporterHooks)
-        plugin_manager.load_setuptools_entrypoints("athena.plugins")
-
-        for plugin in (
-            BUILTIN_PARSER_PLUGINS
-            + BUILTIN_TEST_RUNNER_PLUGINS
-            + BUILTIN_REPORTER_PLUGINS
-        ):
-            plugin_manager.register(plugin)
-
-        # Create plugin services for different plugin types
-        data_parser_plugin_service = PluginService[DataParserPluginResult, BaseModel]()
-        data_parser_plugin_service.register_plugins(
-            plugin_manager.hook.activate_data_parser_plugin()
-        )
-        test_runner_plugin_service = PluginService[TestRunnerPluginResult, BaseModel]()
-        test_runner_plugin_service.register_plugins(
-            plugin_manager.hook.activate_test_plugin()
-        )
-        reporter_plugin_service = PluginService[ReporterPluginResult, BaseModel]()
-        reporter_plugin_service.register_plugins(
-            plugin_manager.hook.activate_reporter_plugin()
+        schedule_service = None
+        if schedule != SchedulePolicy.CONFIG:
+            schedule_service = ScheduleService(schedule, history or [DEFAULT_HISTORY])
+        test_suite_service = create_test_suite_service(
+            create_plugin_manager(),
+            cache_dir=cache_dir,
+            schedule_service=schedule_service,
         )
 
-        # Initialize core services
-        data_parser_service = ConfigParserService(data_parser_plugin_service)
-        test_service = TestService(test_runner_plugin_service)
-        report_service = ReportService(reporter_plugin_service)
+        # Run the tests
+        while True:
+            started = time.monotonic()
+            try:
+                test_suite_service.run_tests_from_configs(config_files, selector)
+            except Exception:
+                # A long-lived process outlives a single failed run
+                if every is None:
+                    raise
+                logger.exception("Error running tests")
+            if every is None:
+                break
+            time.sleep(max(0.0, every - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        raise typer.Exit(130)
+    except PlanError as e:
+        typer.echo(f"Error: {str(e)}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        logger.exception("Error running tests")
+        typer.echo(f"Error: {str(e)}", err=True)
+        raise typer.Exit(1)
+
 
-        # Create the main test suite service with the required service protocols
-        test_suite_service = TestSuiteService(
-            data_parser_service,
-            test_service,
-            report_service,
+@app.command()
+def plan(
+    config_files: List[Path] = typer.Argument(
+        ..., help="Config files, directories of config files or glob patterns"
+    ),
+    cache_dir: Optional[Path] = typer.Option(
+        None, help="Directory caching parsed config files between runs"
+    ),
+    keyword: Optional[str] = typer.Option(
+        None,
+        "-k",
+        help="Only tests whose name or tags match the expression, "
+        "e.g. 'api and not slow'",
+    ),
+    tags: Optional[List[str]] = typer.Option(
+        None, "--tag", help="Only tests with this tag; repeat for any of several"
+    ),
+    show_tests: bool = typer.Option(
+        False, "--show-tests", help="List every test with its merged parameters"
+    ),
+) -> None:
+    """Compile the configuration files into an execution plan without running it."""
+    selector = create_selector(keyword, tags)
+    try:
+        test_suite_service = create_test_suite_service(
+            create_plugin_manager(), cache_dir=cache_dir
         )
+        execution_plan = test_suite_service.compile_plan(config_files, selector)
+    except PlanError as e:
+        typer.echo(f"Error: {str(e)}", err=True)
+        raise typer.Exit(1)
+    except Exception as e:
+        logger.exception("Error compiling plan")
+        typer.echo(f"Error: {str(e)}", err=True)
+        raise typer.Exit(1)
 
-        # Run the tests
-        test_suite_service.run_tests_from_config(config_file)
+    console = Console()
+    runners = Counter(test.config.plugin_identifier for test in execution_plan.tests)
+    table = Table(title="Execution plan", box=box.ROUNDED)
+    table.add_column("Runner")
+    table.add_column("Plugin")
+    table.add_column("Tests", justify="right")
+    for identifier, plugin in execution_plan.plugins.items():
+        table.add_row(identifier, plugin.metadata.name, str(runners[identifier]))
+    console.print(table)
+
+    if show_tests:
+        tests = Table(box=box.SIMPLE)
+        tests.add_column("#", justify="right")
+        tests.add_column("Test Name")
+        tests.add_column("Runner")
+        tests.add_column("Source")
+        tests.add_column("Parameters")
+        for index, test in enumerate(execution_plan.tests, start=1):
+            tests.add_row(
+                str(index),
+                escape(test.config.name),
+                test.config.plugin_identifier,
+                escape(test.config.source or ""),
+                escape(json.dumps(thaw(test.config.parameters), default=str)),
+            )
+        console.print(tests)
+
+    reporters = ", ".join(r.name for r in execution_plan.config.reports) or "none"
+    console.print(f"{len(execution_plan.tests)} tests planned, reporters: {reporters}")
+
+
+@app.command()
+def diff(
+    baseline: Path = typer.Argument(..., help="The baseline JSON report"),
+    current: Path = typer.Argument(..., help="The JSON report to compare"),
+    duration_threshold: float = typer.Option(
+        0.5, help="Relative duration change to report (0.5 = 50%)"
+    ),
+    min_duration_delta: float = typer.Option(
+        0.1, help="Duration change in seconds below which durations are equal"
+    ),
+    actual_threshold: float = typer.Option(
+        0.2, help="Relative change of numeric actual values to report"
+    ),
+    fail_on_regression: bool = typer.Option(
+        False, help="Exit with an error when a test newly fails"
+    ),
+) -> None:
+    """Compare a JSON report against a baseline report."""
+    try:
+        report_diff = ReportDiffService(
+            duration_threshold=duration_threshold,
+            min_duration_delta=min_duration_delta,
+            actual_threshold=actual_threshold,
+        ).diff_reports(baseline, current)
     except Exception as e:
-        logger.exception("Error running tests")
+        logger.exception("Error comparing reports")
+        typer.echo(f"Error: {str(e)}", err=True)
+        raise typer.Exit(1)
+
+    BaselineDiffReporter().render(report_diff)
+    if fail_on_regression and report_diff.regressions:
+        raise typer.Exit(1)
+
+
+@app.command()
+def merge(
+    reports: List[Path] = typer.Argument(
+        ..., help="JSON reports, directories of reports or glob patterns"
+    ),
+    output: Path = typer.Option(
+        Path("athena_fleet_report.json"), "--output", "-o", help="Fleet report path"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, min=1, help="Processes decoding reports (default: one per core)"
+    ),
+    top: int = typer.Option(
+        DEFAULT_MOST_FAILING, min=0, help="Number of most failing tests shown"
+    ),
+) -> None:
+    """Merge the JSON reports of many hosts into a fleet report."""
+    merge_service = ReportMergeService(
+        max_workers=workers or DEFAULT_MAX_WORKERS, most_failing=top
+    )
+    try:
+        summary = merge_service.merge(reports, output)
+    except Exception as e:
+        logger.exception("Error merging reports")
         typer.echo(f"Error: {str(e)}", err=True)
         raise typer.Exit(1)
 
+    console = Console()
+    if summary.most_failing:
+        table = Table(title="Most failing tests", box=box.ROUNDED)
+        table.add_column("Test Name")
+        table.add_column("Failed", justify="right")
+        table.add_column("Runs", justify="right")
+        table.add_column("Failing Hosts")
+        table.add_column("Mean Duration", justify="right")
+        for stats in summary.most_failing:
+            hosts = ", ".join(stats.failing_hosts[:3])
+            if stats.failing_host_count > 3:
+                hosts += f" and {stats.failing_host_count - 3} more"
+            table.add_row(
+                escape(stats.name),
+                str(stats.failed),
+                str(stats.runs),
+                escape(hosts),
+                f"{stats.duration.mean:.3f}s" if stats.duration else "",
+            )
+        console.print(table)
+    console.print(
+        f"Merged {summary.results} results from {summary.reports} reports of "
+        f"{summary.hosts} hosts: {summary.passed} passed, {summary.failed} failed, "
+        f"{summary.skipped} skipped"
+    )
+    console.print(f"Fleet report written to: {output}")
+
 
 def main() -> None:
     app()
@@ -0,0 +1,18 @@
+from typing import List
+
+MAX_LISTED_ERRORS = 20
+
+
+class PlanError(ValueError):
+    """Raised when a test suite cannot be compiled into an execution plan.
+
+    Attributes:
+        errors: Every problem found in the suite, one message per problem
+    """
+
+    def __init__(self, errors: List[str]) -> None:
+        self.errors = errors
+        listed = "\n".join(f"  - {error}" for error in errors[:MAX_LISTED_ERRORS])
+        if len(errors) > MAX_LISTED_ERRORS:
+            listed += f"\n  ... and {len(errors) - MAX_LISTED_ERRORS} more"
+        super().__init__(f"{len(errors)} error(s) in test suite:\n{listed}")
@@ -0,0 +1,24 @@
+from typing import Dict, Tuple
+
+from athena.models import BaseModel
+from athena.models.planned_test import PlannedTest
+from athena.models.plugin import Plugin
+from athena.models.test_suite_config import TestSuiteConfig
+
+
+class ExecutionPlan(BaseModel):
+    """A test suite compiled ahead of execution.
+
+    Every runner plugin is resolved and every test's parameters validated
+    when the plan is built, so executing it only dispatches.
+    """
+
+    model_config = {"frozen": True}
+
+    config: TestSuiteConfig
+    tests: Tuple[PlannedTest, ...]
+
+    @property
+    def plugins(self) -> Dict[str, Plugin]:
+        """Runner plugins used by the plan, keyed by plugin identifier."""
+        return {test.config.plugin_identifier: test.plugin for test in self.tests}
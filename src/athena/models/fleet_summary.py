@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Tuple
+
+from pydantic import Field
+
+from athena.models import BaseModel
+from athena.models.fleet_test_stats import FleetTestStats
+
+
+class FleetSummary(BaseModel):
+    """Totals of reports merged from a fleet of hosts."""
+
+    model_config = {"frozen": True}
+
+    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    reports: int
+    hosts: int
+    results: int
+    passed: int
+    failed: int
+    skipped: int
+    # Tests with the most failures, most failing first
+    most_failing: Tuple[FleetTestStats, ...] = ()
@@ -0,0 +1,23 @@
+from typing import Dict, List, Optional
+
+from pydantic import Field
+
+from athena.models import BaseModel
+from athena.models.numeric_stats import NumericStats
+
+
+class FleetTestStats(BaseModel):
+    """Results of one test across the reports of a fleet of hosts."""
+
+    name: str
+    runs: int
+    hosts: int  # Distinct hosts reporting the test
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    # First failing hosts in host order; failing_host_count counts them all
+    failing_hosts: List[str] = Field(default_factory=list)
+    failing_host_count: int = 0
+    duration: Optional[NumericStats] = None
+    # Statistics of the numeric actual values, by detail key
+    actual: Dict[str, NumericStats] = Field(default_factory=dict)
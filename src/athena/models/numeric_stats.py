@@ -0,0 +1,10 @@
+from athena.models import BaseModel
+
+
+class NumericStats(BaseModel):
+    """Count, minimum, maximum and mean of a series of numbers."""
+
+    count: int
+    min: float
+    max: float
+    mean: float
@@ -0,0 +1,19 @@
+from athena.models import BaseModel
+from athena.models.plugin import Plugin
+from athena.models.test_config import TestConfig
+
+
+class PlannedTest(BaseModel):
+    """A test whose runner is resolved and whose parameters are validated.
+
+    Attributes:
+        config: Test configuration with its fully merged parameters
+        plugin: The runner plugin executing the test
+        parameters: The runner's validated parameters model instance
+    """
+
+    model_config = {"frozen": True}
+
+    config: TestConfig
+    plugin: Plugin
+    parameters: BaseModel
@@ -1,12 +1,19 @@
-from typing import Callable, Generic, Set, Type
+from typing import Callable, Generic, Optional, Set, Type
 
 from athena.models import BaseModel
 from athena.models.plugin_metadata import PluginMetadata
+from athena.models.test_suite_config import TestSuiteConfig
 from athena.types import PluginParametersType, PluginResultType
 
+SuiteHook = Callable[[TestSuiteConfig], None]
+
 
 class Plugin(BaseModel, Generic[PluginResultType, PluginParametersType]):
     metadata: PluginMetadata
     executor: Callable[[PluginParametersType], PluginResultType]
     parameters_model: Type[PluginParametersType]
     identifiers: Set[str]
+    # Runner lifecycle: called once before the first and after the last test
+    # of a run, only if the suite uses the runner.
+    setup_suite: Optional[SuiteHook] = None
+    teardown_suite: Optional[SuiteHook] = None
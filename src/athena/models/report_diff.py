@@ -0,0 +1,20 @@
+from typing import List, Optional
+
+from pydantic import Field
+
+from athena.models import BaseModel
+from athena.models.test_change import ChangeType, TestChange
+
+
+class ReportDiff(BaseModel):
+    """Differences between a baseline report and a current run."""
+
+    baseline_timestamp: Optional[str] = None
+    current_timestamp: Optional[str] = None
+    compared: int = 0  # Number of tests present in both runs
+    changes: List[TestChange] = Field(default_factory=list)
+
+    @property
+    def regressions(self) -> List[TestChange]:
+        """Changes that turned a test into a failure."""
+        return [c for c in self.changes if c.type == ChangeType.NEW_FAILURE]
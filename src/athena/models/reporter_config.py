@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from pydantic import Field
 
@@ -9,3 +9,4 @@ class ReporterConfig(BaseModel):
     name: str
     plugin_identifier: str
     parameters: Dict[str, Any] = Field(default_factory=dict)
+    timeout: Optional[float] = Field(default=None, gt=0)
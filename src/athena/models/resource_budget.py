@@ -0,0 +1,22 @@
+from enum import Enum
+from typing import Optional
+
+from pydantic import Field
+
+from athena.models import BaseModel
+
+
+class BudgetAction(str, Enum):
+    """What happens to a test whose runner exceeds its resource budget."""
+
+    FLAG = "flag"  # Record the violation, keep the test result
+    FAIL = "fail"  # Turn the test result into a failure
+
+
+class ResourceBudget(BaseModel):
+    """Resource allowance of a test runner for each test it executes."""
+
+    cpu_seconds: Optional[float] = Field(default=None, gt=0)
+    peak_rss_mb: Optional[float] = Field(default=None, gt=0)
+    traced_mb: Optional[float] = Field(default=None, gt=0)
+    action: BudgetAction = BudgetAction.FLAG
@@ -0,0 +1,31 @@
+from typing import Optional, Tuple
+
+from athena.models import BaseModel
+
+
+class ResourceUsage(BaseModel):
+    """Resources consumed by a test runner while executing a single test.
+
+    Attributes:
+        cpu_user: User CPU time, in seconds, of the process, or of the thread
+            running the test when tests run concurrently, and of the child
+            processes that ended meanwhile
+        cpu_system: System CPU time, in seconds, measured the same way
+        peak_rss_delta: Growth, in bytes, of the process peak resident set size
+        traced_peak: Peak of the memory traced by tracemalloc, in bytes, above
+            its level when the test started; only set when tracing is enabled
+        exceeded: Description of every resource budget limit exceeded
+    """
+
+    model_config = {"frozen": True}
+
+    cpu_user: float
+    cpu_system: float
+    peak_rss_delta: int
+    traced_peak: Optional[int] = None
+    exceeded: Tuple[str, ...] = ()
+
+    @property
+    def cpu_time(self) -> float:
+        """Total CPU time in seconds."""
+        return self.cpu_user + self.cpu_system
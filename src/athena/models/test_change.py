@@ -0,0 +1,34 @@
+from enum import Enum
+from typing import Any, Optional
+
+from athena.models import BaseModel
+
+
+class ChangeType(str, Enum):
+    """Enumeration of the differences detected against a baseline report."""
+
+    NEW_FAILURE = "new_failure"  # Did not fail in the baseline, fails now
+    FIXED = "fixed"  # Failed in the baseline, no longer fails
+    STATUS_CHANGED = "status_changed"  # Any other status transition
+    NEW = "new"  # Not present in the baseline
+    REMOVED = "removed"  # Present in the baseline only
+    DURATION = "duration"  # Duration moved beyond the threshold
+    ACTUAL = "actual"  # A measured value moved beyond the threshold
+
+
+class TestChange(BaseModel):
+    """A single difference between a baseline and a current test result.
+
+    Attributes:
+        name: Name of the test
+        type: The kind of change detected
+        baseline: Baseline value (status, duration or measured value)
+        current: Current value (status, duration or measured value)
+        detail: Key of the test detail the change applies to, if any
+    """
+
+    name: str
+    type: ChangeType
+    baseline: Any = None
+    current: Any = None
+    detail: Optional[str] = None
@@ -1,8 +1,14 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Mapping, Optional
 
-from pydantic import Field
+from pydantic import (
+    Field,
+    ValidatorFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+)
 
 from athena.models import BaseModel
+from athena.parameters import FrozenMapping, thaw
 
 
 class TestConfig(BaseModel):
@@ -10,4 +16,28 @@ class TestConfig(BaseModel):
 
     name: str
     plugin_identifier: str
-    parameters: Dict[str, Any] = Field(default_factory=dict)
+    # Plain dict as declared, immutable mapping once merged into a plan
+    parameters: Mapping[str, Any] = Field(default_factory=dict)
+    # Values of the matrix combination the test was expanded from
+    matrix: Dict[str, Any] = Field(default_factory=dict)
+    tags: List[str] = Field(default_factory=list)  # Labels selecting the test
+    source: Optional[str] = None  # Configuration file declaring the test
+    repeat: int = Field(default=1, ge=1)  # Number of times the test is run
+    interval: float = Field(default=0.0, ge=0)  # Seconds between two runs
+    # Percentile of the repeated samples the test is judged on
+    percentile: float = Field(default=95.0, gt=0, lt=100)
+
+    @field_validator("parameters", mode="wrap")
+    @classmethod
+    def _keep_frozen(
+        cls, value: Any, handler: ValidatorFunctionWrapHandler
+    ) -> Mapping[str, Any]:
+        # Frozen mappings are shared between tests, validation would copy them
+        if isinstance(value, FrozenMapping):
+            return value
+        return handler(value)
+
+    @field_serializer("parameters", "matrix")
+    def _serialize_mapping(self, value: Mapping[str, Any]) -> Dict[str, Any]:
+        # Resolved parameters are immutable mappings shared between tests
+        return thaw(value)
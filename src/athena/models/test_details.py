@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Dict, Optional
 
 from athena.models import BaseModel
 
@@ -7,3 +7,5 @@ class TestDetails(BaseModel):
     expected: Any
     actual: Any
     success: bool
+    # Distribution of the actual values of a repeated test, keyed "p95", etc.
+    quantiles: Optional[Dict[str, float]] = None
@@ -1,9 +1,16 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
+from athena.models.resource_usage import ResourceUsage
 from athena.models.test_config import TestConfig
 from athena.models.test_result import TestResult
 
 
 class TestResultSummary(BaseModel):
+    model_config = {"frozen": True}
+
     config: TestConfig
     result: TestResult
+    duration: Optional[float] = None  # Executor wall time in seconds
+    resources: Optional[ResourceUsage] = None
@@ -1,7 +1,10 @@
 from typing import Any, Optional
 
+from pydantic import Field
+
 from athena.models import BaseModel
 from athena.models.reporter_config import ReporterConfig
+from athena.models.resource_budget import ResourceBudget
 from athena.models.test_config import TestConfig
 
 
@@ -11,3 +14,13 @@ class TestSuiteConfig(BaseModel):
     parameters: Optional[dict[str, Any]]
     tests: list[TestConfig]
     reports: list[ReporterConfig]
+    # Parameters of each configuration file, keyed by TestConfig.source and
+    # applied between the global parameters and the test's own parameters.
+    source_parameters: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    # Trace allocations of every test with tracemalloc, at a speed cost
+    trace_allocations: bool = False
+    # Resource budgets keyed by runner plugin identifier; "*" applies to the
+    # runners without a budget of their own.
+    budgets: dict[str, ResourceBudget] = Field(default_factory=dict)
+    # Number of tests executed at the same time
+    concurrency: int = Field(default=1, ge=1)
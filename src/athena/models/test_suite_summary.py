@@ -1,5 +1,6 @@
+import socket
 from datetime import datetime
-from typing import List
+from typing import Optional, Tuple
 
 from pydantic import Field
 
@@ -8,5 +9,13 @@ from athena.models.test_result_summary import TestResultSummary
 
 
 class TestSuiteSummary(BaseModel):
+    """Immutable snapshot of a test suite run, shared by every reporter."""
+
+    model_config = {"frozen": True}
+
     timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
-    results: List[TestResultSummary]
+    # Declared before the results so readers streaming a report know the host
+    # before its first result.
+    host: str = Field(default_factory=socket.gethostname)
+    results: Tuple[TestResultSummary, ...]
+    duration: Optional[float] = None  # Wall time of the test run in seconds
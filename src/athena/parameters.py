@@ -0,0 +1,200 @@
+"""Layered resolution of test parameters with immutable, shared mappings."""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return dict(value)
+    # Tell apart values of other types that would print the same
+    return f"{type(value).__name__}:{value!r}"
+
+
+# Compact, key-sorted encoding giving equal content an equal digest
+_ENCODER = json.JSONEncoder(
+    separators=(",", ":"), sort_keys=True, default=_encode_default
+)
+
+
+_SCALARS = (str, int, float)
+
+
+def _string_keys(value: Any) -> bool:
+    if isinstance(value, Mapping):
+        if not all(type(key) is str for key in value):
+            return False
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        return True
+    return all(
+        _string_keys(item)
+        for item in value
+        if not isinstance(item, _SCALARS) and item is not None
+    )
+
+
+def _typed_keys(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {
+            f"{type(key).__name__}:{key!r}": _typed_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_typed_keys(item) for item in value]
+    return value
+
+
+def _encode(parameters: Mapping[str, Any]) -> str:
+    """Encode parameters so that only equal parameters encode the same.
+
+    JSON turns the keys ``200``, ``True`` and ``None`` into the strings
+    ``"200"``, ``"true"`` and ``"null"``, so parameters with keys other than
+    strings have every key encoded with its type, behind a prefix no JSON
+    object starts with.
+    """
+    if _string_keys(parameters):
+        return _ENCODER.encode(parameters)
+    return "typed:" + _ENCODER.encode(_typed_keys(parameters))
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+
+class FrozenMapping(Mapping[str, Any]):
+    """Immutable mapping layered over the mapping it was merged onto.
+
+    A layer stores only the keys it sets and looks the others up in its
+    parent, so a merge costs the size of the overlay, never of the base, and
+    every test sharing a base shares the very same objects. Nested mappings
+    are frozen mappings too and lists are frozen into tuples.
+
+    Attributes:
+        digest: Hash identifying the content of the mapping and its layers
+    """
+
+    __slots__ = ("_own", "_parent", "_length", "digest")
+
+    def __init__(
+        self,
+        own: Dict[str, Any],
+        digest: str,
+        parent: Optional["FrozenMapping"] = None,
+    ) -> None:
+        self._own = own
+        self._parent = parent
+        self.digest = digest
+        self._length = len(own)
+        if parent is not None:
+            self._length += len(parent) - sum(1 for key in own if key in parent)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._own:
+            return self._own[key]
+        if self._parent is None:
+            raise KeyError(key)
+        return self._parent[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._own or (self._parent is not None and key in self._parent)
+
+    def __iter__(self) -> Iterator[str]:
+        # Same order as {**parent, **own}: overridden keys keep their place
+        if self._parent is not None:
+            yield from self._parent
+        for key in self._own:
+            if self._parent is None or key not in self._parent:
+                yield key
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __repr__(self) -> str:
+        return f"FrozenMapping({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy the mapping into plain, mutable dictionaries and lists."""
+        return thaw(self)
+
+
+def thaw(value: Any) -> Any:
+    """Turn frozen mappings and tuples back into dictionaries and lists."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+EMPTY = FrozenMapping({}, _digest())
+
+
+class ParameterResolver:
+    """Resolve parameters layer by layer with deep-merge semantics.
+
+    Layers apply from the most general to the most specific, e.g. global,
+    include file, matrix, then test parameters. A key set by a later layer
+    replaces the earlier value, except that two mappings are merged key by
+    key, at any depth; lists are replaced as a whole.
+
+    Frozen layers are interned and merges cached by content hash, so equal
+    parameter blocks, and tests resolving to equal parameters, share one
+    immutable mapping.
+    """
+
+    def __init__(self) -> None:
+        self._frozen: Dict[str, FrozenMapping] = {EMPTY.digest: EMPTY}
+        self._merged: Dict[str, FrozenMapping] = {}
+
+    def freeze(self, parameters: Optional[Mapping[str, Any]]) -> FrozenMapping:
+        """Freeze a layer of parameters, reusing an equal layer if any."""
+        if isinstance(parameters, FrozenMapping):
+            return parameters
+        if not parameters:
+            return EMPTY
+        digest = _digest(_encode(parameters))
+        if digest not in self._frozen:
+            own = {key: self._freeze_value(value) for key, value in parameters.items()}
+            self._frozen[digest] = FrozenMapping(own, digest)
+        return self._frozen[digest]
+
+    def merge(
+        self, base: Mapping[str, Any], overlay: Mapping[str, Any]
+    ) -> FrozenMapping:
+        """Deep-merge a layer onto a base, sharing everything it leaves as is."""
+        base, overlay = self.freeze(base), self.freeze(overlay)
+        if overlay is EMPTY:
+            return base
+        if base is EMPTY:
+            return overlay
+        digest = _digest(base.digest, overlay.digest)
+        if digest not in self._merged:
+            own: Dict[str, Any] = {}
+            for key, value in overlay.items():
+                previous = base.get(key)
+                if isinstance(previous, FrozenMapping) and isinstance(
+                    value, FrozenMapping
+                ):
+                    value = self.merge(previous, value)
+                own[key] = value
+            self._merged[digest] = FrozenMapping(own, digest, parent=base)
+        return self._merged[digest]
+
+    def resolve(self, *layers: Optional[Mapping[str, Any]]) -> FrozenMapping:
+        """Merge layers in order, from the most general to the most specific."""
+        resolved = EMPTY
+        for layer in layers:
+            resolved = self.merge(resolved, layer or EMPTY)
+        return resolved
+
+    def _freeze_value(self, value: Any) -> Any:
+        if isinstance(value, Mapping):
+            return self.freeze(value)
+        if isinstance(value, list):
+            return tuple(self._freeze_value(item) for item in value)
+        return value
@@ -4,8 +4,19 @@ from types import ModuleType
 from typing import List
 
 from athena.plugins.builtin.data_parsers import json_data_parser, yaml_data_parser
-from athena.plugins.builtin.reporters import json_reporter, rich_console_reporter
-from athena.plugins.builtin.test_runners import system_test_runner
+from athena.plugins.builtin.reporters import (
+    baseline_diff_reporter,
+    json_reporter,
+    openmetrics_reporter,
+    rich_console_reporter,
+)
+from athena.plugins.builtin.test_runners import (
+    command_test_runner,
+    files_test_runner,
+    http_test_runner,
+    noop_test_runner,
+    system_test_runner,
+)
 
 BUILTIN_PARSER_PLUGINS: List[ModuleType] = [
     yaml_data_parser,
@@ -14,9 +25,15 @@ BUILTIN_PARSER_PLUGINS: List[ModuleType] = [
 
 BUILTIN_TEST_RUNNER_PLUGINS: List[ModuleType] = [
     system_test_runner,
+    noop_test_runner,
+    command_test_runner,
+    http_test_runner,
+    files_test_runner,
 ]
 
 BUILTIN_REPORTER_PLUGINS: List[ModuleType] = [
     json_reporter,
     rich_console_reporter,
+    baseline_diff_reporter,
+    openmetrics_reporter,
 ]
@@ -29,5 +29,8 @@ def activate_data_parser_plugin() -> Plugin[
 
 
 class YAMLDataParser:
+    # The libyaml bindings are several times faster than the pure Python loader
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     def __call__(self, parameters: YAMLDataParserParameters) -> DataParserPluginResult:
-        return yaml.safe_load(parameters.data)
+        return yaml.load(parameters.data, Loader=self.loader)
@@ -0,0 +1,5 @@
+import threading
+
+# Reporters run concurrently; those writing to the terminal hold this lock for
+# their whole output so reports are never interleaved.
+terminal_lock = threading.RLock()
@@ -0,0 +1,119 @@
+"""Baseline comparison reporter plugin for Athena test reports."""
+
+from pathlib import Path
+from typing import Any
+
+from pydantic import Field
+from rich import box
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+from rich.text import Text
+
+from athena.models import BaseModel
+from athena.models.plugin import Plugin
+from athena.models.plugin_metadata import PluginMetadata
+from athena.models.report_diff import ReportDiff
+from athena.models.test_change import ChangeType
+from athena.models.test_suite_summary import TestSuiteSummary
+from athena.plugins import hookimpl
+from athena.plugins.builtin.reporters import terminal_lock
+from athena.services.report_diff_service import ReportDiffService
+from athena.types import ReporterPluginResult
+
+CHANGE_STYLES = {
+    ChangeType.NEW_FAILURE: "red bold",
+    ChangeType.FIXED: "green bold",
+    ChangeType.STATUS_CHANGED: "yellow bold",
+    ChangeType.NEW: "cyan",
+    ChangeType.REMOVED: "magenta",
+    ChangeType.DURATION: "yellow",
+    ChangeType.ACTUAL: "yellow",
+}
+
+
+class BaselineDiffReporterParameters(BaseModel):
+    summary: TestSuiteSummary
+    baseline: Path
+    duration_threshold: float = Field(default=0.5, ge=0)
+    min_duration_delta: float = Field(default=0.1, ge=0)
+    actual_threshold: float = Field(default=0.2, ge=0)
+
+
+@hookimpl
+def activate_reporter_plugin() -> Plugin[
+    ReporterPluginResult,
+    BaselineDiffReporterParameters,
+]:
+    """Register the baseline comparison reporter plugin."""
+    return Plugin(
+        metadata=PluginMetadata(
+            name="baseline_diff",
+            description="Compare test results against a baseline JSON report",
+        ),
+        executor=BaselineDiffReporter(),
+        parameters_model=BaselineDiffReporterParameters,
+        identifiers={"baseline_diff"},
+    )
+
+
+class BaselineDiffReporter:
+    def __init__(self) -> None:
+        self.console = Console()
+
+    def __call__(
+        self,
+        parameters: BaselineDiffReporterParameters,
+    ) -> ReporterPluginResult:
+        """Display the differences between a baseline report and this run.
+
+        Args:
+            parameters: Summary, baseline report path and change thresholds
+        """
+        diff_service = ReportDiffService(
+            duration_threshold=parameters.duration_threshold,
+            min_duration_delta=parameters.min_duration_delta,
+            actual_threshold=parameters.actual_threshold,
+        )
+        diff = diff_service.diff_summary(parameters.baseline, parameters.summary)
+        with terminal_lock:
+            self.render(diff)
+
+    def render(self, diff: ReportDiff) -> None:
+        """Print a report diff, one row per change."""
+        title = f"Changes since {diff.baseline_timestamp or 'baseline'}"
+        if not diff.changes:
+            self.console.print(
+                f"{title}: no changes across {diff.compared} compared tests"
+            )
+            return
+
+        table = Table(title=title, show_header=True, box=box.ROUNDED)
+        table.add_column("Change", style="bold")
+        table.add_column("Test Name", no_wrap=True)
+        table.add_column("Detail")
+        table.add_column("Baseline")
+        table.add_column("Current")
+
+        for change in diff.changes:
+            table.add_row(
+                Text(change.type.value.upper(), style=CHANGE_STYLES[change.type]),
+                escape(change.name),
+                escape(change.detail or ""),
+                self._format(change.baseline),
+                self._format(change.current),
+            )
+
+        self.console.print(table)
+        self.console.print(
+            f"{len(diff.changes)} changes, {len(diff.regressions)} new failures "
+            f"across {diff.compared} compared tests"
+        )
+
+    @staticmethod
+    def _format(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            return f"{value:.3f}"
+        return escape(str(value))
@@ -8,6 +8,7 @@ from athena.models.plugin import Plugin
 from athena.models.plugin_metadata import PluginMetadata
 from athena.models.test_suite_summary import TestSuiteSummary
 from athena.plugins import hookimpl
+from athena.plugins.builtin.reporters import terminal_lock
 from athena.types import ReporterPluginResult
 
 
@@ -47,4 +48,5 @@ class JSONReporter:
         with open(filename, "w") as f:
             json.dump(parameters.summary.model_dump(), f, indent=2)
 
-        print(f"Report exported to: {filename}")
+        with terminal_lock:
+            print(f"Report exported to: {filename}")
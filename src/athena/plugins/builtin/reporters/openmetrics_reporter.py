@@ -0,0 +1,318 @@
+"""OpenMetrics exposition plugin for Athena test reports."""
+
+import os
+import tempfile
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import Field
+
+from athena.models import BaseModel
+from athena.models.plugin import Plugin
+from athena.models.plugin_metadata import PluginMetadata
+from athena.models.test_result import ResultType
+from athena.models.test_suite_summary import TestSuiteSummary
+from athena.plugins import hookimpl
+from athena.plugins.builtin.reporters import terminal_lock
+from athena.types import ReporterPluginResult
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# The umask can only be read by setting it: done once, as plugins are loaded
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class OpenMetricsReporterParameters(BaseModel):
+    summary: TestSuiteSummary
+    path: Optional[Path] = Path("athena.prom")
+    prefix: str = Field(default="athena", pattern=r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+    http_host: str = "127.0.0.1"
+    http_port: Optional[int] = Field(default=None, ge=0, le=65535)
+
+
+@hookimpl
+def activate_reporter_plugin() -> Plugin[
+    ReporterPluginResult,
+    OpenMetricsReporterParameters,
+]:
+    """Register the OpenMetrics reporter plugin."""
+    return Plugin(
+        metadata=PluginMetadata(
+            name="openmetrics",
+            description="Expose test results as OpenMetrics gauges",
+        ),
+        executor=OpenMetricsReporter(),
+        parameters_model=OpenMetricsReporterParameters,
+        identifiers={"openmetrics", "prometheus"},
+    )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Latest exposition of the suite metrics, shared with the HTTP endpoint.
+
+    The exposition is rendered once per run; scrapes only read the rendered
+    text, so they never trigger a test run.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._exposition = "# EOF\n"
+
+    def update(self, exposition: str) -> None:
+        with self._lock:
+            self._exposition = exposition
+
+    def exposition(self) -> str:
+        with self._lock:
+            return self._exposition
+
+
+class _MetricFamily:
+    def __init__(self, name: str, help_text: str, unit: str = "") -> None:
+        self.name = name
+        self.help_text = help_text
+        self.unit = unit
+        self.samples: List[Tuple[Dict[str, str], float]] = []
+
+    def add(self, value: float, **labels: str) -> None:
+        self.samples.append((labels, value))
+
+    def render(self) -> List[str]:
+        lines = [f"# TYPE {self.name} gauge"]
+        if self.unit:
+            lines.append(f"# UNIT {self.name} {self.unit}")
+        lines.append(f"# HELP {self.name} {self.help_text}")
+        for labels, value in self.samples:
+            label_text = ",".join(
+                f'{key}="{_escape(label)}"' for key, label in labels.items()
+            )
+            suffix = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{self.name}{suffix} {_format_value(value)}")
+        return lines
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        accept = self.headers.get("Accept", "")
+        content_type = (
+            OPENMETRICS_CONTENT_TYPE
+            if "application/openmetrics-text" in accept
+            else PROMETHEUS_CONTENT_TYPE
+        )
+        body = self.registry.exposition().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Scrapes are frequent; keep them out of the console."""
+
+
+class OpenMetricsReporter:
+    def __init__(self) -> None:
+        self.registry = MetricsRegistry()
+        self._servers: Dict[Tuple[str, int], ThreadingHTTPServer] = {}
+
+    def __call__(
+        self,
+        parameters: OpenMetricsReporterParameters,
+    ) -> ReporterPluginResult:
+        """Write test results as an OpenMetrics textfile and serve them.
+
+        The textfile is replaced atomically so a collector such as the
+        node-exporter textfile collector never reads a partial file. With
+        ``http_port`` set, the metrics are also served over HTTP from a
+        background thread for as long as the process lives.
+
+        Args:
+            parameters: Summary, textfile path, metric prefix and endpoint
+        """
+        exposition = self.render(parameters.summary, parameters.prefix)
+        self.registry.update(exposition)
+
+        if parameters.path is not None:
+            self._write_atomically(parameters.path, exposition)
+        if parameters.http_port is not None:
+            self._serve(parameters.http_host, parameters.http_port)
+
+    def render(self, summary: TestSuiteSummary, prefix: str) -> str:
+        """Render a summary in the OpenMetrics text format."""
+        suite_duration = _MetricFamily(
+            f"{prefix}_suite_duration_seconds",
+            "Wall time of the last test suite run.",
+            "seconds",
+        )
+        suite_timestamp = _MetricFamily(
+            f"{prefix}_suite_last_run_timestamp_seconds",
+            "Time the last test suite run finished.",
+            "seconds",
+        )
+        suite_tests = _MetricFamily(
+            f"{prefix}_suite_tests",
+            "Number of tests of the last run by status.",
+        )
+        test_status = _MetricFamily(
+            f"{prefix}_test_status",
+            "Status of each test, 1 for the current status and 0 otherwise.",
+        )
+        test_duration = _MetricFamily(
+            f"{prefix}_test_duration_seconds",
+            "Executor wall time of each test.",
+            "seconds",
+        )
+        test_cpu = _MetricFamily(
+            f"{prefix}_test_cpu_seconds",
+            "CPU time used by the runner for each test.",
+            "seconds",
+        )
+        test_rss = _MetricFamily(
+            f"{prefix}_test_peak_rss_delta_bytes",
+            "Growth of the process peak RSS while running each test.",
+            "bytes",
+        )
+        test_traced = _MetricFamily(
+            f"{prefix}_test_traced_peak_bytes",
+            "Peak memory traced by tracemalloc while running each test.",
+            "bytes",
+        )
+        test_over_budget = _MetricFamily(
+            f"{prefix}_test_over_budget",
+            "1 if the runner exceeded its resource budget for the test.",
+        )
+        test_actual = _MetricFamily(
+            f"{prefix}_test_actual",
+            "Numeric value measured by each test detail.",
+        )
+        test_expected = _MetricFamily(
+            f"{prefix}_test_expected",
+            "Numeric value expected by each test detail.",
+        )
+
+        if summary.duration is not None:
+            suite_duration.add(summary.duration)
+        suite_timestamp.add(datetime.fromisoformat(summary.timestamp).timestamp())
+
+        counts = {result_type: 0 for result_type in ResultType}
+        occurrences: Dict[Tuple[str, ...], int] = {}
+        for result in summary.results:
+            counts[result.result.type] += 1
+            labels = {
+                "test": result.config.name,
+                "runner": result.config.plugin_identifier,
+            }
+            if result.config.source is not None:
+                labels["source"] = result.config.source
+            # Tests sharing a name would otherwise expose duplicate series,
+            # making collectors reject the whole exposition
+            identity = tuple(labels.values())
+            occurrence = occurrences.get(identity, 0)
+            occurrences[identity] = occurrence + 1
+            if occurrence:
+                labels["occurrence"] = str(occurrence)
+
+            for result_type in ResultType:
+                test_status.add(
+                    float(result.result.type == result_type),
+                    **labels,
+                    status=result_type.value,
+                )
+            if result.duration is not None:
+                test_duration.add(result.duration, **labels)
+            if (resources := result.resources) is not None:
+                test_cpu.add(resources.cpu_user, **labels, mode="user")
+                test_cpu.add(resources.cpu_system, **labels, mode="system")
+                test_rss.add(resources.peak_rss_delta, **labels)
+                if resources.traced_peak is not None:
+                    test_traced.add(resources.traced_peak, **labels)
+                test_over_budget.add(float(bool(resources.exceeded)), **labels)
+            for key, detail in (result.result.details or {}).items():
+                if (actual := self._numeric(detail.actual)) is not None:
+                    test_actual.add(actual, **labels, detail=key)
+                if (expected := self._numeric(detail.expected)) is not None:
+                    test_expected.add(expected, **labels, detail=key)
+
+        for result_type, count in counts.items():
+            suite_tests.add(count, status=result_type.value)
+
+        lines: List[str] = []
+        for family in (
+            suite_duration,
+            suite_timestamp,
+            suite_tests,
+            test_status,
+            test_duration,
+            test_cpu,
+            test_rss,
+            test_traced,
+            test_over_budget,
+            test_actual,
+            test_expected,
+        ):
+            lines.extend(family.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _numeric(value: object) -> Optional[float]:
+        if isinstance(value, bool):
+            return float(value)
+        if isinstance(value, (int, float)):
+            return float(value)
+        return None
+
+    @staticmethod
+    def _write_atomically(path: Path, exposition: str) -> None:
+        directory = path.parent
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(exposition)
+            # mkstemp creates files readable by their owner only; give the
+            # textfile the mode open() would, as collectors often run as
+            # another user
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _serve(self, host: str, port: int) -> None:
+        """Start the metrics endpoint once per address for this process."""
+        if (host, port) in self._servers:
+            return
+        handler = type(
+            "MetricsHandler", (_MetricsHandler,), {"registry": self.registry}
+        )
+        server = ThreadingHTTPServer((host, port), handler)
+        server.daemon_threads = True
+        self._servers[(host, port)] = server
+        threading.Thread(
+            target=server.serve_forever,
+            name=f"athena-metrics-{port}",
+            daemon=True,
+        ).start()
+        with terminal_lock:
+            print(f"Metrics served at: http://{host}:{server.server_port}/metrics")
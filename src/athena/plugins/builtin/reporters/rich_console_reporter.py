@@ -1,9 +1,12 @@
 """Rich Console reporter plugin for Athena test reports."""
 
 from enum import Enum
+from itertools import groupby
+from typing import List, Optional, Sequence, Tuple
 
 from rich import box
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -12,8 +15,10 @@ from athena.models import BaseModel
 from athena.models.plugin import Plugin
 from athena.models.plugin_metadata import PluginMetadata
 from athena.models.test_result import ResultType
+from athena.models.test_result_summary import TestResultSummary
 from athena.models.test_suite_summary import TestSuiteSummary
 from athena.plugins import hookimpl
+from athena.plugins.builtin.reporters import terminal_lock
 from athena.types import ReporterPluginResult
 
 
@@ -29,6 +34,7 @@ class RichConsoleReporterParameters(BaseModel):
     summary: TestSuiteSummary
     show_details: bool = False
     show_summary: bool = True
+    show_resources: bool = True
 
 
 @hookimpl
@@ -62,6 +68,10 @@ class RichConsoleReporter:
             summary: Test execution summary containing results
             **kwargs: Additional parameters passed from the reporter config
         """
+        with terminal_lock:
+            self._report(parameters)
+
+    def _report(self, parameters: RichConsoleReporterParameters) -> None:
         try:
             output_format = OutputFormat(parameters.format)
         except ValueError:
@@ -71,16 +81,47 @@ class RichConsoleReporter:
             output_format = OutputFormat.TABLE
 
         if output_format == OutputFormat.TABLE:
-            self._table_format(parameters.summary)
+            self._table_format(parameters.summary, parameters.show_resources)
         else:
-            self._list_format(parameters.summary, parameters.show_details)
+            self._list_format(
+                parameters.summary,
+                parameters.show_details,
+                parameters.show_resources,
+            )
 
         if parameters.show_summary:
             self._print_summary(parameters.summary)
 
-    def _table_format(self, summary: TestSuiteSummary) -> None:
-        """Print results in a clean table format."""
+    def _sections(
+        self, summary: TestSuiteSummary
+    ) -> List[Tuple[Optional[str], List[TestResultSummary]]]:
+        """Split results into one section per source configuration file.
+
+        A run loaded from a single file has a single untitled section.
+        """
+        sections = [
+            (source, list(results))
+            for source, results in groupby(
+                summary.results, key=lambda result: result.config.source
+            )
+        ]
+        if len({source for source, _ in sections}) <= 1:
+            return [(None, list(summary.results))]
+        return sections
+
+    def _table_format(self, summary: TestSuiteSummary, show_resources: bool) -> None:
+        """Print results in a clean table format, one table per section."""
+        for source, results in self._sections(summary):
+            self._print_table(results, source, show_resources)
+
+    def _print_table(
+        self,
+        results: Sequence[TestResultSummary],
+        title: Optional[str],
+        show_resources: bool,
+    ) -> None:
         table = Table(
+            title=escape(title) if title is not None else None,
             show_header=True,
             show_lines=True,
             box=box.ROUNDED,
@@ -89,22 +130,44 @@ class RichConsoleReporter:
         table.add_column("Test Name", no_wrap=True)
         table.add_column("Message", no_wrap=True)
         table.add_column("Runner")
+        if show_resources:
+            table.add_column("Resources")
 
-        for result in summary.results:
+        for result in results:
             status_style = self._get_status_style(result.result.type)
             status = Text(result.result.type.value.upper(), style=status_style)
-            message = result.result.message or ""
-
-            table.add_row(
-                status, result.config.name, message, result.config.plugin_identifier
-            )
+            # Names and messages are plain text: matrix names hold brackets
+            message = escape(result.result.message or "")
+
+            row = [
+                status,
+                escape(result.config.name),
+                message,
+                result.config.plugin_identifier,
+            ]
+            if show_resources:
+                row.append(self._format_resources(result))
+            table.add_row(*row)
 
         self.console.print(table)
         self.console.print()
 
-    def _list_format(self, summary: TestSuiteSummary, show_details: bool) -> None:
-        """Print results in a clean list format."""
-        for idx, result in enumerate(summary.results):
+    def _list_format(
+        self, summary: TestSuiteSummary, show_details: bool, show_resources: bool
+    ) -> None:
+        """Print results in a clean list format, one rule per section."""
+        for source, results in self._sections(summary):
+            if source is not None:
+                self.console.rule(escape(source))
+            self._print_list(results, show_details, show_resources)
+
+    def _print_list(
+        self,
+        results: Sequence[TestResultSummary],
+        show_details: bool,
+        show_resources: bool,
+    ) -> None:
+        for idx, result in enumerate(results):
             status_style = self._get_status_style(result.result.type)
             status_text = result.result.type.value.upper()
 
@@ -116,7 +179,7 @@ class RichConsoleReporter:
 
             # Show message if available
             if result.result.message:
-                self.console.print(f"  Message: {result.result.message}")
+                self.console.print(f"  Message: {escape(result.result.message)}")
 
             # Show test details if enabled and available
             if show_details and result.result.details:
@@ -132,16 +195,24 @@ class RichConsoleReporter:
                 # Show first failing detail (if any)
                 for key, detail in result.result.details.items():
                     if not detail.success:
-                        self.console.print(f"    First failure: {key}")
-                        self.console.print(f"      Expected: {detail.expected}")
-                        self.console.print(f"      Actual: {detail.actual}")
+                        self.console.print(f"    First failure: {escape(key)}")
+                        expected = escape(str(detail.expected))
+                        actual = escape(str(detail.actual))
+                        self.console.print(f"      Expected: {expected}")
+                        self.console.print(f"      Actual: {actual}")
                         break
 
             # Show runner
             self.console.print(f"  Runner: {result.config.plugin_identifier}")
 
+            # Show resources consumed by the runner, if measured
+            if show_resources and (result.duration or result.resources):
+                self.console.print(
+                    Text("  Resources: ").append_text(self._format_resources(result))
+                )
+
             # Add separator between tests (except after the last one)
-            if idx < len(summary.results) - 1:
+            if idx < len(results) - 1:
                 self.console.print("─" * 50)
 
     def _print_summary(self, summary: TestSuiteSummary) -> None:
@@ -184,6 +255,24 @@ class RichConsoleReporter:
             )
         )
 
+    def _format_resources(self, result: TestResultSummary) -> Text:
+        """Format the wall time and resources used by a test."""
+        parts = []
+        if result.duration is not None:
+            parts.append(f"{result.duration:.2f}s wall")
+        resources = result.resources
+        if resources is not None:
+            parts.append(f"{resources.cpu_time:.2f}s cpu")
+            parts.append(f"+{resources.peak_rss_delta / 1024 / 1024:.1f}MB rss")
+            if resources.traced_peak is not None:
+                parts.append(f"{resources.traced_peak / 1024 / 1024:.1f}MB traced")
+        text = Text(", ".join(parts))
+        if resources is not None and resources.exceeded:
+            text.append(
+                f" (over budget: {', '.join(resources.exceeded)})", style="red bold"
+            )
+        return text
+
     def _get_status_style(self, status: ResultType) -> str:
         """Get the appropriate style for a status."""
         if status == ResultType.PASSED:
@@ -0,0 +1,302 @@
+"""Command test runner plugin running processes with asyncio."""
+
+import asyncio
+import os
+import re
+import signal
+import threading
+import time
+from pathlib import Path
+from typing import Coroutine, Dict, List, Optional, TypeVar, Union
+
+from pydantic import Field, ValidationInfo, field_validator
+
+from athena.models import BaseModel
+from athena.models.plugin import Plugin
+from athena.models.plugin_metadata import PluginMetadata
+from athena.models.test_details import TestDetails
+from athena.models.test_result import TestResult
+from athena.models.test_suite_config import TestSuiteConfig
+from athena.plugins import hookimpl
+from athena.types import TestRunnerPluginResult
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore[assignment]
+
+DEFAULT_OUTPUT_LIMIT = 64 * 1024
+DEFAULT_MAX_PROCESSES = 256
+_READ_SIZE = 64 * 1024
+# stdin is /dev/null; the stdout and stderr pipes take two file descriptors
+# each while the process starts, plus one for the child watcher's pidfd
+_FDS_PER_PROCESS = 5
+_MESSAGE_LENGTH = 200
+
+_T = TypeVar("_T")
+
+
+class CommandTestRunnerParameters(BaseModel):
+    # A string runs through the shell, a list is executed directly
+    command: Union[str, List[str]] = Field(..., min_length=1)
+    cwd: Optional[Path] = None
+    env: Dict[str, str] = Field(default_factory=dict)
+    timeout: float = Field(default=60.0, gt=0)
+    exit_codes: List[int] = Field(default_factory=lambda: [0], min_length=1)
+    stdout_pattern: Optional[re.Pattern[str]] = None
+    stderr_pattern: Optional[re.Pattern[str]] = None
+    max_duration: Optional[float] = Field(default=None, gt=0)
+    # Bytes of each output stream kept, counted from the end
+    output_limit: int = Field(default=DEFAULT_OUTPUT_LIMIT, gt=0)
+
+    @field_validator("cwd")
+    @classmethod
+    def _resolve_cwd(cls, cwd: Optional[Path], info: ValidationInfo) -> Optional[Path]:
+        # Relative to the directory of the configuration file declaring the test
+        source = (info.context or {}).get("source")
+        if cwd is None or cwd.is_absolute() or source is None:
+            return cwd
+        return (Path(source).parent / cwd).absolute()
+
+
+@hookimpl
+def activate_test_plugin() -> Plugin[
+    TestRunnerPluginResult,
+    CommandTestRunnerParameters,
+]:
+    runner = CommandTestRunner()
+    return Plugin(
+        metadata=PluginMetadata(
+            name="command",
+            description="Run a command and check its exit code, output and duration",
+        ),
+        executor=runner,
+        parameters_model=CommandTestRunnerParameters,
+        identifiers={"command"},
+        teardown_suite=runner.teardown_suite,
+    )
+
+
+def _default_max_processes() -> int:
+    """Cap concurrent processes so their pipes fit the open files limit."""
+    if resource is None:
+        return DEFAULT_MAX_PROCESSES
+    soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft_limit == resource.RLIM_INFINITY:
+        return DEFAULT_MAX_PROCESSES
+    return max(1, min(DEFAULT_MAX_PROCESSES, soft_limit // _FDS_PER_PROCESS))
+
+
+class _RingBuffer:
+    """Keep the last ``limit`` bytes written, however much is written.
+
+    Deleting from the front of a ``bytearray`` only moves its start offset,
+    so trimming costs no copy and memory stays bounded by ``limit``.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.total = 0
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> None:
+        self.total += len(data)
+        if len(data) >= self.limit:
+            self._buffer[:] = data[-self.limit :]
+            return
+        self._buffer += data
+        if (overflow := len(self._buffer) - self.limit) > 0:
+            del self._buffer[:overflow]
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > self.limit
+
+    def text(self) -> str:
+        return self._buffer.decode(errors="replace")
+
+
+class _CommandOutcome:
+    def __init__(self, output_limit: int) -> None:
+        self.stdout = _RingBuffer(output_limit)
+        self.stderr = _RingBuffer(output_limit)
+        self.returncode: Optional[int] = None
+        self.duration = 0.0
+        self.timed_out = False
+
+
+class _EventLoopThread:
+    """Event loop running on a daemon thread, shared by every command.
+
+    Test executors are called synchronously, possibly from many threads at
+    once; they all hand their coroutine to this single loop, so hundreds of
+    processes are supervised without a thread each.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def run(self, coroutine: Coroutine[None, None, _T]) -> _T:
+        """Run a coroutine on the loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop()).result()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="athena-command-loop",
+                    daemon=True,
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    def stop(self) -> None:
+        """Stop the loop and its thread; the next coroutine starts new ones."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class CommandTestRunner:
+    """Run commands as asyncio subprocesses and check their outcome.
+
+    At most ``max_processes`` commands run at the same time across the
+    process, whatever the suite concurrency; the others wait for a slot.
+    Only the last ``output_limit`` bytes of each output stream are kept and
+    matched against the configured patterns.
+    """
+
+    def __init__(self, max_processes: Optional[int] = None) -> None:
+        self.max_processes = max_processes or _default_max_processes()
+        self._loop_thread = _EventLoopThread()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def __call__(
+        self, parameters: CommandTestRunnerParameters
+    ) -> TestRunnerPluginResult:
+        try:
+            outcome = self._loop_thread.run(self._execute(parameters))
+        except OSError as e:
+            return TestResult.failed(message=f"Could not start command: {e}")
+
+        details: Dict[str, TestDetails] = {
+            "exit_code": TestDetails(
+                expected=parameters.exit_codes,
+                actual=outcome.returncode,
+                success=(
+                    not outcome.timed_out
+                    and outcome.returncode in parameters.exit_codes
+                ),
+            )
+        }
+        if parameters.max_duration is not None:
+            details["duration"] = TestDetails(
+                expected=parameters.max_duration,
+                actual=round(outcome.duration, 3),
+                success=outcome.duration <= parameters.max_duration,
+            )
+        for stream, pattern, buffer in (
+            ("stdout", parameters.stdout_pattern, outcome.stdout),
+            ("stderr", parameters.stderr_pattern, outcome.stderr),
+        ):
+            if pattern is not None:
+                match = pattern.search(buffer.text())
+                details[stream] = TestDetails(
+                    expected=pattern.pattern,
+                    actual=match.group(0) if match else None,
+                    success=match is not None,
+                )
+
+        if outcome.timed_out:
+            return TestResult.failed(
+                message=f"Timed out after {parameters.timeout:g}s",
+                details=details,
+            )
+        if all(detail.success for detail in details.values()):
+            return TestResult.passed(details=details)
+        return TestResult.failed(message=self._message(outcome), details=details)
+
+    def teardown_suite(self, config: TestSuiteConfig) -> None:
+        """Stop the event loop once the commands of a run have completed."""
+        self._loop_thread.stop()
+        # The semaphore belongs to the stopped loop
+        self._semaphore = None
+
+    async def _execute(
+        self, parameters: CommandTestRunnerParameters
+    ) -> _CommandOutcome:
+        if self._semaphore is None:
+            # Created on the loop thread, the only thread touching it
+            self._semaphore = asyncio.Semaphore(self.max_processes)
+
+        async with self._semaphore:
+            outcome = _CommandOutcome(parameters.output_limit)
+            started = time.perf_counter()
+            process = await self._spawn(parameters)
+            assert process.stdout is not None and process.stderr is not None
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        self._drain(process.stdout, outcome.stdout),
+                        self._drain(process.stderr, outcome.stderr),
+                        process.wait(),
+                    ),
+                    parameters.timeout,
+                )
+            except asyncio.TimeoutError:
+                outcome.timed_out = True
+                self._kill(process)
+                await process.wait()
+            outcome.duration = time.perf_counter() - started
+            outcome.returncode = process.returncode
+            return outcome
+
+    @staticmethod
+    async def _spawn(
+        parameters: CommandTestRunnerParameters,
+    ) -> asyncio.subprocess.Process:
+        options = {
+            "stdin": asyncio.subprocess.DEVNULL,
+            "stdout": asyncio.subprocess.PIPE,
+            "stderr": asyncio.subprocess.PIPE,
+            "cwd": parameters.cwd,
+            "env": {**os.environ, **parameters.env} if parameters.env else None,
+            # Own process group, so a timeout also kills the command's children
+            "start_new_session": os.name == "posix",
+        }
+        if isinstance(parameters.command, str):
+            return await asyncio.create_subprocess_shell(parameters.command, **options)
+        return await asyncio.create_subprocess_exec(*parameters.command, **options)
+
+    @staticmethod
+    async def _drain(stream: asyncio.StreamReader, buffer: _RingBuffer) -> None:
+        while chunk := await stream.read(_READ_SIZE):
+            buffer.write(chunk)
+
+    @staticmethod
+    def _kill(process: asyncio.subprocess.Process) -> None:
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+
+    @staticmethod
+    def _message(outcome: _CommandOutcome) -> str:
+        message = f"Exited with code {outcome.returncode}"
+        lines = [line for line in outcome.stderr.text().splitlines() if line.strip()]
+        if lines:
+            message = f"{message}: {lines[-1].strip()[:_MESSAGE_LENGTH]}"
+        return message
@@ -0,0 +1,305 @@
+"""File integrity test runner plugin with a persistent hash cache."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from pydantic import Field, field_validator
+
+from athena.models import BaseModel
+from athena.models.plugin import Plugin
+from athena.models.plugin_metadata import PluginMetadata
+from athena.models.test_details import TestDetails
+from athena.models.test_result import TestResult
+from athena.models.test_suite_config import TestSuiteConfig
+from athena.plugins import hookimpl
+from athena.types import TestRunnerPluginResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(".athena_cache/file_hashes.json")
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_DETAILS = 50
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+
+class FilesTestRunnerParameters(BaseModel):
+    root: Path = Path(".")
+    # Expected digests by path relative to root; null only checks existence
+    checksums: Dict[str, Optional[str]] = Field(default_factory=dict)
+    # Checksum file in the sha256sum format, paths relative to root
+    manifest: Optional[Path] = None
+    algorithm: str = "sha256"
+    cache_path: Optional[Path] = DEFAULT_CACHE_PATH
+    workers: int = Field(default=DEFAULT_WORKERS, ge=1)
+    chunk_size: int = Field(default=DEFAULT_CHUNK_SIZE, gt=0)
+    # Mismatched or missing files listed in the details, at most
+    max_details: int = Field(default=DEFAULT_MAX_DETAILS, ge=0)
+
+    @field_validator("algorithm")
+    @classmethod
+    def _check_algorithm(cls, algorithm: str) -> str:
+        if algorithm not in hashlib.algorithms_available:
+            raise ValueError(f"unsupported hash algorithm '{algorithm}'")
+        # shake_* digests have no fixed length, hexdigest() would need one
+        if hashlib.new(algorithm).digest_size == 0:
+            raise ValueError(f"hash algorithm '{algorithm}' has no fixed length")
+        return algorithm
+
+
+@hookimpl
+def activate_test_plugin() -> Plugin[
+    TestRunnerPluginResult,
+    FilesTestRunnerParameters,
+]:
+    runner = FilesTestRunner()
+    return Plugin(
+        metadata=PluginMetadata(
+            name="files",
+            description="Check that files exist and match their checksums",
+        ),
+        executor=runner,
+        parameters_model=FilesTestRunnerParameters,
+        identifiers={"files"},
+        setup_suite=runner.setup_suite,
+        teardown_suite=runner.teardown_suite,
+    )
+
+
+class _CacheEntry(NamedTuple):
+    size: int
+    mtime_ns: int
+    inode: int
+    algorithm: str
+    digest: str
+
+
+class HashCache:
+    """Digests of files, valid as long as their size, mtime and inode match.
+
+    Entries are kept in memory and persisted as JSON, replaced atomically, so
+    files unchanged since any previous run are never read again.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, _CacheEntry]] = None
+        self._dirty = False
+
+    def get(self, path: str, stat: os.stat_result, algorithm: str) -> Optional[str]:
+        with self._lock:
+            entry = self._load().get(path)
+        if entry is None or entry != self._entry(stat, algorithm, entry.digest):
+            return None
+        return entry.digest
+
+    def put(self, path: str, stat: os.stat_result, algorithm: str, digest: str) -> None:
+        with self._lock:
+            self._load()[path] = self._entry(stat, algorithm, digest)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache if it changed since it was loaded or saved."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(self._entries, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._dirty = False
+
+    def _load(self) -> Dict[str, _CacheEntry]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with self.path.open() as f:
+                    self._entries = {
+                        path: _CacheEntry(*entry)
+                        for path, entry in json.load(f).items()
+                    }
+            except FileNotFoundError:
+                pass
+            except (ValueError, TypeError):
+                logger.warning("Ignoring unreadable hash cache '%s'", self.path)
+        return self._entries
+
+    @staticmethod
+    def _entry(stat: os.stat_result, algorithm: str, digest: str) -> _CacheEntry:
+        return _CacheEntry(
+            stat.st_size, stat.st_mtime_ns, stat.st_ino, algorithm, digest
+        )
+
+
+def hash_file(path: Path, algorithm: str, chunk_size: int) -> str:
+    """Hash a file read one chunk at a time into a reused buffer.
+
+    Hash functions release the GIL while digesting large buffers, so files
+    hashed on several threads are processed in parallel. Files are not
+    memory-mapped: a mapped file truncated by another process kills the
+    reader with SIGBUS, which Python cannot catch.
+
+    Raises:
+        OSError: If the file cannot be read or changes size while hashed
+    """
+    digest = hashlib.new(algorithm)
+    with path.open("rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        read = 0
+        with memoryview(bytearray(max(1, min(chunk_size, size)))) as buffer:
+            while count := f.readinto(buffer):
+                digest.update(buffer[:count])
+                read += count
+    if read != size:
+        raise OSError(f"'{path}' changed size while being hashed")
+    return digest.hexdigest()
+
+
+def read_manifest(path: Path) -> Dict[str, str]:
+    """Read a checksum file in the format written by sha256sum and friends."""
+    checksums: Dict[str, str] = {}
+    with path.open() as f:
+        for number, line in enumerate(f, start=1):
+            line = line.rstrip("\r\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            digest, separator, name = line.partition(" ")
+            if not separator or not name:
+                raise ValueError(f"Invalid line {number} in manifest '{path}'")
+            # A leading '*' marks files hashed in binary mode
+            checksums[name[1:] if name[0] in " *" else name] = digest.lower()
+    return checksums
+
+
+class FilesTestRunner:
+    """Check that files exist and, where a checksum is given, match it.
+
+    Files are hashed concurrently on a thread pool shared by the tests
+    asking for the same number of ``workers``, so tests running concurrently
+    do not multiply hashing threads. Digests are cached per absolute path and
+    reused while the file's size, mtime and inode are unchanged. Only missing
+    and mismatched files are reported in the details. Within a run, caches
+    are saved once after the last test, and the pools shut down.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._caches: Dict[Path, HashCache] = {}
+        self._pools: Dict[int, ThreadPoolExecutor] = {}
+        self._in_suite = False
+
+    def setup_suite(self, config: TestSuiteConfig) -> None:
+        """Defer saving hash caches until the end of the run."""
+        self._in_suite = True
+
+    def teardown_suite(self, config: TestSuiteConfig) -> None:
+        """Save the hash caches updated by the tests of the run."""
+        self._in_suite = False
+        with self._lock:
+            caches = list(self._caches.values())
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown()
+        for cache in caches:
+            cache.save()
+
+    def __call__(self, parameters: FilesTestRunnerParameters) -> TestRunnerPluginResult:
+        checksums = dict(parameters.checksums)
+        if parameters.manifest is not None:
+            try:
+                checksums.update(read_manifest(parameters.root / parameters.manifest))
+            except (OSError, ValueError) as e:
+                return TestResult.failed(message=f"Could not read manifest: {e}")
+        if not checksums:
+            return TestResult.skipped(message="No files configured.")
+
+        cache = self._cache(parameters.cache_path)
+        outcomes = list(
+            self._pool(parameters.workers).map(
+                lambda item: self._check(parameters, cache, *item),
+                checksums.items(),
+            )
+        )
+        if cache is not None and not self._in_suite:
+            cache.save()
+
+        problems = [outcome for outcome in outcomes if outcome is not None]
+        if not problems:
+            return TestResult.passed(message=f"{len(checksums)} files verified")
+
+        missing = sum(1 for _, actual in problems if actual is None)
+        message = (
+            f"{len(problems)} of {len(checksums)} files differ "
+            f"({len(problems) - missing} mismatched, {missing} missing)"
+        )
+        if len(problems) > parameters.max_details:
+            message += f"; first {parameters.max_details} listed"
+        return TestResult.failed(
+            message=message,
+            details={
+                name: TestDetails(
+                    expected=checksums[name], actual=actual, success=False
+                )
+                for name, actual in problems[: parameters.max_details]
+            },
+        )
+
+    def _check(
+        self,
+        parameters: FilesTestRunnerParameters,
+        cache: Optional[HashCache],
+        name: str,
+        expected: Optional[str],
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """Verify one file.
+
+        Returns:
+            None if the file is as expected, otherwise its name and its actual
+            digest, ``None`` when it is missing or unreadable
+        """
+        path = (parameters.root / name).absolute()
+        try:
+            stat = path.stat()
+            if expected is None:
+                return None
+            key = str(path)
+            digest = cache.get(key, stat, parameters.algorithm) if cache else None
+            if digest is None:
+                digest = hash_file(path, parameters.algorithm, parameters.chunk_size)
+                if cache is not None:
+                    cache.put(key, stat, parameters.algorithm, digest)
+        except OSError:
+            return name, None
+        return None if digest == expected.lower() else (name, digest)
+
+    def _pool(self, workers: int) -> ThreadPoolExecutor:
+        with self._lock:
+            if workers not in self._pools:
+                self._pools[workers] = ThreadPoolExecutor(
+                    workers, thread_name_prefix="athena-hash"
+                )
+            return self._pools[workers]
+
+    def _cache(self, path: Optional[Path]) -> Optional[HashCache]:
+        if path is None:
+            return None
+        path = path.absolute()
+        with self._lock:
+            if path not in self._caches:
+                self._caches[path] = HashCache(path)
+            return self._caches[path]
@@ -0,0 +1,297 @@
+"""HTTP health-check test runner plugin with keep-alive connection pooling."""
+
+import http.client
+import re
+import ssl
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+from pydantic import Field, field_validator
+
+from athena.models import BaseModel
+from athena.models.plugin import Plugin
+from athena.models.plugin_metadata import PluginMetadata
+from athena.models.test_details import TestDetails
+from athena.models.test_result import TestResult
+from athena.models.test_suite_config import TestSuiteConfig
+from athena.plugins import hookimpl
+from athena.types import TestRunnerPluginResult
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 32
+DEFAULT_MAX_BODY = 1024 * 1024
+_READ_SIZE = 64 * 1024
+# Errors showing a kept-alive connection was closed by the server while idle
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class HttpTestRunnerParameters(BaseModel):
+    url: str = Field(..., pattern=r"^https?://")
+    method: str = "GET"
+    headers: Dict[str, str] = Field(default_factory=dict)
+    body: Optional[str] = None
+    timeout: float = Field(default=10.0, gt=0)
+    status_codes: List[int] = Field(default_factory=lambda: [200], min_length=1)
+    max_latency: Optional[float] = Field(default=None, gt=0)
+    body_pattern: Optional[re.Pattern[str]] = None
+    # Bytes of the response body read and matched against body_pattern
+    max_body: int = Field(default=DEFAULT_MAX_BODY, gt=0)
+    verify_tls: bool = True
+
+    @field_validator("url")
+    @classmethod
+    def _check_url(cls, url: str) -> str:
+        split = urlsplit(url)
+        if not split.hostname:
+            raise ValueError(f"no host in '{url}'")
+        try:
+            split.port
+        except ValueError as e:  # Port out of range or not a number
+            raise ValueError(f"invalid port in '{url}': {e}") from e
+        return url
+
+
+@hookimpl
+def activate_test_plugin() -> Plugin[
+    TestRunnerPluginResult,
+    HttpTestRunnerParameters,
+]:
+    runner = HttpTestRunner()
+    return Plugin(
+        metadata=PluginMetadata(
+            name="http",
+            description="Check the status, latency and body of HTTP endpoints",
+        ),
+        executor=runner,
+        parameters_model=HttpTestRunnerParameters,
+        identifiers={"http"},
+        teardown_suite=runner.teardown_suite,
+    )
+
+
+class _HostKey(NamedTuple):
+    scheme: str
+    host: str
+    port: Optional[int]
+    verify_tls: bool
+
+
+class _HostPool:
+    def __init__(self, max_connections: int) -> None:
+        self.slots = threading.BoundedSemaphore(max_connections)
+        self.idle: List[http.client.HTTPConnection] = []
+
+
+class ConnectionPool:
+    """Keep-alive HTTP connections, pooled per scheme, host and port.
+
+    At most ``max_connections_per_host`` connections to a host are in use at
+    the same time; further requests wait for one to be released. Released
+    connections stay open and are handed to the next request for that host.
+    """
+
+    def __init__(
+        self, max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST
+    ) -> None:
+        self.max_connections_per_host = max_connections_per_host
+        self._lock = threading.Lock()
+        self._hosts: Dict[_HostKey, _HostPool] = {}
+        unverified = ssl.create_default_context()
+        unverified.check_hostname = False
+        unverified.verify_mode = ssl.CERT_NONE
+        self._tls_contexts = {True: ssl.create_default_context(), False: unverified}
+
+    def acquire(
+        self, key: _HostKey, timeout: float
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        """Take a connection to a host, waiting for a free slot if needed.
+
+        Args:
+            key: Host to connect to
+            timeout: Seconds to wait for a free slot, then the timeout of
+                every operation on the connection
+
+        Returns:
+            The connection, and whether it was reused from an earlier request
+
+        Raises:
+            TimeoutError: If no slot was released within ``timeout``
+        """
+        with self._lock:
+            pool = self._hosts.get(key)
+            if pool is None:
+                pool = self._hosts[key] = _HostPool(self.max_connections_per_host)
+        if not pool.slots.acquire(timeout=timeout):
+            raise TimeoutError(
+                f"No free connection to {key.host} within {timeout:.3g} seconds"
+            )
+
+        with self._lock:
+            connection = pool.idle.pop() if pool.idle else None
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+        return self._connect(key, timeout), False
+
+    def release(
+        self, key: _HostKey, connection: http.client.HTTPConnection, reusable: bool
+    ) -> None:
+        """Give a connection back, closing it unless it can be reused."""
+        pool = self._hosts[key]
+        if reusable:
+            with self._lock:
+                pool.idle.append(connection)
+        else:
+            connection.close()
+        pool.slots.release()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            for pool in self._hosts.values():
+                for connection in pool.idle:
+                    connection.close()
+                pool.idle.clear()
+
+    def _connect(self, key: _HostKey, timeout: float) -> http.client.HTTPConnection:
+        if key.scheme == "https":
+            return http.client.HTTPSConnection(
+                key.host,
+                key.port,
+                timeout=timeout,
+                context=self._tls_contexts[key.verify_tls],
+            )
+        return http.client.HTTPConnection(key.host, key.port, timeout=timeout)
+
+
+class _Response(NamedTuple):
+    status: int
+    body: str
+    latency: float
+
+
+class HttpTestRunner:
+    """Send HTTP requests over pooled keep-alive connections.
+
+    Connections are shared by the tests of a run, so checking many endpoints
+    of the same host pays for TCP and TLS setup once per pooled connection
+    rather than once per test. Requests run concurrently when the
+    suite ``concurrency`` allows it. Redirects are not followed.
+    """
+
+    def __init__(
+        self, max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST
+    ) -> None:
+        self.pool = ConnectionPool(max_connections_per_host)
+
+    def __call__(self, parameters: HttpTestRunnerParameters) -> TestRunnerPluginResult:
+        try:
+            response = self._request(parameters)
+        except (OSError, http.client.HTTPException) as e:
+            return TestResult.failed(message=f"Request failed: {e!r}")
+
+        details: Dict[str, TestDetails] = {
+            "status": TestDetails(
+                expected=parameters.status_codes,
+                actual=response.status,
+                success=response.status in parameters.status_codes,
+            ),
+            "latency": TestDetails(
+                expected=parameters.max_latency,
+                actual=round(response.latency, 4),
+                success=(
+                    parameters.max_latency is None
+                    or response.latency <= parameters.max_latency
+                ),
+            ),
+        }
+        if parameters.body_pattern is not None:
+            match = parameters.body_pattern.search(response.body)
+            details["body"] = TestDetails(
+                expected=parameters.body_pattern.pattern,
+                actual=match.group(0) if match else None,
+                success=match is not None,
+            )
+
+        if all(detail.success for detail in details.values()):
+            return TestResult.passed(details=details)
+        return TestResult.failed(details=details)
+
+    def teardown_suite(self, config: TestSuiteConfig) -> None:
+        """Close the connections kept alive by the tests of a run."""
+        self.pool.close()
+
+    def _request(self, parameters: HttpTestRunnerParameters) -> _Response:
+        url = urlsplit(parameters.url)
+        assert url.hostname is not None  # Checked by HttpTestRunnerParameters
+        key = _HostKey(url.scheme, url.hostname, url.port, parameters.verify_tls)
+        target = url.path or "/"
+        if url.query:
+            target = f"{target}?{url.query}"
+
+        # Waiting for a free connection counts against the test's timeout
+        deadline = time.monotonic() + parameters.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"No response within {parameters.timeout:.3g} seconds"
+                )
+            connection, reused = self.pool.acquire(key, remaining)
+            reusable = False
+            try:
+                started = time.perf_counter()
+                connection.request(
+                    parameters.method,
+                    target,
+                    body=parameters.body,
+                    headers=parameters.headers,
+                )
+                response = connection.getresponse()
+                body, complete = self._read_body(response, parameters.max_body)
+                latency = time.perf_counter() - started
+                reusable = complete and not response.will_close
+            except _STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                # The server closed the idle connection; retry on a new one
+                continue
+            finally:
+                self.pool.release(key, connection, reusable)
+
+            charset = response.headers.get_content_charset() or "utf-8"
+            return _Response(response.status, self._decode(body, charset), latency)
+
+    @staticmethod
+    def _decode(body: bytes, charset: str) -> str:
+        try:
+            return body.decode(charset, errors="replace")
+        except LookupError:  # Charset unknown to Python, announced by the server
+            return body.decode("utf-8", errors="replace")
+
+    @staticmethod
+    def _read_body(
+        response: http.client.HTTPResponse, max_body: int
+    ) -> Tuple[bytes, bool]:
+        """Read up to ``max_body`` bytes of a response body.
+
+        Returns:
+            The body read, and whether it was read entirely, which is needed
+            for the connection to be reused
+        """
+        chunks: List[bytes] = []
+        remaining = max_body
+        while remaining > 0:
+            chunk = response.read(min(remaining, _READ_SIZE))
+            if not chunk:
+                return b"".join(chunks), True
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks), response.read(1) == b""
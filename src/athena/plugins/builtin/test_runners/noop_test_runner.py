@@ -0,0 +1,44 @@
+from typing import Dict
+
+from athena.models import BaseModel
+from athena.models.plugin import Plugin
+from athena.models.plugin_metadata import PluginMetadata
+from athena.models.test_result import ResultType, TestResult
+from athena.plugins import hookimpl
+from athena.types import TestRunnerPluginResult
+
+
+class NoopTestRunnerParameters(BaseModel):
+    status: ResultType = ResultType.PASSED
+
+
+@hookimpl
+def activate_test_plugin() -> Plugin[
+    TestRunnerPluginResult,
+    NoopTestRunnerParameters,
+]:
+    return Plugin(
+        metadata=PluginMetadata(
+            name="noop",
+            description="A plugin that does nothing, used to measure overhead",
+        ),
+        executor=NoopTestRunner(),
+        parameters_model=NoopTestRunnerParameters,
+        identifiers={"noop"},
+    )
+
+
+class NoopTestRunner:
+    """Return a canned result without doing any work.
+
+    Results are built once per status and shared, so timing a suite of noop
+    tests measures the framework overhead alone.
+    """
+
+    def __init__(self) -> None:
+        self._results: Dict[ResultType, TestResult] = {
+            result_type: TestResult(type=result_type) for result_type in ResultType
+        }
+
+    def __call__(self, parameters: NoopTestRunnerParameters) -> TestRunnerPluginResult:
+        return self._results[parameters.status]
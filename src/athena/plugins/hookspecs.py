@@ -18,7 +18,14 @@ class DataParserHooks:
 class TestRunnerHooks:
     @hookspec
     def activate_test_plugin() -> Plugin[TestRunnerPluginResult, BaseModel]:
-        """Register a test runner."""
+        """Register a test runner.
+
+        Runners holding expensive resources, such as connection pools, can
+        set ``setup_suite`` and ``teardown_suite`` on the returned plugin to
+        acquire them once per run and release them when the run ends. Both
+        receive the suite configuration and are only called for runners the
+        suite uses.
+        """
         ...
 
 
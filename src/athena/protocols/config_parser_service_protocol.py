@@ -1,5 +1,8 @@
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import Optional, Protocol, Sequence, runtime_checkable
+
+from athena.models.test_suite_config import TestSuiteConfig
+from athena.selection import TestSelector
 
 from athena.types import DataParserPluginResult
 
@@ -12,3 +15,14 @@ class ConfigParserServiceProtocol(Protocol):
     ) -> DataParserPluginResult:
         """Parse data using the plugin service."""
         ...
+
+    def load_suite(
+        self,
+        paths: Sequence[Path],
+        selector: Optional[TestSelector] = None,
+    ) -> TestSuiteConfig:
+        """Load configuration files, directories or globs as one test suite.
+
+        With a selector, only the selected tests are validated and loaded.
+        """
+        ...
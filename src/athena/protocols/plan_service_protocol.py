@@ -0,0 +1,23 @@
+from typing import Protocol, runtime_checkable
+
+from athena.models.execution_plan import ExecutionPlan
+from athena.models.test_suite_config import TestSuiteConfig
+
+
+@runtime_checkable
+class PlanServiceProtocol(Protocol):
+    """Protocol defining the interface for execution planning services."""
+
+    def compile(self, config: TestSuiteConfig) -> ExecutionPlan:
+        """Compile a test suite configuration into an execution plan.
+
+        Args:
+            config: Test suite configuration containing test definitions
+
+        Returns:
+            The execution plan of the suite
+
+        Raises:
+            PlanError: With every problem found if the suite is invalid
+        """
+        ...
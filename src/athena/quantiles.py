@@ -0,0 +1,119 @@
+"""Streaming quantile estimation in constant memory."""
+
+from bisect import bisect_right, insort
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class P2Quantile:
+    """Estimate one quantile of a stream with the P² algorithm.
+
+    Five markers are kept whatever the number of observations: the minimum,
+    the maximum, the estimated quantile and two markers half-way to it. Their
+    heights are adjusted with a piecewise-parabolic formula as values arrive
+    (Jain & Chlamtac, 1985). The first five observations are exact.
+    """
+
+    def __init__(self, quantile: float) -> None:
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1 exclusive")
+        self.quantile = quantile
+        self._heights: List[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value: float) -> None:
+        heights = self._heights
+        if len(heights) < 5:
+            insort(heights, value)
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = min(bisect_right(heights, value) - 1, 3)
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def value(self) -> Optional[float]:
+        """Return the estimated quantile, ``None`` before any observation."""
+        heights = self._heights
+        if not heights:
+            return None
+        if len(heights) == 5 and self._positions[4] > 5:
+            return heights[2]
+        # Few observations: interpolate between the exact order statistics
+        rank = self.quantile * (len(heights) - 1)
+        lower = int(rank)
+        upper = min(lower + 1, len(heights) - 1)
+        return heights[lower] + (heights[upper] - heights[lower]) * (rank - lower)
+
+    def _parabolic(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+
+
+class QuantileSketch:
+    """Track several quantiles, the count, minimum and maximum of a stream."""
+
+    def __init__(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> None:
+        self._estimators: Dict[float, P2Quantile] = {
+            quantile: P2Quantile(quantile) for quantile in quantiles
+        }
+        self.count = 0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        for estimator in self._estimators.values():
+            estimator.add(value)
+
+    def quantile(self, quantile: float) -> Optional[float]:
+        """Return the estimate of a quantile given when creating the sketch."""
+        return self._estimators[quantile].value()
+
+    def summary(self) -> Dict[str, float]:
+        """Return the minimum, maximum and tracked quantiles keyed ``p<N>``."""
+        if self.minimum is None or self.maximum is None:
+            return {}
+        summary = {"min": self.minimum}
+        for quantile, estimator in sorted(self._estimators.items()):
+            value = estimator.value()
+            if value is not None:
+                summary[f"p{quantile * 100:g}"] = value
+        summary["max"] = self.maximum
+        return summary
@@ -0,0 +1,176 @@
+"""Selection of the tests of a suite by name and tags."""
+
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+_TOKEN = re.compile(r"\s*(\(|\)|[^\s()]+)")
+_OPERATORS = {"and", "or", "not"}
+
+_Matcher = Callable[[str, Tuple[str, ...]], bool]
+
+
+class _Parser:
+    """Recursive descent parser of ``-k`` keyword expressions.
+
+    ``not`` binds tighter than ``and``, which binds tighter than ``or``.
+    """
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self.tokens: List[str] = []
+        position = 0
+        while match := _TOKEN.match(expression, position):
+            self.tokens.append(match.group(1))
+            position = match.end()
+        self.position = 0
+
+    def parse(self) -> _Matcher:
+        if not self.tokens:
+            raise self._error("empty expression")
+        matcher = self._or()
+        if self.position < len(self.tokens):
+            raise self._error(f"unexpected '{self.tokens[self.position]}'")
+        return matcher
+
+    def _or(self) -> _Matcher:
+        operands = [self._and()]
+        while self._accept("or"):
+            operands.append(self._and())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda name, tags: any(match(name, tags) for match in operands)
+
+    def _and(self) -> _Matcher:
+        operands = [self._not()]
+        while self._accept("and"):
+            operands.append(self._not())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda name, tags: all(match(name, tags) for match in operands)
+
+    def _not(self) -> _Matcher:
+        if self._accept("not"):
+            operand = self._not()
+            return lambda name, tags: not operand(name, tags)
+        if self._accept("("):
+            matcher = self._or()
+            if not self._accept(")"):
+                raise self._error("missing ')'")
+            return matcher
+        token = self._next()
+        if token is None or token == ")" or token.lower() in _OPERATORS:
+            raise self._error(f"expected a keyword, got '{token or 'end'}'")
+        keyword = token.lower()
+        return lambda name, tags: keyword in name or keyword in tags
+
+    def _accept(self, token: str) -> bool:
+        if (
+            self.position < len(self.tokens)
+            and self.tokens[self.position].lower() == token
+        ):
+            self.position += 1
+            return True
+        return False
+
+    def _next(self) -> Optional[str]:
+        if self.position >= len(self.tokens):
+            return None
+        self.position += 1
+        return self.tokens[self.position - 1]
+
+    def _error(self, reason: str) -> ValueError:
+        return ValueError(f"Invalid keyword expression '{self.expression}': {reason}")
+
+
+class TestSelector:
+    """Choose the tests of a suite to run by keyword expression and tags.
+
+    A keyword matches a test when it is a substring of the test's name or
+    one of its tags, ignoring case. Keywords combine with ``and``, ``or``,
+    ``not`` and parentheses, as in ``-k "api and not slow"``. With ``tags``,
+    only tests carrying at least one of them, ignoring case, are selected.
+
+    Raises:
+        ValueError: If the keyword expression is invalid
+    """
+
+    def __init__(self, keyword: Optional[str] = None, tags: Iterable[str] = ()) -> None:
+        self.keyword = keyword
+        self.tags = frozenset(tag.lower() for tag in tags)
+        self._matcher = _Parser(keyword).parse() if keyword is not None else None
+
+    @property
+    def key(self) -> Tuple[Optional[str], FrozenSet[str]]:
+        """Identity of the selection, for caching its outcome."""
+        return self.keyword, self.tags
+
+    def matches(self, name: str, tags: Sequence[str] = ()) -> bool:
+        """Check whether a test with this name and these tags is selected."""
+        tags = tuple(tag.lower() for tag in tags)
+        if self.tags and self.tags.isdisjoint(tags):
+            return False
+        if self._matcher is None:
+            return True
+        return self._matcher(name.lower(), tags)
+
+
+class TestIndex:
+    """Names and tags of the raw test definitions of one configuration file.
+
+    Built in a single pass over the parsed file without validating anything,
+    so a selection only validates the tests it picks. Tags are indexed in
+    lower case. Definitions too malformed to have a name are never selected;
+    selections are cached.
+
+    Attributes:
+        tests: The indexed test definitions, in order
+    """
+
+    def __init__(self, tests: Sequence[Any]) -> None:
+        self.tests = tests
+        self.size = len(tests)
+        self._names: List[str] = []
+        self._tags: List[Tuple[str, ...]] = []
+        self._positions_by_tag: Dict[str, List[int]] = {}
+        for position, test in enumerate(tests):
+            name = test.get("name") if isinstance(test, dict) else None
+            tags = test.get("tags") if isinstance(test, dict) else None
+            if not isinstance(tags, list):
+                tags = []
+            tags = tuple(tag.lower() for tag in tags if isinstance(tag, str))
+            self._names.append(name if isinstance(name, str) else "")
+            self._tags.append(tags)
+            for tag in tags:
+                self._positions_by_tag.setdefault(tag, []).append(position)
+        self._selections: Dict[Any, Tuple[int, ...]] = {}
+
+    def select(self, selector: TestSelector) -> Tuple[int, ...]:
+        """Return the positions of the tests chosen by a selector, in order."""
+        if selector.key not in self._selections:
+            if selector.tags:
+                candidates: Iterable[int] = sorted(
+                    {
+                        position
+                        for tag in selector.tags
+                        for position in self._positions_by_tag.get(tag, ())
+                    }
+                )
+            else:
+                candidates = range(self.size)
+            self._selections[selector.key] = tuple(
+                position
+                for position in candidates
+                if self._names[position]
+                and selector.matches(self._names[position], self._tags[position])
+            )
+        return self._selections[selector.key]
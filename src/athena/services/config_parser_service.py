@@ -1,30 +1,494 @@
+import glob
+import hashlib
+import itertools
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
+from athena.exceptions import PlanError
 from athena.models import BaseModel
+from athena.models.plugin import Plugin
+from athena.models.reporter_config import ReporterConfig
+from athena.models.resource_budget import ResourceBudget
+from athena.models.test_config import TestConfig
+from athena.models.test_suite_config import TestSuiteConfig
+from athena.parameters import EMPTY, ParameterResolver
 from athena.protocols.config_parser_service_protocol import ConfigParserServiceProtocol
 from athena.protocols.plugin_service_protocol import PluginServiceProtocol
+from athena.selection import TestIndex, TestSelector
 from athena.types import DataParserPluginResult
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = os.cpu_count() or 1
+_GLOB_CHARACTERS = set("*?[")
+# Matrix values other than strings are labelled as compact JSON
+_LABEL = json.JSONEncoder(separators=(",", ":"))
+
+
+def _run_parser(
+    executor: Callable[[BaseModel], DataParserPluginResult],
+    parameters_model: Type[BaseModel],
+    data: str,
+) -> DataParserPluginResult:
+    """Parse raw data with a parser plugin; runs in a worker process."""
+    return executor(parameters_model(**{"data": data}))
+
+
+def _expand_matrix(test: Any) -> List[Any]:
+    """Expand a test definition with a ``matrix`` into one per combination.
+
+    Each combination gets the values it picks as its ``matrix`` and a name
+    listing them without whitespace, e.g. ``latency[region=eu,size=2]``, so
+    that any of them can be picked with ``-k``.
+    """
+    if not isinstance(test, dict) or not test.get("matrix"):
+        return [test]
+    matrix = test["matrix"]
+    if not isinstance(matrix, dict) or not all(
+        isinstance(values, list) and values for values in matrix.values()
+    ):
+        raise ValueError(
+            f"matrix of test '{test.get('name')}' must map parameter names to "
+            "non-empty lists of values"
+        )
+    tests = []
+    for combination in itertools.product(*matrix.values()):
+        values = dict(zip(matrix, combination))
+        label = ",".join(
+            f"{key}={value if isinstance(value, str) else _LABEL.encode(value)}"
+            for key, value in values.items()
+        )
+        tests.append({**test, "name": f"{test.get('name')}[{label}]", "matrix": values})
+    return tests
+
+
+@contextmanager
+def _collect(errors: List[str], source: str, entry: str = "") -> Iterator[None]:
+    """Record a ValueError raised in the block as a problem of a file."""
+    try:
+        yield
+    except ValueError as e:
+        where = f"'{source}', {entry}" if entry else f"'{source}'"
+        errors.append(f"Invalid configuration in {where}: {e}")
+
+
+def _mapping(value: Any, what: str) -> Dict[str, Any]:
+    if not isinstance(value, dict):
+        raise ValueError(f"{what} must be a mapping, got {type(value).__name__}")
+    return value
+
+
+def _list(value: Any, what: str) -> List[Any]:
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValueError(f"{what} must be a list, got {type(value).__name__}")
+    return value
+
+
+def _origin(parent: Optional[Path]) -> str:
+    return "as a root" if parent is None else f"from '{parent}'"
+
+
+@lru_cache(maxsize=None)
+def _module_version(module_name: str) -> str:
+    """Version of the code in a module, to tell parser upgrades apart.
+
+    The version of the distribution named after the module's top-level
+    package, or the size and modification time of its source file when there
+    is no such distribution, as in a source checkout.
+    """
+    try:
+        return metadata.version(module_name.partition(".")[0])
+    except metadata.PackageNotFoundError:
+        pass
+    source = getattr(sys.modules.get(module_name), "__file__", None)
+    if source is None:
+        return "unknown"
+    stat = os.stat(source)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def _parser_version(plugin: Plugin[DataParserPluginResult, BaseModel]) -> str:
+    executor = plugin.executor
+    module = getattr(executor, "__module__", None) or type(executor).__module__
+    return f"{plugin.metadata.name}-{_module_version(module)}"
+
+
+def _is_plain(value: Any) -> bool:
+    """Check that a value survives a round trip through JSON unchanged."""
+    if value is None or type(value) in (str, int, float, bool):
+        return True
+    if type(value) is list:
+        return all(_is_plain(item) for item in value)
+    if type(value) is dict:
+        return all(type(key) is str and _is_plain(item) for key, item in value.items())
+    return False
+
+
+def _expand(pattern: Path) -> List[Path]:
+    if _GLOB_CHARACTERS.intersection(str(pattern)):
+        matches = glob.glob(str(pattern), recursive=True)
+        return [Path(path) for path in sorted(matches)]
+    return [pattern]
+
 
 class ConfigParserService(ConfigParserServiceProtocol):
-    """Component responsible for configuration parsing and parameter management."""
+    """Component responsible for configuration parsing and parameter management.
+
+    Parsed files are cached by content hash and parser version, in memory
+    and optionally on disk, so a file included by many suites or unchanged
+    since the previous run is never parsed twice. Parsed data is shared
+    between callers and must be treated as read-only. The index of each
+    file's tests is cached next to its parsed data, along with the outcome of
+    every selection made on it.
+    """
 
     def __init__(
-        self, plugin_service: PluginServiceProtocol[DataParserPluginResult, BaseModel]
+        self,
+        plugin_service: PluginServiceProtocol[DataParserPluginResult, BaseModel],
+        cache_dir: Optional[Path] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        parameter_resolver: Optional[ParameterResolver] = None,
     ) -> None:
+        """Initialize the config parser service.
+
+        Args:
+            plugin_service: Registry of the available data parser plugins
+            cache_dir: Directory persisting parsed files across runs, if any
+            max_workers: Maximum number of processes parsing files concurrently
+            parameter_resolver: Resolver layering the parameters of included
+                files onto those of the files including them
+        """
         self.plugin_service = plugin_service
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.parameter_resolver = parameter_resolver or ParameterResolver()
+        self._cache: Dict[str, DataParserPluginResult] = {}
+        self._indexes: Dict[str, TestIndex] = {}
 
     def parse(
         self,
         config: Path,
     ) -> DataParserPluginResult:
-        config_raw = config.read_text()
-        format_ext = config.suffix.lstrip(".")
-        plugin = self.plugin_service.get_plugin(format_ext)
-        return plugin.executor(
-            plugin.parameters_model(
-                **{
-                    "data": config_raw,
-                },
+        return self.parse_many([config])[0]
+
+    def parse_many(
+        self,
+        configs: Sequence[Path],
+    ) -> List[DataParserPluginResult]:
+        """Parse several configuration files, concurrently when possible.
+
+        Args:
+            configs: Paths of the configuration files to parse
+
+        Returns:
+            The parsed data of each file, in the order of ``configs``
+        """
+        return [self._cache[key] for key in self._parse_keys(configs)]
+
+    def _parse_keys(self, configs: Sequence[Path]) -> List[str]:
+        """Parse the files missing from the cache and return every cache key."""
+        keys: List[str] = []
+        misses: Dict[str, Tuple[str, str]] = {}
+        for config in configs:
+            config_raw = config.read_bytes()
+            format_ext = config.suffix.lstrip(".")
+            # Parsed data depends on the parser as much as on the content
+            parser = _parser_version(self.plugin_service.get_plugin(format_ext))
+            digest = hashlib.sha256(f"{parser}\0".encode() + config_raw).hexdigest()
+            key = f"{format_ext}-{digest}"
+            keys.append(key)
+            if key not in self._cache and not self._load_cached(key):
+                misses[key] = (format_ext, config_raw.decode())
+
+        for key, result in self._parse_misses(misses):
+            self._cache[key] = result
+            self._store_cached(key, result)
+
+        return keys
+
+    def clear_cache(self) -> None:
+        """Forget the files parsed so far; the disk cache is left untouched."""
+        self._cache.clear()
+        self._indexes.clear()
+
+    def discover(self, paths: Sequence[Path]) -> List[Path]:
+        """Expand directories and glob patterns into configuration files.
+
+        Directories contribute the files directly inside them whose extension
+        is handled by a registered data parser plugin.
+        """
+        configs: List[Path] = []
+        for pattern in paths:
+            for path in _expand(pattern):
+                if path.is_dir():
+                    configs.extend(
+                        child
+                        for child in sorted(path.iterdir())
+                        if child.is_file() and self._is_parsable(child)
+                    )
+                else:
+                    configs.append(path)
+        return list(dict.fromkeys(configs))
+
+    def load_suite(
+        self, paths: Sequence[Path], selector: Optional[TestSelector] = None
+    ) -> TestSuiteConfig:
+        """Load one or more configuration files as a single test suite.
+
+        Every file, including those pulled in through ``include:``
+        directives, is parsed once and concurrently with the other files of
+        the same include depth. Tests keep track of the file declaring them,
+        and each file's ``parameters`` are deep-merged onto those of the file
+        including it; a file reached several ways must get the same
+        parameters from each of them. A test with a ``matrix`` is expanded
+        into one test per combination of its values. Reporters and resource
+        budgets are combined by name; for them and ``concurrency``, the first
+        definition wins.
+
+        With a selector, tests are picked from each file's index of names and
+        tags, built once matrices are expanded so that a single combination
+        can be picked; the other tests are neither validated nor returned.
+
+        Args:
+            paths: Configuration files, directories or glob patterns
+            selector: Selection of the tests to load, all of them if None
+
+        Returns:
+            The combined test suite configuration
+
+        Raises:
+            PlanError: With every invalid test, reporter or budget definition
+                of every file
+            ValueError: If no configuration is found, a file is empty or it is
+                reached with conflicting parameters
+        """
+        roots = [path.resolve() for path in self.discover(paths)]
+        if not roots:
+            raise ValueError("No configuration files found")
+
+        documents: Dict[Path, Dict[str, Any]] = {}
+        keys: Dict[Path, str] = {}
+        pending = list(dict.fromkeys(roots))
+        while pending:
+            includes: List[Path] = []
+            for path, key in zip(pending, self._parse_keys(pending)):
+                document = self._cache[key]
+                if not document:
+                    raise ValueError(f"Configuration file '{path}' is empty")
+                if not isinstance(document, dict):
+                    raise ValueError(f"Configuration file '{path}' is not a mapping")
+                documents[path] = document
+                keys[path] = key
+                includes.extend(self._includes(path, document))
+            pending = [
+                path for path in dict.fromkeys(includes) if path not in documents
+            ]
+
+        tests: List[TestConfig] = []
+        reports: Dict[str, ReporterConfig] = {}
+        budgets: Dict[str, ResourceBudget] = {}
+        trace_allocations = False
+        concurrency: Optional[int] = None
+        source_parameters: Dict[str, Mapping[str, Any]] = {}
+        visited: Dict[Path, Tuple[Mapping[str, Any], Optional[Path]]] = {}
+        errors: List[str] = []
+
+        for root in roots:
+            for path, parameters in self._walk(root, EMPTY, documents, visited):
+                source = os.path.relpath(path)
+                document = documents[path]
+                source_parameters[source] = parameters
+                trace_allocations |= bool(document.get("trace_allocations"))
+                if concurrency is None:
+                    concurrency = document.get("concurrency")
+                raw_tests: List[Any] = []
+                with _collect(errors, source):
+                    index = self._index(
+                        keys[path], _list(document.get("tests"), "tests")
+                    )
+                    raw_tests = index.tests
+                    if selector is not None:
+                        raw_tests = [raw_tests[i] for i in index.select(selector)]
+                for position, test in enumerate(raw_tests):
+                    with _collect(errors, source, f"test #{position + 1}"):
+                        test = _mapping(test, "a test")
+                        tests.append(TestConfig(**{**test, "source": source}))
+                with _collect(errors, source):
+                    for report in _list(document.get("reports"), "reports"):
+                        with _collect(errors, source, "reporter"):
+                            report = _mapping(report, "a reporter")
+                            reporter = ReporterConfig(**report)
+                            reports.setdefault(reporter.name, reporter)
+                with _collect(errors, source):
+                    budget_items = _mapping(document.get("budgets") or {}, "budgets")
+                    for runner, budget in budget_items.items():
+                        with _collect(errors, source, f"budget '{runner}'"):
+                            budget = _mapping(budget, "a budget")
+                            budgets.setdefault(runner, ResourceBudget(**budget))
+
+        if errors:
+            raise PlanError(errors)
+
+        return TestSuiteConfig(
+            parameters=None,
+            tests=tests,
+            reports=list(reports.values()),
+            source_parameters=source_parameters,
+            trace_allocations=trace_allocations,
+            budgets=budgets,
+            concurrency=1 if concurrency is None else concurrency,
+        )
+
+    def _index(self, key: str, raw_tests: List[Any]) -> TestIndex:
+        if key not in self._indexes:
+            self._indexes[key] = TestIndex(
+                [test for raw_test in raw_tests for test in _expand_matrix(raw_test)]
             )
+        return self._indexes[key]
+
+    def _walk(
+        self,
+        path: Path,
+        inherited: Mapping[str, Any],
+        documents: Dict[Path, Dict[str, Any]],
+        visited: Dict[Path, Tuple[Mapping[str, Any], Optional[Path]]],
+        parent: Optional[Path] = None,
+    ) -> Iterator[Tuple[Path, Mapping[str, Any]]]:
+        """Yield files in include order with their effective parameters.
+
+        A file reached several times, as a root or through the includes of
+        different files, is loaded once. That is only allowed if every way of
+        reaching it gives it the same parameters.
+
+        Raises:
+            ValueError: If a file is reached again with different parameters
+        """
+        if path in visited:
+            first_inherited, first_parent = visited[path]
+            if first_inherited is not inherited and first_inherited != inherited:
+                raise ValueError(
+                    f"Configuration file '{path}' is loaded "
+                    f"{_origin(first_parent)} and {_origin(parent)} with "
+                    "different parameters; load it from one place only"
+                )
+            logger.debug("Skipping '%s', already loaded", path)
+            return
+        visited[path] = (inherited, parent)
+        document = documents[path]
+        parameters = self.parameter_resolver.merge(
+            inherited, document.get("parameters") or {}
         )
+        yield path, parameters
+        for include in self._includes(path, document):
+            yield from self._walk(include, parameters, documents, visited, path)
+
+    def _includes(self, path: Path, document: Dict[str, Any]) -> List[Path]:
+        patterns = document.get("include") or []
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        includes: List[Path] = []
+        for pattern in patterns:
+            expanded = self.discover([path.parent / pattern])
+            if not expanded:
+                raise ValueError(f"Include '{pattern}' in '{path}' matched no file")
+            includes.extend(include.resolve() for include in expanded)
+        return includes
+
+    def _is_parsable(self, path: Path) -> bool:
+        try:
+            self.plugin_service.get_plugin(path.suffix.lstrip("."))
+        except KeyError:
+            return False
+        return True
+
+    def _parse_misses(
+        self, misses: Dict[str, Tuple[str, str]]
+    ) -> Iterator[Tuple[str, DataParserPluginResult]]:
+        """Parse cache misses, in worker processes when there are several.
+
+        Parsing is CPU bound, so threads would serialize on the GIL. Parser
+        plugins whose executor cannot be sent to another process are run in
+        the current one instead.
+        """
+        jobs = [
+            (key, self.plugin_service.get_plugin(format_ext), config_raw)
+            for key, (format_ext, config_raw) in misses.items()
+        ]
+        if len(jobs) > 1 and self.max_workers > 1:
+            try:
+                with ProcessPoolExecutor(min(self.max_workers, len(jobs))) as pool:
+                    results = list(
+                        pool.map(
+                            _run_parser,
+                            [plugin.executor for _, plugin, _ in jobs],
+                            [plugin.parameters_model for _, plugin, _ in jobs],
+                            [config_raw for _, _, config_raw in jobs],
+                        )
+                    )
+            except (pickle.PicklingError, AttributeError, TypeError):
+                logger.debug("Parser plugins not picklable, parsing in process")
+            else:
+                yield from zip([key for key, _, _ in jobs], results)
+                return
+
+        for key, plugin, config_raw in jobs:
+            yield key, _run_parser(plugin.executor, plugin.parameters_model, config_raw)
+
+    def _load_cached(self, key: str) -> bool:
+        """Load a parsed file from the disk cache into memory, if present."""
+        if self.cache_dir is None:
+            return False
+        try:
+            with (self.cache_dir / f"{key}.json").open() as f:
+                self._cache[key] = json.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception:
+            logger.debug("Ignoring unreadable cache entry '%s'", key, exc_info=True)
+            return False
+        return True
+
+    def _store_cached(self, key: str, result: DataParserPluginResult) -> None:
+        """Persist a parsed file to the disk cache, atomically.
+
+        Entries are plain JSON, so a cache directory others can write to
+        cannot run code. Data JSON would not restore as is, such as dates or
+        keys other than strings, is not cached.
+        """
+        if self.cache_dir is None:
+            return
+        if not _is_plain(result):
+            logger.debug("Not caching '%s': not plain JSON data", key)
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(result, f, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
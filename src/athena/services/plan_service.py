@@ -0,0 +1,173 @@
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Type
+
+from pydantic import ValidationError
+
+from athena.exceptions import PlanError
+from athena.models import BaseModel
+from athena.models.execution_plan import ExecutionPlan
+from athena.models.planned_test import PlannedTest
+from athena.models.plugin import Plugin
+from athena.models.test_config import TestConfig
+from athena.models.test_suite_config import TestSuiteConfig
+from athena.parameters import FrozenMapping, ParameterResolver, thaw
+from athena.protocols.plan_service_protocol import PlanServiceProtocol
+from athena.protocols.plugin_service_protocol import PluginServiceProtocol
+from athena.types import ReporterPluginResult, TestRunnerPluginResult
+
+_RunnerPlugin = Plugin[TestRunnerPluginResult, BaseModel]
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or '<root>'}: "
+        f"{detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+@lru_cache(maxsize=None)
+def _input_keys(model: Type[BaseModel]) -> Optional[FrozenSet[str]]:
+    """Parameter names a model reads, None if it may read any of them.
+
+    A model ignoring extra keys, without aliases other than plain strings
+    and without validators seeing its raw input, only reads its fields.
+    """
+    if model.model_config.get("extra", "ignore") != "ignore":
+        return None
+    validators = model.__pydantic_decorators__.model_validators.values()
+    if any(validator.info.mode != "after" for validator in validators):
+        return None
+    keys = set()
+    for name, field in model.model_fields.items():
+        keys.add(name)
+        for alias in (field.alias, field.validation_alias):
+            if alias is not None and not isinstance(alias, str):
+                return None
+            if alias is not None:
+                keys.add(alias)
+    return frozenset(keys)
+
+
+def _arguments(model: Type[BaseModel], parameters: Mapping[str, Any]) -> Dict[str, Any]:
+    """Plain copies of the parameters a model reads, whatever else is set.
+
+    Validation then costs the size of the model, not of the global block.
+    """
+    keys = _input_keys(model)
+    if keys is None:
+        return thaw(parameters)
+    return {key: thaw(parameters[key]) for key in keys if key in parameters}
+
+
+class PlanService(PlanServiceProtocol):
+    """Component responsible for compiling test suites into execution plans.
+
+    Each runner plugin is looked up once per identifier and every test's
+    parameters are merged and validated before anything runs. All problems
+    are collected and raised together, so an invalid suite fails before its
+    first test instead of in the middle of the run.
+
+    Parameters are resolved in layers, global, source file, matrix and test,
+    into immutable mappings shared by every test with the same layers. They
+    are validated with the context ``{"source": <file declaring the test>}``,
+    so that a parameters model can resolve paths relative to that file.
+    """
+
+    def __init__(
+        self,
+        test_plugin_service: PluginServiceProtocol[TestRunnerPluginResult, BaseModel],
+        reporter_plugin_service: Optional[
+            PluginServiceProtocol[ReporterPluginResult, BaseModel]
+        ] = None,
+        parameter_resolver: Optional[ParameterResolver] = None,
+    ) -> None:
+        self.test_plugin_service = test_plugin_service
+        self.reporter_plugin_service = reporter_plugin_service
+        self.parameter_resolver = parameter_resolver or ParameterResolver()
+
+    def compile(self, config: TestSuiteConfig) -> ExecutionPlan:
+        """Compile a test suite configuration into an execution plan."""
+        errors: List[str] = []
+        plugins: Dict[str, Optional[_RunnerPlugin]] = {}
+        # Parameters every test of a source file starts from, merged once
+        source_params: Dict[Optional[str], FrozenMapping] = {}
+        planned: List[PlannedTest] = []
+
+        for index, test_config in enumerate(config.tests):
+            identifier = test_config.plugin_identifier
+            if identifier not in plugins:
+                plugins[identifier] = self._resolve(
+                    identifier, self._describe(index, test_config), errors
+                )
+            if (plugin := plugins[identifier]) is None:
+                continue
+
+            if test_config.source not in source_params:
+                source_params[test_config.source] = self.parameter_resolver.merge(
+                    config.parameters or {},
+                    config.source_parameters.get(test_config.source) or {},
+                )
+
+            # Layer the matrix combination and test-specific parameters on top
+            merged_params = self.parameter_resolver.resolve(
+                source_params[test_config.source],
+                test_config.matrix,
+                test_config.parameters,
+            )
+
+            try:
+                parameters = plugin.parameters_model.model_validate(
+                    _arguments(plugin.parameters_model, merged_params),
+                    context={"source": test_config.source},
+                )
+            except ValidationError as e:
+                errors.append(
+                    f"{self._describe(index, test_config)}: invalid parameters for "
+                    f"'{identifier}': {_format_validation_error(e)}"
+                )
+                continue
+
+            planned.append(
+                PlannedTest(
+                    # Copy the config to avoid modifying the original; the
+                    # merged parameters are shared, never copied, between tests
+                    # and TestConfig.parameters accepts them as they are
+                    config=test_config.model_copy(update={"parameters": merged_params}),
+                    plugin=plugin,
+                    parameters=parameters,
+                )
+            )
+
+        if self.reporter_plugin_service is not None:
+            for report in config.reports:
+                try:
+                    self.reporter_plugin_service.get_plugin(report.plugin_identifier)
+                except KeyError:
+                    errors.append(
+                        f"Reporter '{report.name}': unknown reporter plugin "
+                        f"'{report.plugin_identifier}'"
+                    )
+
+        if errors:
+            raise PlanError(errors)
+
+        return ExecutionPlan(config=config, tests=tuple(planned))
+
+    def _resolve(
+        self, identifier: str, description: str, errors: List[str]
+    ) -> Optional[_RunnerPlugin]:
+        """Look a runner plugin up, reporting it once if it does not exist."""
+        try:
+            return self.test_plugin_service.get_plugin(identifier)
+        except KeyError:
+            errors.append(
+                f"{description}: unknown test runner plugin '{identifier}'"
+                " (reported once for all tests using it)"
+            )
+            return None
+
+    @staticmethod
+    def _describe(index: int, test_config: TestConfig) -> str:
+        location = f" in '{test_config.source}'" if test_config.source else ""
+        return f"Test #{index + 1} '{test_config.name}'{location}"
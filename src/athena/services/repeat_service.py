@@ -0,0 +1,132 @@
+import time
+from numbers import Real
+from typing import Any, Dict, Optional
+
+from athena.models.planned_test import PlannedTest
+from athena.models.test_details import TestDetails
+from athena.models.test_result import ResultType, TestResult
+from athena.quantiles import DEFAULT_QUANTILES, QuantileSketch
+
+
+def _numeric(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, Real):
+        return None
+    return float(value)
+
+
+class _DetailSamples:
+    """Running statistics of one detail across the runs of a test."""
+
+    def __init__(self, quantile: float) -> None:
+        self.quantile = quantile
+        # Lower-bound details are judged on the opposite tail
+        self.lower_quantile = round(1 - quantile, 12)
+        self.sketch = QuantileSketch(
+            {*DEFAULT_QUANTILES, quantile, self.lower_quantile}
+        )
+        self.samples = 0
+        self.successes = 0
+        self.expected: Any = None
+        self.actual: Any = None
+        # Runs consistent with success meaning actual <= expected, or >=
+        self.upper_bound_votes = 0
+        self.lower_bound_votes = 0
+
+    def add(self, detail: TestDetails) -> None:
+        self.samples += 1
+        self.successes += detail.success
+        self.expected = detail.expected
+        self.actual = detail.actual
+        if (actual := _numeric(detail.actual)) is None:
+            return
+        self.sketch.add(actual)
+        if (expected := _numeric(detail.expected)) is not None:
+            self.upper_bound_votes += detail.success == (actual <= expected)
+            self.lower_bound_votes += detail.success == (actual >= expected)
+
+    def result(self) -> TestDetails:
+        """Judge the detail on the chosen percentile of its samples.
+
+        A numeric detail with a numeric expectation passes when the
+        percentile is on the passing side of the expectation, that side being
+        inferred from the verdicts of the runner. For an upper bound such as a
+        latency, that is the percentile itself; for a lower bound such as a
+        throughput, the same share of runs must be above the expectation, so
+        the opposite tail is used: p5 for the 95th percentile. Any other
+        detail passes when the share of passing runs reaches the percentile.
+        """
+        value = self.sketch.quantile(self.quantile)
+        expected = _numeric(self.expected)
+        if value is None:
+            return TestDetails(
+                expected=self.expected,
+                actual=self.actual,
+                success=self.successes >= self.quantile * self.samples,
+            )
+        if expected is None:
+            success = self.successes >= self.quantile * self.samples
+        elif self.upper_bound_votes >= self.lower_bound_votes:
+            success = value <= expected
+        else:
+            value = self.sketch.quantile(self.lower_quantile) or value
+            success = value >= expected
+        return TestDetails(
+            expected=self.expected,
+            actual=value,
+            success=success,
+            quantiles=self.sketch.summary(),
+        )
+
+
+class RepeatService:
+    """Component responsible for running a test several times.
+
+    Samples are folded into streaming quantile sketches as they arrive and
+    never stored, so memory stays constant however many times a test runs.
+    """
+
+    def run(self, test: PlannedTest) -> TestResult:
+        """Run a test ``repeat`` times and judge it on the chosen percentile.
+
+        Each detail reports the percentile of its ``actual`` values along with
+        their distribution. The test passes when every detail passes, or, for
+        a runner returning no details, when the share of passing runs reaches
+        the percentile.
+        """
+        config = test.config
+        quantile = config.percentile / 100
+        details: Dict[str, _DetailSamples] = {}
+        counts = {result_type: 0 for result_type in ResultType}
+        last_problem: Optional[str] = None
+
+        for run in range(config.repeat):
+            if run and config.interval:
+                time.sleep(config.interval)
+            result = test.plugin.executor(test.parameters)
+            counts[result.type] += 1
+            if result.type != ResultType.PASSED and result.message:
+                last_problem = result.message
+            for key, detail in (result.details or {}).items():
+                if key not in details:
+                    details[key] = _DetailSamples(quantile)
+                details[key].add(detail)
+
+        summary = (
+            f"{config.repeat} runs judged on p{config.percentile:g}: "
+            f"{counts[ResultType.PASSED]} passed, {counts[ResultType.FAILED]} "
+            f"failed, {counts[ResultType.SKIPPED]} skipped"
+        )
+        if counts[ResultType.SKIPPED] == config.repeat:
+            return TestResult.skipped(message=last_problem or summary)
+
+        aggregated = {key: samples.result() for key, samples in details.items()}
+        if aggregated:
+            passed = all(detail.success for detail in aggregated.values())
+        else:
+            passed = counts[ResultType.PASSED] >= quantile * config.repeat
+
+        if passed:
+            return TestResult.passed(message=summary, details=aggregated or None)
+        if last_problem:
+            summary = f"{summary}; last: {last_problem}"
+        return TestResult.failed(message=summary, details=aggregated or None)
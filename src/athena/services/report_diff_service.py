@@ -0,0 +1,220 @@
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from athena.models.report_diff import ReportDiff
+from athena.models.test_change import ChangeType, TestChange
+from athena.models.test_result import ResultType
+from athena.models.test_suite_summary import TestSuiteSummary
+from athena.services.report_reader_service import ReportReaderService
+
+# Tests are keyed by name and occurrence, so suites reusing a name still join
+# their n-th occurrences together.
+_TestKey = Tuple[str, int]
+
+
+class _Entry(NamedTuple):
+    """The few fields of a test result the comparison needs."""
+
+    name: str
+    status: str
+    duration: Optional[float]
+    actuals: Dict[str, float]
+
+
+def _numeric_actuals(details: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    actuals: Dict[str, float] = {}
+    for key, detail in (details or {}).items():
+        actual = detail.get("actual") if isinstance(detail, dict) else detail.actual
+        if isinstance(actual, (int, float)) and not isinstance(actual, bool):
+            actuals[key] = float(actual)
+    return actuals
+
+
+def _entry_from_dict(result: Dict[str, Any]) -> _Entry:
+    return _Entry(
+        name=result["config"]["name"],
+        status=result["result"]["type"],
+        duration=result.get("duration"),
+        actuals=_numeric_actuals(result["result"].get("details")),
+    )
+
+
+def _entries_from_summary(summary: TestSuiteSummary) -> Iterator[_Entry]:
+    for result in summary.results:
+        yield _Entry(
+            name=result.config.name,
+            status=result.result.type.value,
+            duration=result.duration,
+            actuals=_numeric_actuals(result.result.details),
+        )
+
+
+def _keyed(entries: Iterable[_Entry]) -> Iterator[Tuple[_TestKey, _Entry]]:
+    occurrences: Dict[str, int] = {}
+    for entry in entries:
+        occurrence = occurrences.get(entry.name, 0)
+        occurrences[entry.name] = occurrence + 1
+        yield (entry.name, occurrence), entry
+
+
+def _relative_change(baseline: float, current: float) -> float:
+    if baseline == current:
+        return 0.0
+    if baseline == 0:
+        return float("inf")
+    return abs(current - baseline) / abs(baseline)
+
+
+class ReportDiffService:
+    """Compare test results against a baseline JSON report.
+
+    The baseline is streamed into a compact hash index keyed by test name,
+    then the current results are joined against it in a single pass. Only
+    the differences are kept: status transitions, new and removed tests,
+    and durations or numeric ``actual`` values that moved beyond a relative
+    threshold.
+    """
+
+    def __init__(
+        self,
+        reader: Optional[ReportReaderService] = None,
+        duration_threshold: float = 0.5,
+        min_duration_delta: float = 0.1,
+        actual_threshold: float = 0.2,
+    ) -> None:
+        """Initialize the diff service.
+
+        Args:
+            reader: Reader used to stream JSON reports
+            duration_threshold: Relative duration change reported (0.5 = 50%)
+            min_duration_delta: Absolute duration change, in seconds, below
+                which durations are considered unchanged
+            actual_threshold: Relative change of a numeric ``actual`` reported
+        """
+        self.reader = reader or ReportReaderService()
+        self.duration_threshold = duration_threshold
+        self.min_duration_delta = min_duration_delta
+        self.actual_threshold = actual_threshold
+
+    def diff_summary(self, baseline: Path, summary: TestSuiteSummary) -> ReportDiff:
+        """Compare a test suite summary against a baseline report."""
+        return self._diff(baseline, _entries_from_summary(summary), summary.timestamp)
+
+    def diff_reports(self, baseline: Path, current: Path) -> ReportDiff:
+        """Compare two JSON reports, streaming both of them."""
+        header: Dict[str, Any] = {}
+
+        def entries() -> Iterator[_Entry]:
+            for key, value in self.reader.iter_report(current):
+                if key == "results":
+                    yield _entry_from_dict(value)
+                else:
+                    header[key] = value
+
+        diff = self._diff(baseline, entries(), None)
+        diff.current_timestamp = header.get("timestamp")
+        return diff
+
+    def _index_baseline(
+        self, baseline: Path
+    ) -> Tuple[Optional[str], Dict[_TestKey, _Entry]]:
+        timestamp: Optional[str] = None
+
+        def entries() -> Iterator[_Entry]:
+            nonlocal timestamp
+            for key, value in self.reader.iter_report(baseline):
+                if key == "results":
+                    yield _entry_from_dict(value)
+                elif key == "timestamp":
+                    timestamp = value
+
+        index = dict(_keyed(entries()))
+        return timestamp, index
+
+    def _diff(
+        self,
+        baseline: Path,
+        current: Iterable[_Entry],
+        current_timestamp: Optional[str],
+    ) -> ReportDiff:
+        baseline_timestamp, index = self._index_baseline(baseline)
+        changes: List[TestChange] = []
+        compared = 0
+
+        for key, entry in _keyed(current):
+            previous = index.pop(key, None)
+            if previous is None:
+                changes.append(
+                    TestChange(
+                        name=entry.name, type=ChangeType.NEW, current=entry.status
+                    )
+                )
+                continue
+            compared += 1
+            changes.extend(self._compare(previous, entry))
+
+        # Whatever was not matched by the join only exists in the baseline.
+        for entry in index.values():
+            changes.append(
+                TestChange(
+                    name=entry.name, type=ChangeType.REMOVED, baseline=entry.status
+                )
+            )
+        return ReportDiff(
+            baseline_timestamp=baseline_timestamp,
+            current_timestamp=current_timestamp,
+            compared=compared,
+            changes=changes,
+        )
+
+    def _compare(self, baseline: _Entry, current: _Entry) -> Iterator[TestChange]:
+        if baseline.status != current.status:
+            if current.status == ResultType.FAILED.value:
+                change_type = ChangeType.NEW_FAILURE
+            elif baseline.status == ResultType.FAILED.value:
+                change_type = ChangeType.FIXED
+            else:
+                change_type = ChangeType.STATUS_CHANGED
+            yield TestChange(
+                name=current.name,
+                type=change_type,
+                baseline=baseline.status,
+                current=current.status,
+            )
+
+        if (
+            baseline.duration is not None
+            and current.duration is not None
+            and abs(current.duration - baseline.duration) >= self.min_duration_delta
+            and _relative_change(baseline.duration, current.duration)
+            >= self.duration_threshold
+        ):
+            yield TestChange(
+                name=current.name,
+                type=ChangeType.DURATION,
+                baseline=baseline.duration,
+                current=current.duration,
+            )
+
+        for detail, actual in current.actuals.items():
+            previous = baseline.actuals.get(detail)
+            if (
+                previous is not None
+                and _relative_change(previous, actual) >= self.actual_threshold
+            ):
+                yield TestChange(
+                    name=current.name,
+                    type=ChangeType.ACTUAL,
+                    baseline=previous,
+                    current=actual,
+                    detail=detail,
+                )
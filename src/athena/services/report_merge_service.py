@@ -0,0 +1,364 @@
+import heapq
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime
+from itertools import groupby, repeat
+from numbers import Real
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from athena.models.fleet_summary import FleetSummary
+from athena.models.fleet_test_stats import FleetTestStats
+from athena.models.numeric_stats import NumericStats
+from athena.models.test_result import ResultType
+from athena.services.report_reader_service import ReportReaderService
+
+DEFAULT_MAX_WORKERS = os.cpu_count() or 1
+DEFAULT_RUN_SIZE = 50_000
+DEFAULT_FAN_IN = 128
+DEFAULT_MAX_FAILING_HOSTS = 20
+DEFAULT_MOST_FAILING = 20
+# Shared compact encoder: json.dumps builds a new one for every call
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+# The umask can only be read by setting it: done once, on import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class _ReportRuns(NamedTuple):
+    host: str
+    results: int
+    runs: List[str]
+
+
+def _numeric(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, Real):
+        return None
+    return float(value)
+
+
+def _record(name: str, host: str, result: Dict[str, Any]) -> str:
+    """Serialize a result as a line of a sorted run.
+
+    Lines hold three tab-separated JSON values: the ``[name, host]`` sort
+    key, the few fields the fleet statistics need and the result itself.
+    Compact JSON never contains a raw tab, and comparing lines as strings
+    keeps the lines of a test together, so runs are sorted and merged
+    without being decoded.
+    """
+    outcome = result.get("result") or {}
+    actual = {
+        key: value
+        for key, detail in (outcome.get("details") or {}).items()
+        if (value := _numeric((detail or {}).get("actual"))) is not None
+    }
+    stats = [outcome.get("type"), _numeric(result.get("duration")), actual]
+    return "\t".join(
+        (_ENCODER.encode([name, host]), _ENCODER.encode(stats), _ENCODER.encode(result))
+    )
+
+
+def _write_run(records: List[str], directory: str) -> str:
+    records.sort()
+    fd, path = tempfile.mkstemp(dir=directory, suffix=".run")
+    with os.fdopen(fd, "w") as f:
+        for record in records:
+            f.write(record)
+            f.write("\n")
+    return path
+
+
+def _merge_lines(stack: ExitStack, runs: List[str]) -> Iterator[str]:
+    return heapq.merge(*(stack.enter_context(open(run)) for run in runs))
+
+
+def _sort_report(report: str, directory: str, run_size: int) -> _ReportRuns:
+    """Split a report into runs of results sorted by test name and host.
+
+    Runs in a worker process and holds at most ``run_size`` results at once.
+    Reports written before hosts were recorded are named after their file.
+    """
+    host: Optional[str] = None
+    records: List[str] = []
+    runs: List[str] = []
+    count = 0
+    for key, value in ReportReaderService().iter_report(Path(report)):
+        if key == "host":
+            host = value
+        elif key == "results":
+            if host is None:
+                host = Path(report).stem
+            records.append(_record(value["config"]["name"], host, value))
+            count += 1
+            if len(records) >= run_size:
+                runs.append(_write_run(records, directory))
+                records = []
+    if records:
+        runs.append(_write_run(records, directory))
+    return _ReportRuns(host or Path(report).stem, count, runs)
+
+
+def _merge_runs(runs: List[str], directory: str) -> str:
+    """Merge sorted runs into a single sorted run; runs in a worker process."""
+    fd, path = tempfile.mkstemp(dir=directory, suffix=".run")
+    with ExitStack() as stack, os.fdopen(fd, "w") as f:
+        f.writelines(_merge_lines(stack, runs))
+    for run in runs:
+        os.unlink(run)
+    return path
+
+
+class _RunningStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def result(self) -> NumericStats:
+        return NumericStats(
+            count=self.count,
+            min=self.minimum,
+            max=self.maximum,
+            mean=self.total / self.count,
+        )
+
+
+class _TestAccumulator:
+    """Fleet statistics of one test, fed its results in host order."""
+
+    def __init__(self, name: str, max_failing_hosts: int) -> None:
+        self.name = name
+        self.max_failing_hosts = max_failing_hosts
+        self.runs = 0
+        self.hosts = 0
+        self.counts = {result_type.value: 0 for result_type in ResultType}
+        self.failing_hosts: List[str] = []
+        self.failing_host_count = 0
+        self.duration = _RunningStats()
+        self.actual: Dict[str, _RunningStats] = {}
+        self._last_host: Optional[str] = None
+        self._last_failing_host: Optional[str] = None
+
+    def add(
+        self,
+        host: str,
+        status: Optional[str],
+        duration: Optional[float],
+        actual: Dict[str, float],
+    ) -> None:
+        self.runs += 1
+        if host != self._last_host:
+            self.hosts += 1
+            self._last_host = host
+
+        if status in self.counts:
+            self.counts[status] += 1
+        if status == ResultType.FAILED.value and host != self._last_failing_host:
+            self._last_failing_host = host
+            self.failing_host_count += 1
+            if len(self.failing_hosts) < self.max_failing_hosts:
+                self.failing_hosts.append(host)
+
+        if duration is not None:
+            self.duration.add(duration)
+        for key, value in actual.items():
+            if key not in self.actual:
+                self.actual[key] = _RunningStats()
+            self.actual[key].add(value)
+
+    def result(self) -> FleetTestStats:
+        return FleetTestStats(
+            name=self.name,
+            runs=self.runs,
+            hosts=self.hosts,
+            passed=self.counts[ResultType.PASSED.value],
+            failed=self.counts[ResultType.FAILED.value],
+            skipped=self.counts[ResultType.SKIPPED.value],
+            failing_hosts=self.failing_hosts,
+            failing_host_count=self.failing_host_count,
+            duration=self.duration.result() if self.duration.count else None,
+            actual={key: stats.result() for key, stats in self.actual.items()},
+        )
+
+
+class ReportMergeService:
+    """Component responsible for merging the JSON reports of many hosts.
+
+    Reports are merged as an external sort: worker processes stream each
+    report and write its results as runs sorted by test name and host, then
+    the runs are merged k-way. At most ``fan_in`` runs are open at once;
+    beyond that, runs are first merged in groups, in parallel. Memory stays
+    bounded by ``run_size`` results per worker whatever the number and size
+    of the reports.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        run_size: int = DEFAULT_RUN_SIZE,
+        fan_in: int = DEFAULT_FAN_IN,
+        max_failing_hosts: int = DEFAULT_MAX_FAILING_HOSTS,
+        most_failing: int = DEFAULT_MOST_FAILING,
+    ) -> None:
+        """Initialize the report merge service.
+
+        Args:
+            max_workers: Maximum number of processes decoding reports
+            run_size: Maximum number of results sorted in memory per worker
+            fan_in: Maximum number of sorted runs merged at once
+            max_failing_hosts: Failing hosts listed per test, at most
+            most_failing: Number of most failing tests kept in the summary
+        """
+        if fan_in < 2:
+            raise ValueError("fan_in must be at least 2")
+        self.max_workers = max_workers
+        self.run_size = run_size
+        self.fan_in = fan_in
+        self.max_failing_hosts = max_failing_hosts
+        self.most_failing = most_failing
+
+    def discover(self, paths: Sequence[Path]) -> List[Path]:
+        """Expand directories and glob patterns into JSON report files."""
+        return ReportReaderService().discover(paths)
+
+    def merge(self, paths: Sequence[Path], output: Path) -> FleetSummary:
+        """Merge JSON reports into a fleet report.
+
+        The fleet report holds every result, tagged with its host and sorted
+        by test name and host, the statistics of each test across the fleet
+        and the overall totals. It is written atomically.
+
+        Args:
+            paths: JSON reports, directories of reports or glob patterns
+            output: Path of the fleet report
+
+        Returns:
+            The totals of the merge and the most failing tests
+
+        Raises:
+            ValueError: If no report is found or a report is not valid JSON
+        """
+        reports = self.discover(paths)
+        if not reports:
+            raise ValueError("No reports found")
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(
+            prefix=".athena-merge-", dir=output.parent
+        ) as directory:
+            workers = max(1, min(self.max_workers, len(reports)))
+            with ProcessPoolExecutor(workers) as pool:
+                sorted_reports = list(
+                    pool.map(
+                        _sort_report,
+                        [str(report) for report in reports],
+                        repeat(directory),
+                        repeat(self.run_size),
+                        chunksize=max(1, len(reports) // (workers * 4)),
+                    )
+                )
+                runs = [run for report in sorted_reports for run in report.runs]
+                while len(runs) > self.fan_in:
+                    groups = [
+                        runs[start : start + self.fan_in]
+                        for start in range(0, len(runs), self.fan_in)
+                    ]
+                    runs = list(pool.map(_merge_runs, groups, repeat(directory)))
+
+            hosts = sorted({report.host for report in sorted_reports})
+            return self._write(output, directory, runs, len(reports), hosts)
+
+    def _write(
+        self,
+        output: Path,
+        directory: str,
+        runs: List[str],
+        reports: int,
+        hosts: List[str],
+    ) -> FleetSummary:
+        """Merge the final runs into the fleet report, one test at a time."""
+        counts = {result_type.value: 0 for result_type in ResultType}
+        results = 0
+        most_failing: List[Tuple[int, str, FleetTestStats]] = []
+        timestamp = datetime.now().isoformat()
+
+        tests_fd, _ = tempfile.mkstemp(dir=directory, suffix=".tests")
+        fd, tmp_path = tempfile.mkstemp(dir=output.parent, prefix=f".{output.name}.")
+        try:
+            with ExitStack() as stack:
+                f = stack.enter_context(os.fdopen(fd, "w"))
+                tests = stack.enter_context(os.fdopen(tests_fd, "w+"))
+                f.write(f'{{"timestamp":{json.dumps(timestamp)},')
+                f.write(f'"reports":{reports},"hosts":{json.dumps(hosts)},')
+                f.write('"results":[')
+
+                records = (
+                    (*json.loads(key), stats, result)
+                    for key, stats, result in (
+                        line.rstrip("\n").split("\t", 2)
+                        for line in _merge_lines(stack, runs)
+                    )
+                )
+                for name, group in groupby(records, key=itemgetter(0)):
+                    accumulator = _TestAccumulator(name, self.max_failing_hosts)
+                    for _, host, stats, result in group:
+                        # Tag the result with its host without decoding it
+                        f.write(",\n" if results else "\n")
+                        f.write(f'{{"host":{json.dumps(host)},{result[1:]}')
+                        accumulator.add(host, *json.loads(stats))
+                        results += 1
+                    test_stats = accumulator.result()
+                    for status in counts:
+                        counts[status] += accumulator.counts[status]
+                    tests.write(test_stats.model_dump_json())
+                    tests.write("\n")
+                    if test_stats.failed and self.most_failing:
+                        entry = (test_stats.failed, name, test_stats)
+                        if len(most_failing) < self.most_failing:
+                            heapq.heappush(most_failing, entry)
+                        elif entry[:2] > most_failing[0][:2]:
+                            heapq.heapreplace(most_failing, entry)
+
+                f.write('\n],"tests":[')
+                tests.seek(0)
+                for index, line in enumerate(tests):
+                    f.write(",\n" if index else "\n")
+                    f.write(line.rstrip("\n"))
+                f.write("\n],")
+
+                summary = FleetSummary(
+                    timestamp=timestamp,
+                    reports=reports,
+                    hosts=len(hosts),
+                    results=results,
+                    passed=counts[ResultType.PASSED.value],
+                    failed=counts[ResultType.FAILED.value],
+                    skipped=counts[ResultType.SKIPPED.value],
+                    most_failing=tuple(
+                        test_stats
+                        for _, _, test_stats in sorted(
+                            most_failing, key=lambda entry: (-entry[0], entry[1])
+                        )
+                    ),
+                )
+                totals = summary.model_dump(exclude={"timestamp", "most_failing"})
+                f.write(f'"summary":{json.dumps(totals)}}}\n')
+            # mkstemp creates files readable by their owner only; give the
+            # report the mode open() would
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, output)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return summary
@@ -0,0 +1,142 @@
+import glob
+import json
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Sequence, Tuple
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+_GLOB_CHARACTERS = set("*?[")
+_WHITESPACE = " \t\n\r"
+
+
+class _Buffer:
+    """Sliding window over a text stream used by the incremental decoder."""
+
+    def __init__(self, stream: IO[str], chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int = 0) -> bool:
+        """Read more data, dropping the consumed prefix. Returns False at EOF."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(max(size, self.chunk_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON report")
+
+    def expect(self, char: str) -> None:
+        if (found := self.peek()) != char:
+            raise ValueError(f"Expected '{char}' in JSON report, found '{found}'")
+        self.pos += 1
+
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        """Decode the next complete JSON value, reading more data as needed."""
+        self.peek()
+        grow = self.chunk_size
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill(grow):
+                    raise
+                grow *= 2
+                continue
+            # A number cut at the end of the window decodes successfully but
+            # may be incomplete; make sure the value is really terminated.
+            if end == len(self.text) and self.fill(grow):
+                continue
+            self.pos = end
+            return value
+
+
+class ReportReaderService:
+    """Stream test results out of JSON reports without loading them whole.
+
+    Reports written by the ``json`` reporter hold a top-level object whose
+    ``results`` array can contain hundreds of thousands of entries. The reader
+    decodes that array one element at a time, so memory use is bounded by the
+    largest single result rather than by the size of the report.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+
+    def discover(self, paths: Sequence[Path]) -> List[Path]:
+        """Expand directories and glob patterns into JSON report files."""
+        reports: List[Path] = []
+        for pattern in paths:
+            matches = (
+                [Path(path) for path in sorted(glob.glob(str(pattern), recursive=True))]
+                if _GLOB_CHARACTERS.intersection(str(pattern))
+                else [pattern]
+            )
+            for path in matches:
+                if path.is_dir():
+                    reports.extend(sorted(path.glob("*.json")))
+                else:
+                    reports.append(path)
+        return list(dict.fromkeys(reports))
+
+    def iter_report(self, report: Path) -> Iterator[Tuple[str, Any]]:
+        """Iterate over the top-level entries of a JSON report.
+
+        Every element of the ``results`` array is yielded separately as a
+        ``("results", result)`` pair; other entries are yielded as
+        ``(key, value)`` pairs in file order.
+
+        Args:
+            report: Path of the JSON report
+
+        Raises:
+            ValueError: If the report is not a JSON object
+        """
+        with report.open() as stream:
+            buffer = _Buffer(stream, self.chunk_size)
+            buffer.expect("{")
+            if buffer.peek() == "}":
+                return
+            while True:
+                key = buffer.decode(self._decoder)
+                buffer.expect(":")
+                if key == "results" and buffer.peek() == "[":
+                    yield from self._iter_array(buffer, key)
+                else:
+                    yield key, buffer.decode(self._decoder)
+                if buffer.peek() == "}":
+                    return
+                buffer.expect(",")
+
+    def iter_results(self, report: Path) -> Iterator[Dict[str, Any]]:
+        """Iterate over the serialized test results of a JSON report."""
+        for key, value in self.iter_report(report):
+            if key == "results":
+                yield value
+
+    def _iter_array(self, buffer: _Buffer, key: str) -> Iterator[Tuple[str, Any]]:
+        buffer.expect("[")
+        if buffer.peek() == "]":
+            buffer.pos += 1
+            return
+        while True:
+            yield key, buffer.decode(self._decoder)
+            if buffer.peek() == "]":
+                buffer.pos += 1
+                return
+            buffer.expect(",")
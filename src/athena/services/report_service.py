@@ -1,30 +1,182 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional
+
 from athena.models import BaseModel
+from athena.models.reporter_config import ReporterConfig
 from athena.models.test_suite_config import TestSuiteConfig
 from athena.models.test_suite_summary import TestSuiteSummary
 from athena.protocols.plugin_service_protocol import PluginServiceProtocol
 from athena.types import ReporterPluginResult
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_REPORTER_TIMEOUT = 60.0
+
+
+class _ReporterJob:
+    """A reporter invocation submitted to the worker pool."""
+
+    def __init__(
+        self,
+        report: ReporterConfig,
+        call: Callable[[], ReporterPluginResult],
+        timeout: Optional[float],
+    ) -> None:
+        self.report = report
+        self.call = call
+        self.timeout = timeout
+        self.started_at: Optional[float] = None
+
+    def __call__(self) -> ReporterPluginResult:
+        # Timeouts run from the start of the reporter, not from its submission
+        self.started_at = time.monotonic()
+        return self.call()
+
 
 class ReportService:
-    """Component responsible for generating reports."""
+    """Component responsible for generating reports.
+
+    Reporters are independent of each other, so they run concurrently on a
+    small pool of worker threads. Each reporter is bounded by a timeout, and a
+    failing or timed-out reporter never prevents the others from completing.
+    A thread cannot be interrupted: a timed-out reporter is abandoned but
+    keeps its worker, and the process, busy until it returns.
+    """
 
     def __init__(
         self,
         plugin_service: PluginServiceProtocol[ReporterPluginResult, BaseModel],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: Optional[float] = DEFAULT_REPORTER_TIMEOUT,
     ) -> None:
+        """Initialize the report service.
+
+        Args:
+            plugin_service: Registry of the available reporter plugins
+            max_workers: Maximum number of reporters running at the same time
+            timeout: Default number of seconds a reporter may run, measured
+                from the moment it starts; ``None`` disables the limit. A
+                reporter config may override it with its own ``timeout``.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self.plugin_service = plugin_service
+        self.max_workers = max_workers
+        self.timeout = timeout
 
     def generate_reports(
         self, config: TestSuiteConfig, summary: TestSuiteSummary
     ) -> None:
-        """Generate reports using the configured reporters."""
+        """Generate reports using the configured reporters.
+
+        The summary is an immutable snapshot, so the same instance is handed
+        to every reporter instead of being rebuilt for each one.
+
+        Raises:
+            RuntimeError: If one or more reporters failed or timed out, after
+                every other reporter has had the chance to complete
+        """
+        failures: List[str] = []
+        jobs: List[_ReporterJob] = []
+
+        # Resolve and validate every reporter up front: configuration errors
+        # are cheap to detect and should not occupy a worker.
         for report in config.reports:
-            plugin = self.plugin_service.get_plugin(report.plugin_identifier)
-            plugin.executor(
-                plugin.parameters_model(
+            try:
+                plugin = self.plugin_service.get_plugin(report.plugin_identifier)
+                parameters = plugin.parameters_model(
                     **{
                         "summary": summary,
                         **report.parameters,
                     },
                 )
+            except Exception:
+                logger.exception("Reporter '%s' is misconfigured", report.name)
+                failures.append(report.name)
+                continue
+            jobs.append(
+                _ReporterJob(
+                    report,
+                    partial(plugin.executor, parameters),
+                    report.timeout if report.timeout is not None else self.timeout,
+                )
             )
+
+        if jobs:
+            failures.extend(self._run_jobs(jobs))
+
+        if failures:
+            raise RuntimeError(
+                f"{len(failures)} reporter(s) failed: {', '.join(failures)}"
+            )
+
+    def _run_jobs(self, jobs: List[_ReporterJob]) -> List[str]:
+        """Run reporter jobs concurrently and return the names that failed."""
+        failures: List[str] = []
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(jobs)),
+            thread_name_prefix="athena-reporter",
+        )
+        pending: Dict[Future[ReporterPluginResult], _ReporterJob] = {
+            pool.submit(job): job for job in jobs
+        }
+
+        try:
+            while pending:
+                done, _ = wait(
+                    pending,
+                    timeout=self._next_deadline(pending.values()),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    job = pending.pop(future)
+                    if (error := future.exception()) is not None:
+                        logger.error(
+                            "Reporter '%s' failed",
+                            job.report.name,
+                            exc_info=error,
+                        )
+                        failures.append(job.report.name)
+
+                now = time.monotonic()
+                for future, job in list(pending.items()):
+                    if (
+                        job.started_at is None
+                        or job.timeout is None
+                        or now < job.started_at + job.timeout
+                    ):
+                        continue
+                    logger.error(
+                        "Reporter '%s' timed out after %ss",
+                        job.report.name,
+                        job.timeout,
+                    )
+                    del pending[future]
+                    failures.append(job.report.name)
+        finally:
+            # Never wait for abandoned reporters
+            pool.shutdown(wait=False)
+
+        return failures
+
+    @staticmethod
+    def _next_deadline(jobs: Iterable[_ReporterJob]) -> Optional[float]:
+        """Seconds until the earliest pending job may exceed its timeout.
+
+        Jobs still queued have not started their clock yet; ``now + timeout``
+        is a lower bound of their deadline, so waking up then is enough to
+        pick up their real start time.
+        """
+        now = time.monotonic()
+        deadlines = [
+            (job.started_at if job.started_at is not None else now) + job.timeout
+            for job in jobs
+            if job.timeout is not None
+        ]
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - now)
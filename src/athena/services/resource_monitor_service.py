@@ -0,0 +1,119 @@
+import sys
+import tracemalloc
+from types import TracebackType
+from typing import NamedTuple, Optional, Type
+
+import psutil
+
+from athena.models.resource_usage import ResourceUsage
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore[assignment]
+
+# ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+class _Snapshot(NamedTuple):
+    cpu_user: float
+    cpu_system: float
+    peak_rss: int
+    traced: Optional[int]
+
+
+class ResourceMonitorService:
+    """Measure the resources a runner consumes while it executes a test.
+
+    CPU time covers the whole process, including helper threads a runner
+    starts, and the child processes it waits for, such as commands. With
+    ``per_thread``, meant for tests executed concurrently, CPU time is only
+    read for the calling thread where the platform supports it, so tests
+    running on other threads are not attributed to the test being measured;
+    helper threads are then missed. Child processes are always counted, and
+    a child of a concurrent test that ends during the measurement is counted
+    too, as the platform only reports their total.
+
+    Peak RSS is a high-water mark of this process, children excluded: a test
+    only accounts for the amount by which it raised it. Allocation tracing
+    with tracemalloc is optional as it slows every allocation down. Traced
+    peaks are process-wide too, and each snapshot resets the peak for every
+    thread: with tests running concurrently they would include other tests'
+    allocations or miss part of their own, so tracing is only meant for
+    tests running one at a time.
+
+    The monitor is a context manager: tracemalloc is started on entry, when
+    requested and not already running, and stopped on exit.
+    """
+
+    def __init__(
+        self, trace_allocations: bool = False, per_thread: bool = False
+    ) -> None:
+        self.trace_allocations = trace_allocations
+        self.per_thread = per_thread
+        self._started_tracing = False
+        self._process = psutil.Process() if resource is None else None
+
+    def __enter__(self) -> "ResourceMonitorService":
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def snapshot(self) -> _Snapshot:
+        """Capture the counters a later ``usage_since`` call compares with."""
+        traced: Optional[int] = None
+        if self.trace_allocations and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            traced = tracemalloc.get_traced_memory()[0]
+        return self._counters(traced)
+
+    def usage_since(self, start: _Snapshot) -> ResourceUsage:
+        """Return the resources consumed since ``start`` was captured."""
+        # Read the traced peak first: capturing counters must not disturb it
+        traced_peak: Optional[int] = None
+        if start.traced is not None and tracemalloc.is_tracing():
+            traced_peak = max(0, tracemalloc.get_traced_memory()[1] - start.traced)
+        end = self._counters(None)
+        return ResourceUsage(
+            cpu_user=max(0.0, end.cpu_user - start.cpu_user),
+            cpu_system=max(0.0, end.cpu_system - start.cpu_system),
+            peak_rss_delta=max(0, end.peak_rss - start.peak_rss),
+            traced_peak=traced_peak,
+        )
+
+    def _counters(self, traced: Optional[int]) -> _Snapshot:
+        if resource is not None:
+            process = resource.getrusage(resource.RUSAGE_SELF)
+            usage = process
+            if self.per_thread and hasattr(resource, "RUSAGE_THREAD"):
+                usage = resource.getrusage(resource.RUSAGE_THREAD)
+            # Terminated child processes that were waited for, in total
+            children = resource.getrusage(resource.RUSAGE_CHILDREN)
+            return _Snapshot(
+                usage.ru_utime + children.ru_utime,
+                usage.ru_stime + children.ru_stime,
+                process.ru_maxrss * _MAXRSS_UNIT,
+                traced,
+            )
+
+        assert self._process is not None
+        cpu_times = self._process.cpu_times()
+        memory = self._process.memory_info()
+        return _Snapshot(
+            cpu_times.user + cpu_times.children_user,
+            cpu_times.system + cpu_times.children_system,
+            getattr(memory, "peak_wset", memory.rss),
+            traced,
+        )
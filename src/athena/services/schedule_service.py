@@ -0,0 +1,165 @@
+import logging
+import statistics
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from athena.models.planned_test import PlannedTest
+from athena.models.test_result import ResultType
+from athena.services.report_reader_service import ReportReaderService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY = Path("athena_report_*.json")
+DEFAULT_MAX_REPORTS = 20
+# Weight of the newest report in the running averages of a test
+DEFAULT_WEIGHT = 0.5
+
+
+class SchedulePolicy(str, Enum):
+    """Order in which the tests of a run are started."""
+
+    CONFIG = "config"  # Configuration order
+    LONGEST_FIRST = "longest"  # Longest expected duration first
+    FAILING_FIRST = "failing"  # Most recently failing first, then longest
+
+
+class _TestHistory:
+    """Exponentially weighted duration and failure rate of one test."""
+
+    __slots__ = ("duration", "failure_rate")
+
+    def __init__(self) -> None:
+        self.duration: Optional[float] = None
+        self.failure_rate: Optional[float] = None
+
+    def add(self, duration: Optional[float], status: str, weight: float) -> None:
+        if isinstance(duration, (int, float)) and not isinstance(duration, bool):
+            self.duration = (
+                duration
+                if self.duration is None
+                else self.duration + weight * (duration - self.duration)
+            )
+        # A skipped test says nothing about how often the test fails
+        if status in (ResultType.PASSED.value, ResultType.FAILED.value):
+            failed = float(status == ResultType.FAILED.value)
+            self.failure_rate = (
+                failed
+                if self.failure_rate is None
+                else self.failure_rate + weight * (failed - self.failure_rate)
+            )
+
+
+class ScheduleService:
+    """Component responsible for ordering tests from previous reports.
+
+    The newest ``max_reports`` JSON reports are streamed from the oldest to
+    the newest, folding each test's duration and failure rate into running
+    averages that favour recent runs. Tests are keyed by name; tests without
+    history are expected to last the median duration and never to fail.
+    """
+
+    def __init__(
+        self,
+        policy: SchedulePolicy,
+        history: Sequence[Path] = (DEFAULT_HISTORY,),
+        reader: Optional[ReportReaderService] = None,
+        max_reports: int = DEFAULT_MAX_REPORTS,
+        weight: float = DEFAULT_WEIGHT,
+    ) -> None:
+        """Initialize the schedule service.
+
+        Args:
+            policy: Order in which tests are started
+            history: JSON reports, directories of reports or glob patterns
+            reader: Reader used to stream JSON reports
+            max_reports: Number of most recent reports taken into account
+            weight: Weight of each report against the reports before it
+        """
+        self.policy = policy
+        self.history = history
+        self.reader = reader or ReportReaderService()
+        self.max_reports = max_reports
+        self.weight = weight
+
+    def order(self, tests: Sequence[PlannedTest]) -> List[int]:
+        """Return the positions of the tests in the order to start them.
+
+        ``longest`` starts the longest tests first, which keeps a slow test
+        from being the last one running on a busy pool. ``failing`` starts
+        recently failing tests first, so breakage is found early; ties are
+        broken by duration. Tests with equal keys keep configuration order.
+        """
+        positions = list(range(len(tests)))
+        if self.policy == SchedulePolicy.CONFIG or not tests:
+            return positions
+
+        history = self.load_history()
+        durations = [h.duration for h in history.values() if h.duration is not None]
+        default_duration = statistics.median(durations) if durations else 0.0
+
+        def duration(position: int) -> float:
+            entry = history.get(tests[position].config.name)
+            if entry is None or entry.duration is None:
+                return default_duration
+            return entry.duration
+
+        def failure_rate(position: int) -> float:
+            entry = history.get(tests[position].config.name)
+            if entry is None or entry.failure_rate is None:
+                return 0.0
+            return entry.failure_rate
+
+        if self.policy == SchedulePolicy.LONGEST_FIRST:
+            return sorted(positions, key=lambda position: -duration(position))
+        return sorted(
+            positions,
+            key=lambda position: (-failure_rate(position), -duration(position)),
+        )
+
+    def load_history(self) -> Dict[str, _TestHistory]:
+        """Fold the most recent reports into the history of each test."""
+        reports = self._recent_reports()
+        history: Dict[str, _TestHistory] = {}
+        for report in reports:
+            try:
+                for result in self.reader.iter_results(report):
+                    name = result["config"]["name"]
+                    if name not in history:
+                        history[name] = _TestHistory()
+                    history[name].add(
+                        result.get("duration"),
+                        result["result"]["type"],
+                        self.weight,
+                    )
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.warning("Ignoring unreadable report '%s'", report)
+        logger.debug(
+            "Loaded the history of %d tests from %d reports", len(history), len(reports)
+        )
+        return history
+
+    def _recent_reports(self) -> List[Path]:
+        """The newest reports, from the oldest to the newest."""
+        dated = []
+        for report in self.reader.discover(self.history):
+            timestamp = self._timestamp(report)
+            if timestamp is not None:
+                dated.append((timestamp, report))
+        dated.sort()
+        return [report for _, report in dated[-self.max_reports :]]
+
+    def _timestamp(self, report: Path) -> Optional[str]:
+        """Read the timestamp heading a report, its mtime if it has none."""
+        try:
+            for key, value in self.reader.iter_report(report):
+                if key == "timestamp" and isinstance(value, str):
+                    return value
+                if key == "results":
+                    break
+            mtime = report.stat().st_mtime
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable report '%s'", report)
+            return None
+        return datetime.fromtimestamp(mtime).isoformat()
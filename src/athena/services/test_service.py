@@ -1,64 +1,221 @@
-from typing import Any, Dict, List
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 from athena.models import BaseModel
-from athena.models.test_config import TestConfig
+from athena.models.execution_plan import ExecutionPlan
+from athena.models.planned_test import PlannedTest
+from athena.models.plugin import Plugin
+from athena.models.resource_budget import BudgetAction, ResourceBudget
+from athena.models.resource_usage import ResourceUsage
+from athena.models.test_result import TestResult
 from athena.models.test_result_summary import TestResultSummary
-from athena.models.test_suite_config import TestSuiteConfig
-from athena.protocols.plugin_service_protocol import PluginServiceProtocol
 from athena.protocols.test_service_protocol import TestServiceProtocol
+from athena.services.repeat_service import RepeatService
+from athena.services.resource_monitor_service import ResourceMonitorService
+from athena.services.schedule_service import ScheduleService
 from athena.types import TestRunnerPluginResult
 
+logger = logging.getLogger(__name__)
+
+_MEGABYTE = 1024 * 1024
+_RunnerPlugin = Plugin[TestRunnerPluginResult, BaseModel]
+
 
 class TestService(TestServiceProtocol):
     """Component responsible for executing tests."""
 
     def __init__(
         self,
-        plugin_service: PluginServiceProtocol[TestRunnerPluginResult, BaseModel],
+        repeat_service: Optional[RepeatService] = None,
+        schedule_service: Optional[ScheduleService] = None,
     ) -> None:
-        self.plugin_service = plugin_service
+        self.repeat_service = repeat_service or RepeatService()
+        self.schedule_service = schedule_service
 
-    def run_tests(self, config: TestSuiteConfig) -> List[TestResultSummary]:
-        """Execute tests based on the configuration."""
-        results: List[TestResultSummary] = []
+    def run_tests(self, plan: ExecutionPlan) -> List[TestResultSummary]:
+        """Execute the tests of a compiled plan.
 
-        for test_config in config.tests:
-            # Merge global parameters with test-specific ones
-            merged_params = self.merge_parameters(
-                config.parameters or {}, test_config.parameters or {}
-            )
+        Plugins are resolved and parameters validated by the plan, so each
+        test only dispatches to its runner. The resources consumed by every
+        executor call are recorded and checked against the suite's budgets;
+        a repeated test is measured across all of its runs.
 
-            # Create a new test config to avoid modifying the original
-            test_config_copy = TestConfig(
-                name=test_config.name,
-                plugin_identifier=test_config.plugin_identifier,
-                parameters=merged_params,
+        The runners used by the plan are set up before the first test and
+        torn down after the last one. Tests of a runner whose setup failed
+        are reported as failed without being executed.
+
+        With a suite ``concurrency`` above one, tests run on a thread pool,
+        their CPU time is measured for their own thread and allocations are
+        not traced, as tracemalloc peaks are process-wide.
+        With a schedule service, tests start in the order it chooses. Either
+        way, results are returned in the order of the plan.
+        """
+        concurrency = min(plan.config.concurrency, len(plan.tests))
+        if self.schedule_service is not None:
+            order = self.schedule_service.order(plan.tests)
+        else:
+            order = list(range(len(plan.tests)))
+        tests = [plan.tests[position] for position in order]
+        trace_allocations = plan.config.trace_allocations
+        if trace_allocations and concurrency > 1:
+            logger.warning(
+                "Allocation tracing disabled: traced peaks cannot be told apart "
+                "between tests running concurrently"
             )
+            trace_allocations = False
+        started, setup_errors = self._setup_suite(plan)
+
+        try:
+            with ResourceMonitorService(
+                trace_allocations, per_thread=concurrency > 1
+            ) as monitor:
+                run_test = partial(
+                    self._run_test, monitor, plan.config.budgets, setup_errors
+                )
+                if concurrency <= 1:
+                    summaries = [run_test(test) for test in tests]
+                else:
+                    with ThreadPoolExecutor(
+                        concurrency, thread_name_prefix="athena-test"
+                    ) as pool:
+                        summaries = list(pool.map(run_test, tests))
+        finally:
+            self._teardown_suite(plan, started)
+
+        by_position = dict(zip(order, summaries))
+        return [by_position[position] for position in range(len(tests))]
+
+    def _setup_suite(
+        self, plan: ExecutionPlan
+    ) -> Tuple[List[_RunnerPlugin], Dict[str, str]]:
+        """Set up every runner the plan uses, once even if it has aliases.
+
+        Returns:
+            The plugins set up successfully, and the setup error message of
+            each identifier whose runner failed to set up
+        """
+        started: List[_RunnerPlugin] = []
+        # Setup error per plugin, None on success; aliases share one plugin
+        outcomes: Dict[int, Optional[str]] = {}
+        errors: Dict[str, str] = {}
+        for identifier, plugin in plan.plugins.items():
+            if id(plugin) not in outcomes:
+                outcomes[id(plugin)] = self._setup_plugin(plugin, plan)
+                if outcomes[id(plugin)] is None:
+                    started.append(plugin)
+            if (error := outcomes[id(plugin)]) is not None:
+                errors[identifier] = error
+        return started, errors
+
+    def _setup_plugin(
+        self, plugin: _RunnerPlugin, plan: ExecutionPlan
+    ) -> Optional[str]:
+        if plugin.setup_suite is None:
+            return None
+        try:
+            plugin.setup_suite(plan.config)
+        except Exception as e:
+            logger.exception("Suite setup of runner '%s' failed", plugin.metadata.name)
+            return f"Suite setup of runner '{plugin.metadata.name}' failed: {e}"
+        return None
 
-            plugin = self.plugin_service.get_plugin(test_config.plugin_identifier)
-            test_result = plugin.executor(
-                plugin.parameters_model(**test_config_copy.parameters)
+    def _teardown_suite(
+        self, plan: ExecutionPlan, started: List[_RunnerPlugin]
+    ) -> None:
+        """Tear runners down in reverse setup order, logging any failure."""
+        for plugin in reversed(started):
+            if plugin.teardown_suite is None:
+                continue
+            try:
+                plugin.teardown_suite(plan.config)
+            except Exception:
+                logger.exception(
+                    "Suite teardown of runner '%s' failed", plugin.metadata.name
+                )
+
+    def _run_test(
+        self,
+        monitor: ResourceMonitorService,
+        budgets: Dict[str, ResourceBudget],
+        setup_errors: Dict[str, str],
+        test: PlannedTest,
+    ) -> TestResultSummary:
+        if (setup_error := setup_errors.get(test.config.plugin_identifier)) is not None:
+            return TestResultSummary(
+                config=test.config, result=TestResult.failed(message=setup_error)
             )
-            result_summary = TestResultSummary(
-                config=test_config_copy, result=test_result
+
+        snapshot = monitor.snapshot()
+        started = time.perf_counter()
+        if test.config.repeat > 1:
+            test_result = self.repeat_service.run(test)
+        else:
+            test_result = test.plugin.executor(test.parameters)
+        duration = time.perf_counter() - started
+        resources = monitor.usage_since(snapshot)
+
+        budget = budgets.get(test.config.plugin_identifier, budgets.get("*"))
+        if budget is not None:
+            test_result, resources = self.apply_budget(
+                budget, test_result, resources, runs=test.config.repeat
             )
-            results.append(result_summary)
 
-        return results
+        return TestResultSummary(
+            config=test.config,
+            result=test_result,
+            duration=duration,
+            resources=resources,
+        )
 
-    def merge_parameters(
+    def apply_budget(
         self,
-        global_params: Dict[str, Any],
-        test_params: Dict[str, Any],
-    ) -> Dict[str, Any]:
-        """Merge global and test-specific parameters with proper precedence."""
-        if not global_params and not test_params:
-            return {}
-
-        merged_params = {}
-        if global_params:
-            merged_params = global_params.copy()
-        if test_params:
-            merged_params.update(test_params)
-
-        return merged_params
+        budget: ResourceBudget,
+        result: TestResult,
+        resources: ResourceUsage,
+        runs: int = 1,
+    ) -> Tuple[TestResult, ResourceUsage]:
+        """Check a test's resource usage against its runner's budget.
+
+        Budgets apply to each run of a repeated test: its CPU time is divided
+        by the number of runs, while its memory peaks already are the highest
+        of any run.
+
+        Returns:
+            The test result, failed if the budget is exceeded and its action
+            is ``fail``, and the resource usage listing the exceeded limits
+        """
+        limits: Dict[str, Tuple[Optional[float], float, str]] = {
+            "cpu per run" if runs > 1 else "cpu": (
+                budget.cpu_seconds,
+                resources.cpu_time / runs,
+                "s",
+            ),
+            "peak rss": (
+                budget.peak_rss_mb,
+                resources.peak_rss_delta / _MEGABYTE,
+                "MB",
+            ),
+            "traced memory": (
+                budget.traced_mb,
+                (resources.traced_peak or 0) / _MEGABYTE,
+                "MB",
+            ),
+        }
+        exceeded = tuple(
+            f"{name} {used:.3g}{unit} > {limit:g}{unit}"
+            for name, (limit, used, unit) in limits.items()
+            if limit is not None and used > limit
+        )
+        if not exceeded:
+            return result, resources
+
+        resources = resources.model_copy(update={"exceeded": exceeded})
+        if budget.action == BudgetAction.FAIL:
+            message = f"Resource budget exceeded: {', '.join(exceeded)}"
+            if result.message:
+                message = f"{result.message} ({message})"
+            result = TestResult.failed(message=message, details=result.details)
+        return result, resources
@@ -1,32 +1,68 @@
+import time
 from pathlib import Path
+from typing import Optional, Sequence
 
-from athena.models.test_suite_config import TestSuiteConfig
+from athena.models.execution_plan import ExecutionPlan
 from athena.models.test_suite_summary import TestSuiteSummary
 from athena.protocols.config_parser_service_protocol import ConfigParserServiceProtocol
+from athena.protocols.plan_service_protocol import PlanServiceProtocol
 from athena.protocols.report_service_protocol import ReportServiceProtocol
 from athena.protocols.test_service_protocol import TestServiceProtocol
+from athena.selection import TestSelector
 
 
 class TestSuiteService:
     def __init__(
         self,
         data_parser_service: ConfigParserServiceProtocol,
+        plan_service: PlanServiceProtocol,
         test_service: TestServiceProtocol,
         report_service: ReportServiceProtocol,
     ) -> None:
         self.data_parser_service = data_parser_service
+        self.plan_service = plan_service
         self.test_service = test_service
         self.report_service = report_service
 
+    def compile_plan(
+        self,
+        config_paths: Sequence[Path],
+        selector: Optional[TestSelector] = None,
+    ) -> ExecutionPlan:
+        """Load configuration files and compile them into an execution plan.
+
+        Args:
+            config_paths: Configuration files, directories or glob patterns
+            selector: Selection of the tests to plan, all of them if None
+
+        Raises:
+            PlanError: With every problem found if the suite is invalid
+        """
+        test_suite_config = self.data_parser_service.load_suite(config_paths, selector)
+        return self.plan_service.compile(test_suite_config)
+
     def run_tests_from_config(self, config_file: Path) -> None:
         """Run all tests defined in the configuration file."""
-        config = self.data_parser_service.parse(config_file)
-        if not config:
-            raise ValueError("Configuration file is empty")
-        test_suite_config = TestSuiteConfig(**config)
-        results = self.test_service.run_tests(test_suite_config)
+        self.run_tests_from_configs([config_file])
+
+    def run_tests_from_configs(
+        self,
+        config_paths: Sequence[Path],
+        selector: Optional[TestSelector] = None,
+    ) -> None:
+        """Run the tests of several configuration files as one combined run.
+
+        Args:
+            config_paths: Configuration files, directories or glob patterns
+            selector: Selection of the tests to run, all of them if None
+        """
+        plan = self.compile_plan(config_paths, selector)
+
+        started = time.perf_counter()
+        results = self.test_service.run_tests(plan)
+        duration = time.perf_counter() - started
 
         self.report_service.generate_reports(
-            test_suite_config,
-            TestSuiteSummary(results=results),
+            plan.config,
+            TestSuiteSummary(results=results, duration=duration),
         )
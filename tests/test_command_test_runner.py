@@ -0,0 +1,148 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from athena.cli import create_plugin_manager, create_test_suite_service
+from athena.models.test_result import ResultType
+from athena.plugins.builtin.test_runners.command_test_runner import (
+    CommandTestRunner,
+    CommandTestRunnerParameters,
+    _RingBuffer,
+)
+
+posix_only = pytest.mark.skipif(os.name != "posix", reason="POSIX shell required")
+
+
+@pytest.fixture
+def runner():
+    runner = CommandTestRunner()
+    yield runner
+    runner.teardown_suite(None)
+
+
+def test_ring_buffer_keeps_the_end() -> None:
+    buffer = _RingBuffer(8)
+    buffer.write(b"abc")
+    buffer.write(b"def")
+    assert (buffer.text(), buffer.truncated) == ("abcdef", False)
+    buffer.write(b"ghij")
+    assert (buffer.text(), buffer.truncated, buffer.total) == ("cdefghij", True, 10)
+    # A single write larger than the limit replaces everything
+    buffer.write(b"0123456789")
+    assert (buffer.text(), buffer.total) == ("23456789", 20)
+
+
+def test_ring_buffer_exact_limit() -> None:
+    buffer = _RingBuffer(4)
+    buffer.write(b"abcd")
+    assert (buffer.text(), buffer.truncated) == ("abcd", False)
+    buffer.write(b"")
+    assert buffer.text() == "abcd"
+
+
+def test_ring_buffer_cut_character_is_replaced() -> None:
+    buffer = _RingBuffer(3)
+    buffer.write("é!!".encode())  # Two bytes for é, of which one is kept
+    assert buffer.text() == "�!!"
+
+
+def _python(code, **parameters):
+    return CommandTestRunnerParameters(
+        command=[sys.executable, "-c", code], **parameters
+    )
+
+
+def test_output_limit_and_patterns(runner) -> None:
+    result = runner(
+        _python(
+            "import sys; print('start ' + 'x' * 100000 + ' end');"
+            "sys.stderr.write('boom\\n'); sys.exit(3)",
+            output_limit=16,
+            exit_codes=[3],
+            stdout_pattern="x+ end",
+            stderr_pattern="boom",
+        )
+    )
+    assert result.type == ResultType.PASSED
+    assert result.details["stdout"].actual == "x" * 11 + " end"
+    assert result.details["exit_code"].actual == 3
+
+
+def test_failure_message_from_stderr(runner) -> None:
+    result = runner(_python("import sys; sys.exit('went wrong')"))
+    assert result.type == ResultType.FAILED
+    assert result.message == "Exited with code 1: went wrong"
+
+
+def test_timeout(runner) -> None:
+    started = time.monotonic()
+    result = runner(_python("import time; time.sleep(30)", timeout=0.3))
+    assert time.monotonic() - started < 10
+    assert result.type == ResultType.FAILED
+    assert result.message == "Timed out after 0.3s"
+    assert not result.details["exit_code"].success
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+@posix_only
+def test_timeout_kills_the_process_group(runner, tmp_path) -> None:
+    pid_file = tmp_path / "child.pid"
+    result = runner(
+        CommandTestRunnerParameters(
+            command=f"sleep 30 & echo $! > {pid_file}; wait", timeout=0.5
+        )
+    )
+    assert result.message == "Timed out after 0.5s"
+    child = int(pid_file.read_text())
+    deadline = time.monotonic() + 5
+    while _alive(child) and time.monotonic() < deadline:
+        time.sleep(0.05)  # Killed, then reaped by init
+    assert not _alive(child)
+
+
+def test_missing_command(runner, tmp_path) -> None:
+    result = runner(CommandTestRunnerParameters(command=[str(tmp_path / "missing")]))
+    assert result.type == ResultType.FAILED
+    assert result.message.startswith("Could not start command")
+
+
+def test_cwd_kept_without_source(tmp_path) -> None:
+    assert CommandTestRunnerParameters(command="true", cwd="rel").cwd == Path("rel")
+    absolute = CommandTestRunnerParameters.model_validate(
+        {"command": "true", "cwd": str(tmp_path)}, context={"source": "a/b.yaml"}
+    )
+    assert absolute.cwd == tmp_path
+
+
+@posix_only
+def test_cwd_relative_to_config_file(tmp_path, monkeypatch) -> None:
+    suites = tmp_path / "suites"
+    (suites / "work").mkdir(parents=True)
+    (suites / "work" / "marker").write_text("")
+    (suites / "suite.yaml").write_text("""
+tests:
+  - name: in_work
+    plugin_identifier: command
+    parameters: {command: "test -f marker", cwd: work}
+""")
+    monkeypatch.chdir(tmp_path)
+    service = create_test_suite_service(create_plugin_manager())
+    plan = service.compile_plan([Path("suites")])
+
+    (test,) = plan.tests
+    assert test.parameters.cwd == suites / "work"
+    runner = test.plugin.executor
+    try:
+        assert runner(test.parameters).type == ResultType.PASSED
+    finally:
+        runner.teardown_suite(plan.config)
@@ -0,0 +1,170 @@
+import datetime
+import json
+import pickle
+
+import pytest
+
+from athena.cli import create_plugin_manager, create_test_suite_service
+from athena.services import config_parser_service
+from athena.selection import TestSelector as Selector
+
+SUITE = """
+tests:
+  - name: disk_usage
+    plugin_identifier: system
+    tags: [Disk]
+    matrix:
+      disk: [{path: /, threshold: 50}, {path: /, threshold: 90}]
+      region: [eu, us]
+  - name: cpu_usage
+    plugin_identifier: system
+    parameters: {cpu: {threshold: 99}}
+"""
+
+
+@pytest.fixture
+def suite(tmp_path):
+    path = tmp_path / "suite.yaml"
+    path.write_text(SUITE)
+    service = create_test_suite_service(create_plugin_manager())
+    return lambda selector=None: service.data_parser_service.load_suite(
+        [path], selector
+    )
+
+
+def test_matrix_expansion(suite) -> None:
+    names = [test.name for test in suite().tests]
+    assert names == [
+        'disk_usage[disk={"path":"/","threshold":50},region=eu]',
+        'disk_usage[disk={"path":"/","threshold":50},region=us]',
+        'disk_usage[disk={"path":"/","threshold":90},region=eu]',
+        'disk_usage[disk={"path":"/","threshold":90},region=us]',
+        "cpu_usage",
+    ]
+
+
+@pytest.mark.parametrize(
+    "selector, expected",
+    [
+        (Selector("region=eu"), [0, 2]),
+        (Selector('threshold":90 and region=us'), [3]),
+        (Selector("cpu or region=us"), [1, 3, 4]),
+        (Selector(tags=["disk"]), [0, 1, 2, 3]),
+    ],
+)
+def test_selection_picks_matrix_combinations(suite, selector, expected) -> None:
+    names = [test.name for test in suite().tests]
+    assert [test.name for test in suite(selector).tests] == [
+        names[position] for position in expected
+    ]
+
+
+def test_invalid_matrix(tmp_path) -> None:
+    path = tmp_path / "suite.yaml"
+    path.write_text("tests:\n  - {name: t, plugin_identifier: noop, matrix: {a: []}}\n")
+    service = create_test_suite_service(create_plugin_manager())
+    with pytest.raises(ValueError, match="Invalid configuration in .*suite.yaml"):
+        service.data_parser_service.load_suite([path], Selector("t"))
+
+
+def _parser(cache_dir=None):
+    service = create_test_suite_service(create_plugin_manager(), cache_dir=cache_dir)
+    return service.data_parser_service
+
+
+def test_disk_cache_is_plain_json(tmp_path) -> None:
+    path = tmp_path / "suite.yaml"
+    path.write_text(SUITE)
+    cache_dir = tmp_path / "cache"
+    _parser(cache_dir).load_suite([path])
+
+    (entry,) = cache_dir.iterdir()
+    assert entry.name.startswith("yaml-") and entry.suffix == ".json"
+    assert json.loads(entry.read_text())["tests"][1]["name"] == "cpu_usage"
+    # A new process reads the parsed file back instead of parsing it again
+    entry.write_text(
+        json.dumps({"tests": [{"name": "cached", "plugin_identifier": "x"}]})
+    )
+    assert [test.name for test in _parser(cache_dir).load_suite([path]).tests] == [
+        "cached"
+    ]
+
+
+def test_disk_cache_ignores_pickles(tmp_path) -> None:
+    path = tmp_path / "suite.yaml"
+    path.write_text(SUITE)
+    cache_dir = tmp_path / "cache"
+    _parser(cache_dir).load_suite([path])
+    (entry,) = cache_dir.iterdir()
+    entry.with_suffix(".pickle").write_bytes(pickle.dumps({"tests": []}))
+    entry.unlink()
+
+    assert len(_parser(cache_dir).load_suite([path]).tests) == 5
+
+
+def test_disk_cache_keyed_by_parser_version(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "suite.yaml"
+    path.write_text(SUITE)
+    cache_dir = tmp_path / "cache"
+    _parser(cache_dir).load_suite([path])
+    monkeypatch.setattr(config_parser_service, "_parser_version", lambda _: "yaml-2")
+    _parser(cache_dir).load_suite([path])
+
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_disk_cache_skips_non_json_values(tmp_path) -> None:
+    path = tmp_path / "suite.yaml"
+    path.write_text(
+        "tests:\n  - {name: t, plugin_identifier: x, parameters: {day: 2026-01-01}}\n"
+    )
+    cache_dir = tmp_path / "cache"
+    (test,) = _parser(cache_dir).load_suite([path]).tests
+
+    assert test.parameters["day"] == datetime.date(2026, 1, 1)
+    assert not cache_dir.exists() or not list(cache_dir.iterdir())
+
+
+def _write(directory, name, text):
+    path = directory / name
+    path.write_text(text)
+    return path
+
+
+def test_file_included_twice_with_same_parameters(tmp_path) -> None:
+    _write(tmp_path, "common.yaml", "tests:\n  - {name: t, plugin_identifier: x}\n")
+    _write(tmp_path, "a.yaml", "include: common.yaml\n")
+    _write(tmp_path, "b.yaml", "include: common.yaml\n")
+    root = _write(tmp_path, "root.yaml", "include: [a.yaml, b.yaml]\n")
+
+    assert [test.name for test in _parser().load_suite([root]).tests] == ["t"]
+
+
+def test_file_included_twice_with_different_parameters(tmp_path) -> None:
+    _write(tmp_path, "common.yaml", "tests:\n  - {name: t, plugin_identifier: x}\n")
+    _write(tmp_path, "a.yaml", "include: common.yaml\nparameters: {region: eu}\n")
+    _write(tmp_path, "b.yaml", "include: common.yaml\nparameters: {region: us}\n")
+    root = _write(tmp_path, "root.yaml", "include: [a.yaml, b.yaml]\n")
+
+    with pytest.raises(
+        ValueError, match="common.yaml' is loaded from .*a.yaml' and from .*b.yaml"
+    ):
+        _parser().load_suite([root])
+
+
+@pytest.mark.parametrize(
+    "text, error",
+    [
+        ("tests:\n  - just a name\n", "a test must be a mapping, got str"),
+        ("tests: {name: t}\n", "tests must be a list, got dict"),
+        ("reports: [json]\n", "a reporter must be a mapping, got str"),
+        ("budgets: [cpu]\n", "budgets must be a mapping, got list"),
+        ("budgets: {system: 5}\n", "a budget must be a mapping, got int"),
+    ],
+)
+def test_malformed_entries_name_the_file(tmp_path, text, error) -> None:
+    path = _write(tmp_path, "suite.yaml", text)
+    with pytest.raises(
+        ValueError, match=f"Invalid configuration in .*suite.yaml.*{error}"
+    ):
+        _parser().load_suite([path])
@@ -0,0 +1,235 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+from athena.models.test_result import ResultType
+from athena.plugins.builtin.test_runners import files_test_runner
+from athena.plugins.builtin.test_runners.files_test_runner import (
+    FilesTestRunner,
+    FilesTestRunnerParameters,
+    hash_file,
+    read_manifest,
+)
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def working_directory(tmp_path, monkeypatch):
+    # The default hash cache is relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    files = {"a.txt": b"alpha", "sub/b.bin": b"\0" * 1000, "empty": b""}
+    for name, data in files.items():
+        (root / name).parent.mkdir(exist_ok=True)
+        (root / name).write_bytes(data)
+    checksums = {name: _sha256(data) for name, data in files.items()}
+    return root, checksums
+
+
+@pytest.fixture
+def runner():
+    runner = FilesTestRunner()
+    yield runner
+    runner.teardown_suite(None)
+
+
+@pytest.fixture
+def hashed(monkeypatch):
+    """Names of the files actually read, cache misses only."""
+    names = []
+
+    def record(path, algorithm, chunk_size):
+        names.append(path.name)
+        return hash_file(path, algorithm, chunk_size)
+
+    monkeypatch.setattr(files_test_runner, "hash_file", record)
+    return names
+
+
+@pytest.mark.parametrize("size", [0, 1, 6, 7, 8, 21])
+def test_hash_file_across_chunk_boundaries(tmp_path, size) -> None:
+    path = tmp_path / "data"
+    data = os.urandom(size)
+    path.write_bytes(data)
+    assert hash_file(path, "sha256", chunk_size=7) == _sha256(data)
+    assert hash_file(path, "md5", chunk_size=1 << 20) == hashlib.md5(data).hexdigest()
+
+
+def test_hash_file_detects_size_change(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "data"
+    path.write_bytes(b"12345")
+    fstat = os.fstat
+
+    def shrunk(fd):
+        # As if the file had been truncated between stat and read
+        result = fstat(fd)
+        return os.stat_result((*result[:6], result.st_size + 10, *result[7:]))
+
+    monkeypatch.setattr(files_test_runner.os, "fstat", shrunk)
+    with pytest.raises(OSError, match="changed size while being hashed"):
+        hash_file(path, "sha256", 4)
+
+
+def test_verifies_files(tree, runner) -> None:
+    root, checksums = tree
+    result = runner(FilesTestRunnerParameters(root=root, checksums=checksums))
+    assert result.type == ResultType.PASSED
+    assert result.message == "3 files verified"
+
+
+def test_reports_mismatched_and_missing(tree, runner) -> None:
+    root, checksums = tree
+    checksums = {**checksums, "a.txt": "0" * 64, "gone": None, "lost": "1" * 64}
+    result = runner(
+        FilesTestRunnerParameters(root=root, checksums=checksums, max_details=1)
+    )
+    assert result.type == ResultType.FAILED
+    assert result.message == (
+        "3 of 5 files differ (1 mismatched, 2 missing); first 1 listed"
+    )
+    ((name, detail),) = result.details.items()
+    assert name == "a.txt"
+    assert detail.actual == _sha256(b"alpha")
+
+
+def test_existence_only_is_never_hashed(tree, runner, hashed) -> None:
+    root, checksums = tree
+    parameters = FilesTestRunnerParameters(
+        root=root, checksums=dict.fromkeys(checksums), cache_path=None
+    )
+    assert runner(parameters).type == ResultType.PASSED
+    assert hashed == []
+
+
+def test_cache_hit_and_miss(tree, tmp_path, hashed) -> None:
+    root, checksums = tree
+    cache_path = tmp_path / "cache" / "hashes.json"
+    parameters = FilesTestRunnerParameters(
+        root=root, checksums=checksums, cache_path=cache_path
+    )
+    first = FilesTestRunner()
+    assert first(parameters).type == ResultType.PASSED
+    assert sorted(hashed) == ["a.txt", "b.bin", "empty"]
+    assert sorted(json.loads(cache_path.read_text())) == sorted(
+        str((root / name).absolute()) for name in checksums
+    )
+
+    # A new process reads the persisted cache: nothing is hashed again
+    hashed.clear()
+    second = FilesTestRunner()
+    assert second(parameters).type == ResultType.PASSED
+    assert hashed == []
+
+    # A changed file is a miss, detected even with the same size
+    (root / "a.txt").write_bytes(b"alphb")
+    os.utime(root / "a.txt", ns=(1, 1))
+    result = second(parameters)
+    assert hashed == ["a.txt"]
+    assert result.details["a.txt"].actual == _sha256(b"alphb")
+
+    # The cache is per algorithm
+    hashed.clear()
+    md5 = {
+        name: hashlib.md5((root / name).read_bytes()).hexdigest() for name in checksums
+    }
+    second(parameters.model_copy(update={"algorithm": "md5", "checksums": md5}))
+    assert sorted(hashed) == ["a.txt", "b.bin", "empty"]
+    first.teardown_suite(None)
+    second.teardown_suite(None)
+
+
+def test_unreadable_cache_ignored(tree, tmp_path, runner, caplog) -> None:
+    root, checksums = tree
+    cache_path = tmp_path / "hashes.json"
+    cache_path.write_text("{not json")
+    parameters = FilesTestRunnerParameters(
+        root=root, checksums=checksums, cache_path=cache_path
+    )
+    assert runner(parameters).type == ResultType.PASSED
+    assert "Ignoring unreadable hash cache" in caplog.text
+    assert len(json.loads(cache_path.read_text())) == 3
+
+
+def test_cache_saved_after_the_suite(tree, tmp_path) -> None:
+    root, checksums = tree
+    cache_path = tmp_path / "hashes.json"
+    runner = FilesTestRunner()
+    runner.setup_suite(None)
+    parameters = FilesTestRunnerParameters(
+        root=root, checksums=checksums, cache_path=cache_path, workers=2
+    )
+    runner(parameters)
+    runner(parameters)
+    assert not cache_path.exists()
+    # Both tests used the same pool of hashing threads
+    assert list(runner._pools) == [2]
+    pool = runner._pools[2]
+
+    runner.teardown_suite(None)
+    assert cache_path.exists()
+    assert runner._pools == {}
+    with pytest.raises(RuntimeError):
+        pool.submit(print)
+
+
+def test_read_manifest(tmp_path) -> None:
+    manifest = tmp_path / "SHA256SUMS"
+    manifest.write_text(
+        "# release 1.0\n"
+        "\n"
+        "ABCDEF  text.txt\n"
+        "012345 *binary.bin\n"
+        "6789ab  name with spaces\r\n"
+    )
+    assert read_manifest(manifest) == {
+        "text.txt": "abcdef",
+        "binary.bin": "012345",
+        "name with spaces": "6789ab",
+    }
+
+
+def test_manifest_combined_with_checksums(tree, runner) -> None:
+    root, checksums = tree
+    lines = [f"{checksums['a.txt']}  a.txt", f"{'0' * 64} *sub/b.bin"]
+    (root / "SHA256SUMS").write_text("\n".join(lines) + "\n")
+    result = runner(
+        FilesTestRunnerParameters(
+            root=root,
+            manifest="SHA256SUMS",
+            checksums={"empty": checksums["empty"]},
+            cache_path=None,
+        )
+    )
+    assert result.type == ResultType.FAILED
+    assert result.message.startswith("1 of 3 files differ")
+    assert list(result.details) == ["sub/b.bin"]
+
+
+@pytest.mark.parametrize("text", ["nodigest\n", "abcdef \n"])
+def test_invalid_manifest(tree, runner, text) -> None:
+    root, _ = tree
+    (root / "SHA256SUMS").write_text(text)
+    result = runner(FilesTestRunnerParameters(root=root, manifest="SHA256SUMS"))
+    assert result.type == ResultType.FAILED
+    assert result.message.startswith("Could not read manifest: Invalid line 1")
+
+
+def test_nothing_to_check(runner) -> None:
+    result = runner(FilesTestRunnerParameters())
+    assert result.type == ResultType.SKIPPED
+
+
+@pytest.mark.parametrize("algorithm", ["nope", "shake_128"])
+def test_invalid_algorithm(algorithm) -> None:
+    with pytest.raises(ValueError, match=algorithm):
+        FilesTestRunnerParameters(algorithm=algorithm)
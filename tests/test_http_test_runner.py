@@ -0,0 +1,176 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, Tuple
+
+import pytest
+from pydantic import ValidationError
+
+from athena.models.test_result import ResultType
+from athena.plugins.builtin.test_runners.http_test_runner import (
+    HttpTestRunner,
+    HttpTestRunnerParameters,
+    _HostKey,
+)
+
+BIG_BODY = b"a" * 10_000
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self) -> None:
+        super().setup()
+        with _Handler.lock:
+            _Handler.connections += 1
+
+    def do_GET(self) -> None:
+        content_type = "text/plain; charset=utf-8"
+        status, body = 200, b"hello world"
+        if self.path == "/missing":
+            status, body = 404, b"not found"
+        elif self.path == "/big":
+            body = BIG_BODY
+        elif self.path == "/bogus-charset":
+            content_type = "text/plain; charset=bogus"
+        elif self.path == "/close-after":
+            # Answer as if keeping the connection alive, then drop it, like a
+            # server closing idle connections before the client reuses them
+            self.close_connection = True
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    def handle_error(self, request: object, client_address: object) -> None:
+        pass  # Clients dropping connections on purpose are expected
+
+
+@pytest.fixture
+def server() -> Iterator[Tuple[str, type]]:
+    _Handler.connections = 0
+    httpd = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", _Handler
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture
+def runner() -> Iterator[HttpTestRunner]:
+    runner = HttpTestRunner()
+    yield runner
+    runner.pool.close()
+
+
+def test_reuses_connections(server, runner) -> None:
+    url, handler = server
+    for _ in range(10):
+        result = runner(HttpTestRunnerParameters(url=f"{url}/ok"))
+        assert result.type == ResultType.PASSED
+    assert handler.connections == 1
+
+
+def test_unexpected_status_fails(server, runner) -> None:
+    url, _ = server
+    result = runner(HttpTestRunnerParameters(url=f"{url}/missing"))
+    assert result.type == ResultType.FAILED
+    assert result.details["status"].actual == 404
+    assert not result.details["status"].success
+
+
+def test_body_pattern(server, runner) -> None:
+    url, _ = server
+    passed = runner(HttpTestRunnerParameters(url=f"{url}/ok", body_pattern="w.rld"))
+    assert passed.type == ResultType.PASSED
+    assert passed.details["body"].actual == "world"
+
+    failed = runner(HttpTestRunnerParameters(url=f"{url}/ok", body_pattern="^bye"))
+    assert failed.type == ResultType.FAILED
+    assert failed.details["body"].actual is None
+
+
+def test_retries_stale_connection(server, runner, monkeypatch) -> None:
+    url, handler = server
+    first = runner(HttpTestRunnerParameters(url=f"{url}/close-after"))
+    assert first.type == ResultType.PASSED
+
+    acquired = []
+    acquire = runner.pool.acquire
+
+    def record(*args):
+        connection, reused = acquire(*args)
+        acquired.append(reused)
+        return connection, reused
+
+    monkeypatch.setattr(runner.pool, "acquire", record)
+    # The pooled connection was closed by the server: the retry opens another
+    second = runner(HttpTestRunnerParameters(url=f"{url}/ok"))
+    assert second.type == ResultType.PASSED
+    assert acquired == [True, False]
+    assert handler.connections == 2
+
+
+def test_max_body_truncates(server, runner) -> None:
+    url, handler = server
+    parameters = HttpTestRunnerParameters(
+        url=f"{url}/big", max_body=100, body_pattern="a+"
+    )
+    result = runner(parameters)
+    assert result.type == ResultType.PASSED
+    assert result.details["body"].actual == "a" * 100
+
+    # A partly read body leaves the connection unusable, so it is not pooled
+    runner(HttpTestRunnerParameters(url=f"{url}/ok"))
+    assert handler.connections == 2
+
+
+def test_unknown_charset_falls_back_to_utf8(server, runner) -> None:
+    url, _ = server
+    result = runner(
+        HttpTestRunnerParameters(url=f"{url}/bogus-charset", body_pattern="hello")
+    )
+    assert result.type == ResultType.PASSED
+
+
+@pytest.mark.parametrize(
+    "url", ["http://127.0.0.1:99999/", "http://127.0.0.1:port/", "http:///path"]
+)
+def test_invalid_url_rejected(url) -> None:
+    with pytest.raises(ValidationError, match="url"):
+        HttpTestRunnerParameters(url=url)
+
+
+def test_waiting_for_a_connection_times_out(server) -> None:
+    url, _ = server
+    runner = HttpTestRunner(max_connections_per_host=1)
+    parameters = HttpTestRunnerParameters(url=f"{url}/ok", timeout=0.2)
+    key = _HostKey("http", "127.0.0.1", int(url.rsplit(":", 1)[1]), True)
+    # Another test holds the only connection to the host
+    connection, _ = runner.pool.acquire(key, 1.0)
+    try:
+        started = time.monotonic()
+        result = runner(parameters)
+        assert time.monotonic() - started < 1.0
+    finally:
+        runner.pool.release(key, connection, reusable=False)
+        runner.pool.close()
+
+    assert result.type == ResultType.FAILED
+    assert "No free connection to 127.0.0.1" in result.message
+    assert runner(parameters).type == ResultType.PASSED
+    runner.pool.close()
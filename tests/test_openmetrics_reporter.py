@@ -0,0 +1,187 @@
+import os
+import urllib.request
+
+import pytest
+from typer.testing import CliRunner
+
+from athena import cli
+from athena.models.resource_usage import ResourceUsage
+from athena.models.test_config import TestConfig as Config
+from athena.models.test_details import TestDetails as Details
+from athena.models.test_result import TestResult as Result
+from athena.models.test_result_summary import TestResultSummary as ResultSummary
+from athena.models.test_suite_summary import TestSuiteSummary as Summary
+from athena.plugins.builtin.reporters import openmetrics_reporter
+from athena.plugins.builtin.reporters.openmetrics_reporter import (
+    OPENMETRICS_CONTENT_TYPE,
+    PROMETHEUS_CONTENT_TYPE,
+    OpenMetricsReporter,
+    OpenMetricsReporterParameters,
+)
+
+
+def _summary():
+    usage = ResourceUsage(
+        cpu_user=0.5, cpu_system=0.25, peak_rss_delta=1024, exceeded=("cpu",)
+    )
+    return Summary(
+        timestamp="2026-01-01T00:00:00",
+        duration=2.5,
+        results=(
+            ResultSummary(
+                config=Config(name='say "hi"\n', plugin_identifier="http", source="a"),
+                result=Result.passed(
+                    details={
+                        "latency": Details(expected=1.0, actual=0.25, success=True),
+                        "status": Details(expected=[200], actual=200, success=True),
+                        "body": Details(expected="ok", actual="ok", success=True),
+                    }
+                ),
+                duration=0.5,
+                resources=usage,
+            ),
+            ResultSummary(
+                config=Config(name='say "hi"\n', plugin_identifier="http", source="a"),
+                result=Result.failed(),
+                duration=float("inf"),
+            ),
+        ),
+    )
+
+
+def _families(exposition):
+    """Split an exposition into its metric families, keyed by name."""
+    families = {}
+    for line in exposition.splitlines():
+        if line.startswith("# TYPE "):
+            name = line.split()[2]
+            families[name] = []
+        elif line != "# EOF":
+            families[name].append(line)
+    return families
+
+
+def test_exposition_format() -> None:
+    exposition = OpenMetricsReporter().render(_summary(), "athena")
+    assert exposition.endswith("\n# EOF\n")
+    assert exposition.count("# EOF") == 1
+
+    families = _families(exposition)
+    for name, lines in families.items():
+        assert all(line.startswith(("#", name)) for line in lines)
+    assert families["athena_suite_duration_seconds"] == [
+        "# UNIT athena_suite_duration_seconds seconds",
+        "# HELP athena_suite_duration_seconds Wall time of the last test suite run.",
+        "athena_suite_duration_seconds 2.5",
+    ]
+    assert 'athena_suite_tests{status="failed"} 1.0' in families["athena_suite_tests"]
+
+    labels = 'test="say \\"hi\\"\\n",runner="http",source="a"'
+    duplicate = f'{labels},occurrence="1"'
+    assert f'athena_test_status{{{labels},status="passed"}} 1.0' in exposition
+    assert f'athena_test_status{{{duplicate},status="failed"}} 1.0' in exposition
+    assert f"athena_test_duration_seconds{{{duplicate}}} +Inf" in exposition
+    assert f'athena_test_cpu_seconds{{{labels},mode="system"}} 0.25' in exposition
+    assert f"athena_test_over_budget{{{labels}}} 1.0" in exposition
+    # Only numeric details are exposed
+    actual = families["athena_test_actual"]
+    assert [line.split("detail=")[1] for line in actual[1:]] == [
+        '"latency"} 0.25',
+        '"status"} 200.0',
+    ]
+    # No test traced its allocations: the family has no sample
+    assert families["athena_test_traced_peak_bytes"][2:] == []
+
+
+def test_prefix() -> None:
+    exposition = OpenMetricsReporter().render(_summary(), "ci:athena")
+    assert "# TYPE ci:athena_test_status gauge" in exposition
+    with pytest.raises(ValueError):
+        OpenMetricsReporterParameters(summary=_summary(), prefix="1bad")
+
+
+def _write(path):
+    reporter = OpenMetricsReporter()
+    reporter(OpenMetricsReporterParameters(summary=_summary(), path=path))
+    return reporter
+
+
+def test_textfile_replaced_atomically(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "athena.prom"
+    _write(path)
+    written = path.read_text()
+    assert written == OpenMetricsReporter().render(_summary(), "athena")
+
+    def fail(source, destination):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(openmetrics_reporter.os, "replace", fail)
+    with pytest.raises(OSError, match="disk full"):
+        _write(path)
+    # The previous textfile is intact and the partial file is gone
+    assert path.read_text() == written
+    assert [entry.name for entry in tmp_path.iterdir()] == ["athena.prom"]
+
+
+@pytest.mark.parametrize("umask", [0o022, 0o077])
+def test_textfile_mode_follows_umask(tmp_path, monkeypatch, umask) -> None:
+    monkeypatch.setattr(openmetrics_reporter, "_UMASK", umask)
+    path = tmp_path / "athena.prom"
+    _write(path)
+    assert os.stat(path).st_mode & 0o777 == 0o666 & ~umask
+
+
+def _scrape(url, accept=None):
+    request = urllib.request.Request(url, headers={"Accept": accept} if accept else {})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.headers["Content-Type"], response.read().decode()
+
+
+def test_every_mode_updates_one_endpoint(tmp_path, monkeypatch) -> None:
+    """Runs started with ``--every`` share one endpoint serving the latest run."""
+    monkeypatch.chdir(tmp_path)
+    config = tmp_path / "suite.yaml"
+    config.write_text("""
+tests:
+  - {name: flaky, plugin_identifier: noop, parameters: {status: passed}}
+reports:
+  - name: metrics
+    plugin_identifier: openmetrics
+    parameters: {path: athena.prom, http_port: 0}
+""")
+    servers = []
+    serve = OpenMetricsReporter._serve
+
+    def record(reporter, host, port):
+        serve(reporter, host, port)
+        servers.append(reporter._servers[(host, port)])
+
+    scrapes = []
+
+    def sleep(seconds):
+        (server,) = set(servers)
+        url = f"http://127.0.0.1:{server.server_port}/metrics"
+        scrapes.append(_scrape(url, "application/openmetrics-text"))
+        if len(scrapes) == 1:
+            # The next run reads the changed file, as a long-lived process would
+            config.write_text(config.read_text().replace("passed", "failed"))
+            return
+        scrapes.append(_scrape(url))
+        server.shutdown()
+        server.server_close()
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(OpenMetricsReporter, "_serve", record)
+    monkeypatch.setattr(cli.time, "sleep", sleep)
+    result = CliRunner().invoke(cli.app, ["run", str(config), "--every", "0"])
+
+    assert result.exit_code == 130
+    assert len(servers) == 2
+    (first_type, first), (second_type, second), (plain_type, plain) = scrapes
+    assert first_type == second_type == OPENMETRICS_CONTENT_TYPE
+    assert plain_type == PROMETHEUS_CONTENT_TYPE
+    labels = 'test="flaky",runner="noop",source="suite.yaml"'
+    assert f'athena_test_status{{{labels},status="passed"}} 1.0' in first
+    assert f'athena_test_status{{{labels},status="failed"}} 1.0' in second
+    assert plain == second == (tmp_path / "athena.prom").read_text()
+    assert result.output.count("Metrics served at") == 1
@@ -0,0 +1,80 @@
+import pytest
+
+from athena.models.test_config import TestConfig as Config
+from athena.parameters import EMPTY, FrozenMapping, ParameterResolver, thaw
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ({200: "ok"}, {"200": "ok"}),
+        ({True: "x"}, {"true": "x"}),
+        ({None: "x"}, {"null": "x"}),
+        ({1: "x", "a": "y"}, {"1": "x", "a": "y"}),
+        ({"a": [{2: "x"}]}, {"a": [{"2": "x"}]}),
+        ({"a": 1}, {"a": 1.0}),
+        ({"a": 1}, {"a": True}),
+        ({"a": "1"}, {"a": 1}),
+        ({"a": {"b": 1}}, {"a": {"b": "1"}}),
+        ({"a": [1, 2]}, {"a": "[1, 2]"}),
+    ],
+)
+def test_different_parameters_never_share_a_digest(first, second) -> None:
+    resolver = ParameterResolver()
+    frozen, other = resolver.freeze(first), resolver.freeze(second)
+    assert frozen.digest != other.digest
+    assert thaw(frozen) == first
+    assert thaw(other) == second
+
+
+def test_equal_parameters_are_shared() -> None:
+    resolver = ParameterResolver()
+    first = resolver.freeze({"url": "http://a", "headers": {"x": "1", "y": "2"}})
+    second = resolver.freeze({"headers": {"y": "2", "x": "1"}, "url": "http://a"})
+    assert first is second
+    assert first["headers"] is resolver.freeze({"x": "1", "y": "2"})
+
+
+def test_deep_merge() -> None:
+    resolver = ParameterResolver()
+    base = {"timeout": 5, "headers": {"a": "1", "b": "2"}, "codes": [200, 204]}
+    resolved = resolver.resolve(
+        base, None, {"headers": {"b": "3", "c": "4"}, "codes": [500]}
+    )
+    assert resolved.to_dict() == {
+        "timeout": 5,
+        "headers": {"a": "1", "b": "3", "c": "4"},
+        "codes": [500],
+    }
+    assert list(resolved) == ["timeout", "headers", "codes"]
+    assert len(resolved) == 3
+    assert resolver.resolve(base, {"timeout": 5}) is not resolver.freeze(base)
+    assert resolver.resolve(base, {"timeout": 5}).to_dict() == base
+
+
+def test_merges_are_cached() -> None:
+    resolver = ParameterResolver()
+    base = resolver.freeze({"a": {"b": 1}})
+    merged = resolver.merge(base, {"c": 2})
+    assert resolver.merge({"a": {"b": 1}}, {"c": 2}) is merged
+    assert merged["a"] is base["a"]
+    assert resolver.resolve() is EMPTY
+    assert resolver.merge(base, {}) is base
+
+
+def test_frozen_mapping_is_immutable() -> None:
+    frozen = ParameterResolver().freeze({"a": [1, {"b": 2}]})
+    assert isinstance(frozen, FrozenMapping)
+    assert frozen["a"] == (1, frozen["a"][1])
+    with pytest.raises(TypeError):
+        frozen["a"] = 1  # type: ignore[index]
+
+
+def test_test_config_keeps_frozen_parameters() -> None:
+    frozen = ParameterResolver().freeze({"a": {"b": [1]}})
+    config = Config(name="t", plugin_identifier="x", parameters=frozen)
+    assert config.parameters is frozen
+    assert Config.model_validate(config.model_dump()).parameters == {"a": {"b": [1]}}
+    assert Config(name="t", plugin_identifier="x", parameters={"a": 1}).parameters == {
+        "a": 1
+    }
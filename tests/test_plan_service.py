@@ -0,0 +1,90 @@
+import pytest
+
+from athena.cli import create_plugin_manager, create_test_suite_service
+from athena.exceptions import MAX_LISTED_ERRORS, PlanError
+from athena.parameters import FrozenMapping
+
+
+@pytest.fixture
+def compile_plan(tmp_path, monkeypatch):
+    # Tests are sourced from paths relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    service = create_test_suite_service(create_plugin_manager())
+
+    def compile_plan(text):
+        path = tmp_path / "suite.yaml"
+        path.write_text(text)
+        return service.compile_plan([path])
+
+    return compile_plan
+
+
+def test_parameters_resolved_in_layers(compile_plan) -> None:
+    plan = compile_plan("""
+parameters: {status: failed, extra: {a: 1}}
+tests:
+  - {name: inherits, plugin_identifier: noop}
+  - {name: overrides, plugin_identifier: noop, parameters: {status: skipped}}
+""")
+    inherits, overrides = plan.tests
+    assert inherits.parameters.status == "failed"
+    assert overrides.parameters.status == "skipped"
+    assert isinstance(overrides.config.parameters, FrozenMapping)
+    assert overrides.config.parameters["extra"] is inherits.config.parameters["extra"]
+
+
+def test_plan_error_collects_every_problem(compile_plan) -> None:
+    with pytest.raises(PlanError) as raised:
+        compile_plan("""
+tests:
+  - {name: ok, plugin_identifier: noop}
+  - {name: missing_1, plugin_identifier: missing}
+  - {name: missing_2, plugin_identifier: missing}
+  - {name: bad_status, plugin_identifier: noop, parameters: {status: maybe}}
+reports:
+  - {name: out, plugin_identifier: nowhere}
+""")
+    errors = raised.value.errors
+    assert len(errors) == 3
+    assert errors[0].startswith("Test #2 'missing_1' in 'suite.yaml'")
+    assert "unknown test runner plugin 'missing' (reported once" in errors[0]
+    assert errors[1].startswith("Test #4 'bad_status'")
+    assert "invalid parameters for 'noop': status:" in errors[1]
+    assert errors[2] == "Reporter 'out': unknown reporter plugin 'nowhere'"
+    assert str(raised.value).startswith("3 error(s) in test suite:\n  - Test #2")
+
+
+def test_plan_error_collects_invalid_entries(compile_plan) -> None:
+    with pytest.raises(PlanError) as raised:
+        compile_plan("""
+tests:
+  - {name: ok, plugin_identifier: noop}
+  - {plugin_identifier: noop}
+  - not a test
+  - {name: bad_repeat, plugin_identifier: noop, repeat: 0}
+reports:
+  - {name: out}
+budgets:
+  noop: {cpu_seconds: -1}
+""")
+    errors = raised.value.errors
+    assert [error.split(":")[0] for error in errors] == [
+        "Invalid configuration in 'suite.yaml', test #2",
+        "Invalid configuration in 'suite.yaml', test #3",
+        "Invalid configuration in 'suite.yaml', test #4",
+        "Invalid configuration in 'suite.yaml', reporter",
+        "Invalid configuration in 'suite.yaml', budget 'noop'",
+    ]
+    assert errors[1].endswith("a test must be a mapping, got str")
+
+
+def test_plan_error_lists_a_bounded_number_of_problems(compile_plan) -> None:
+    count = MAX_LISTED_ERRORS + 5
+    tests = "".join(
+        f"  - {{name: t{i}, plugin_identifier: noop, parameters: {{status: x}}}}\n"
+        for i in range(count)
+    )
+    with pytest.raises(PlanError) as raised:
+        compile_plan(f"tests:\n{tests}")
+    assert len(raised.value.errors) == count
+    assert str(raised.value).endswith("\n  ... and 5 more")
@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from athena.models.test_details import TestDetails as Details
+from athena.quantiles import P2Quantile, QuantileSketch
+from athena.services.repeat_service import _DetailSamples
+
+
+def _exact(values, quantile):
+    ordered = sorted(values)
+    rank = quantile * (len(ordered) - 1)
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "gauss", "expovariate"])
+@pytest.mark.parametrize("quantile", [0.5, 0.95, 0.99])
+def test_estimates_track_exact_order_statistics(distribution, quantile) -> None:
+    rng = random.Random(1234)
+    draw = {
+        "uniform": lambda: rng.uniform(0, 100),
+        "gauss": lambda: rng.gauss(50, 10),
+        "expovariate": lambda: rng.expovariate(0.1),
+    }[distribution]
+    values = [draw() for _ in range(20_000)]
+    estimator = P2Quantile(quantile)
+    for value in values:
+        estimator.add(value)
+
+    spread = _exact(values, 0.999) - _exact(values, 0.001)
+    assert estimator.value() == pytest.approx(
+        _exact(values, quantile), abs=0.02 * spread
+    )
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 4, 5])
+def test_few_samples_are_exact(count) -> None:
+    values = [7.0, 3.0, 9.0, 1.0, 5.0][:count]
+    for quantile in (0.5, 0.95, 0.99):
+        estimator = P2Quantile(quantile)
+        for value in values:
+            estimator.add(value)
+        assert estimator.value() == pytest.approx(_exact(values, quantile))
+
+
+def test_no_sample() -> None:
+    assert P2Quantile(0.5).value() is None
+    assert QuantileSketch().summary() == {}
+
+
+def test_invalid_quantile() -> None:
+    with pytest.raises(ValueError):
+        P2Quantile(1.0)
+
+
+def test_sketch_summary() -> None:
+    sketch = QuantileSketch()
+    for value in range(1, 101):
+        sketch.add(float(value))
+    summary = sketch.summary()
+    assert list(summary) == ["min", "p50", "p95", "p99", "max"]
+    assert summary["min"] == 1.0
+    assert summary["max"] == 100.0
+    assert summary["p50"] == pytest.approx(50.5, abs=1.5)
+    assert sketch.count == 100
+
+
+def _judge(details, quantile=0.95):
+    samples = _DetailSamples(quantile)
+    for detail in details:
+        samples.add(detail)
+    return samples.result()
+
+
+def test_upper_bound_detail_judged_on_percentile() -> None:
+    # Latency-like detail: a run passes when actual <= expected
+    fast = [Details(expected=1.0, actual=0.5, success=True)] * 97
+    slow = [Details(expected=1.0, actual=5.0, success=False)] * 3
+    assert _judge(fast + slow, quantile=0.9).success
+    assert not _judge(fast + slow, quantile=0.99).success
+
+
+def test_lower_bound_detail_judged_on_percentile() -> None:
+    # Throughput-like detail: a run passes when actual >= expected
+    high = [Details(expected=100, actual=150, success=True)] * 97
+    low = [Details(expected=100, actual=50, success=False)] * 3
+    # 97% of the runs are above the expectation, at least 90% must be
+    result = _judge(high + low, quantile=0.9)
+    assert result.success
+    assert 100 < result.actual <= 150
+    assert not _judge(high + low, quantile=0.99).success
+
+
+def test_lower_bound_detail_mostly_failing() -> None:
+    high = [Details(expected=100, actual=150, success=True)] * 10
+    low = [Details(expected=100, actual=50, success=False)] * 90
+    result = _judge(low + high, quantile=0.95)
+    assert not result.success
+    assert result.actual == pytest.approx(50, rel=0.02)
+
+
+def test_non_numeric_detail_judged_on_success_share() -> None:
+    passed = [Details(expected="ok", actual="ok", success=True)] * 96
+    failed = [Details(expected="ok", actual="down", success=False)] * 4
+    assert _judge(passed + failed, quantile=0.95).success
+    assert not _judge(passed + failed, quantile=0.99).success
+    assert _judge(passed + failed).quantiles is None
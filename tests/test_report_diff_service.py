@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from athena.models.test_change import ChangeType
+from athena.models.test_config import TestConfig as Config
+from athena.models.test_result import TestResult as Result
+from athena.models.test_result_summary import TestResultSummary as ResultSummary
+from athena.models.test_suite_summary import TestSuiteSummary as Summary
+from athena.services.report_diff_service import ReportDiffService
+from athena.services.report_reader_service import ReportReaderService
+
+
+def _result(name, status, duration=1.0, **actuals):
+    details = {
+        key: {"expected": None, "actual": actual, "success": True}
+        for key, actual in actuals.items()
+    }
+    return {
+        "config": {"name": name, "plugin_identifier": "noop"},
+        "result": {"type": status, "message": None, "details": details},
+        "duration": duration,
+    }
+
+
+BASELINE = [
+    _result("unchanged", "passed", latency=1.0),
+    _result("breaks", "passed"),
+    _result("fixed", "failed"),
+    _result("skipped_now", "passed"),
+    _result("removed", "passed"),
+    _result("slower", "passed", duration=1.0),
+    _result("slightly_slower", "passed", duration=1.0),
+    _result("tiny", "passed", duration=0.01),
+    _result("latency", "passed", latency=100.0, label="x", flag=True),
+    _result("repeated", "passed"),
+    _result("repeated", "passed"),
+]
+CURRENT = [
+    _result("unchanged", "passed", latency=1.1),
+    _result("breaks", "failed"),
+    _result("fixed", "passed"),
+    _result("skipped_now", "skipped"),
+    _result("added", "passed"),
+    _result("slower", "passed", duration=2.0),
+    _result("slightly_slower", "passed", duration=1.2),
+    _result("tiny", "passed", duration=0.05),
+    _result("latency", "passed", latency=150.0, label="y", flag=False),
+    _result("repeated", "passed"),
+    _result("repeated", "failed"),
+]
+EXPECTED = [
+    ("breaks", ChangeType.NEW_FAILURE, "passed", "failed", None),
+    ("fixed", ChangeType.FIXED, "failed", "passed", None),
+    ("skipped_now", ChangeType.STATUS_CHANGED, "passed", "skipped", None),
+    ("added", ChangeType.NEW, None, "passed", None),
+    ("slower", ChangeType.DURATION, 1.0, 2.0, None),
+    ("latency", ChangeType.ACTUAL, 100.0, 150.0, "latency"),
+    ("repeated", ChangeType.NEW_FAILURE, "passed", "failed", None),
+    ("removed", ChangeType.REMOVED, "passed", None, None),
+]
+
+
+def _report(path, results, timestamp):
+    path.write_text(json.dumps({"timestamp": timestamp, "results": results}))
+    return path
+
+
+@pytest.fixture
+def baseline(tmp_path):
+    return _report(tmp_path / "baseline.json", BASELINE, "2026-01-01T00:00:00")
+
+
+def _changes(diff):
+    return [
+        (change.name, change.type, change.baseline, change.current, change.detail)
+        for change in diff.changes
+    ]
+
+
+def test_diff_reports(tmp_path, baseline) -> None:
+    current = _report(tmp_path / "current.json", CURRENT, "2026-01-02T00:00:00")
+    # A small chunk size streams both reports across many reads
+    service = ReportDiffService(reader=ReportReaderService(chunk_size=7))
+    diff = service.diff_reports(baseline, current)
+    assert _changes(diff) == EXPECTED
+    assert diff.compared == len(CURRENT) - 1
+    assert diff.baseline_timestamp == "2026-01-01T00:00:00"
+    assert diff.current_timestamp == "2026-01-02T00:00:00"
+    assert [change.name for change in diff.regressions] == ["breaks", "repeated"]
+
+
+def test_diff_summary(baseline) -> None:
+    summary = Summary(
+        results=tuple(
+            ResultSummary(
+                config=Config(**result["config"]),
+                result=Result(**result["result"]),
+                duration=result["duration"],
+            )
+            for result in CURRENT
+        )
+    )
+    diff = ReportDiffService().diff_summary(baseline, summary)
+    assert _changes(diff) == EXPECTED
+    assert diff.current_timestamp == summary.timestamp
+
+
+def test_thresholds(tmp_path, baseline) -> None:
+    current = _report(tmp_path / "current.json", CURRENT, "2026-01-02T00:00:00")
+    service = ReportDiffService(
+        duration_threshold=0.1, min_duration_delta=0.0, actual_threshold=0.05
+    )
+    changes = _changes(service.diff_reports(baseline, current))
+    assert ("slightly_slower", ChangeType.DURATION, 1.0, 1.2, None) in changes
+    assert ("tiny", ChangeType.DURATION, 0.01, 0.05, None) in changes
+    assert ("unchanged", ChangeType.ACTUAL, 1.0, 1.1, "latency") in changes
+
+
+def test_identical_reports(baseline) -> None:
+    diff = ReportDiffService().diff_reports(baseline, baseline)
+    assert diff.changes == []
+    assert diff.compared == len(BASELINE)
@@ -0,0 +1,135 @@
+import json
+import os
+import random
+from collections import defaultdict
+
+import pytest
+
+from athena.services import report_merge_service
+from athena.services.report_merge_service import ReportMergeService
+
+NAMES = ["alpha", "beta", "gamma", "delta", "epsilon"]
+STATUSES = ["passed", "failed", "skipped"]
+
+
+def _result(rng, name):
+    return {
+        "config": {"name": name},
+        "result": {
+            "type": rng.choice(STATUSES),
+            "details": {
+                "latency": {"expected": 1.0, "actual": rng.uniform(0, 2)},
+                "status": {"expected": "ok", "actual": "ok"},
+            },
+        },
+        "duration": rng.uniform(0, 10),
+    }
+
+
+@pytest.fixture
+def reports(tmp_path):
+    rng = random.Random(7)
+    reports = {}
+    for index in range(6):
+        # Older reports have no host and are named after their file
+        host = f"host-{index}" if index % 2 else None
+        results = [_result(rng, rng.choice(NAMES)) for _ in range(rng.randint(3, 9))]
+        report = {"timestamp": "2026-01-01T00:00:00"}
+        if host is not None:
+            # Written before the results, as the JSON reporter does
+            report["host"] = host
+        report["results"] = results
+        path = tmp_path / "reports" / f"report-{index}.json"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(report))
+        reports[host or path.stem] = results
+    return tmp_path / "reports", reports
+
+
+def _expected(reports):
+    tests = defaultdict(lambda: {"runs": 0, "hosts": set(), "durations": []})
+    for host, results in reports.items():
+        for result in results:
+            test = tests[result["config"]["name"]]
+            test["runs"] += 1
+            test["hosts"].add(host)
+            test.setdefault(result["result"]["type"], 0)
+            test[result["result"]["type"]] += 1
+            test["durations"].append(result["duration"])
+            if result["result"]["type"] == "failed":
+                test.setdefault("failing_hosts", set()).add(host)
+            test.setdefault("latency", []).append(
+                result["result"]["details"]["latency"]["actual"]
+            )
+    return tests
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_external_sort_matches_in_memory_merge(tmp_path, reports, max_workers):
+    directory, by_host = reports
+    output = tmp_path / "fleet.json"
+    # One result per run and two runs per merge: many intermediate merges
+    service = ReportMergeService(max_workers=max_workers, run_size=1, fan_in=2)
+    summary = service.merge([directory], output)
+    fleet = json.loads(output.read_text())
+
+    expected = _expected(by_host)
+    all_results = [result for results in by_host.values() for result in results]
+    assert fleet["hosts"] == sorted(by_host)
+    assert fleet["summary"] == {
+        "reports": len(by_host),
+        "hosts": len(by_host),
+        "results": len(all_results),
+        **{
+            status: sum(r["result"]["type"] == status for r in all_results)
+            for status in STATUSES
+        },
+    }
+    assert summary.results == len(all_results)
+
+    keys = [(result["config"]["name"], result["host"]) for result in fleet["results"]]
+    assert keys == sorted(keys)
+    assert len(keys) == len(all_results)
+
+    assert [test["name"] for test in fleet["tests"]] == sorted(expected)
+    for test in fleet["tests"]:
+        want = expected[test["name"]]
+        assert test["runs"] == want["runs"]
+        assert test["hosts"] == len(want["hosts"])
+        for status in STATUSES:
+            assert test[status] == want.get(status, 0)
+        assert test["failing_hosts"] == sorted(want.get("failing_hosts", ()))
+        assert test["duration"]["count"] == len(want["durations"])
+        assert test["duration"]["min"] == pytest.approx(min(want["durations"]))
+        assert test["duration"]["max"] == pytest.approx(max(want["durations"]))
+        assert test["duration"]["mean"] == pytest.approx(
+            sum(want["durations"]) / len(want["durations"])
+        )
+        assert list(test["actual"]) == ["latency"]
+        assert test["actual"]["latency"]["mean"] == pytest.approx(
+            sum(want["latency"]) / len(want["latency"])
+        )
+    # The temporary runs are all gone
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["fleet.json", "reports"]
+
+
+def test_most_failing(tmp_path, reports):
+    directory, by_host = reports
+    summary = ReportMergeService(
+        max_workers=1, run_size=1, fan_in=2, most_failing=2
+    ).merge([directory], tmp_path / "fleet.json")
+
+    failures = _expected(by_host)
+    ranked = sorted(
+        (name for name in failures if failures[name].get("failed")),
+        key=lambda name: (-failures[name]["failed"], name),
+    )
+    assert [test.name for test in summary.most_failing] == ranked[:2]
+
+
+@pytest.mark.parametrize("umask", [0o022, 0o077])
+def test_output_mode_follows_umask(tmp_path, reports, monkeypatch, umask) -> None:
+    monkeypatch.setattr(report_merge_service, "_UMASK", umask)
+    output = tmp_path / "fleet.json"
+    ReportMergeService(max_workers=1).merge([reports[0]], output)
+    assert os.stat(output).st_mode & 0o777 == 0o666 & ~umask
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from athena.services.report_reader_service import ReportReaderService
+
+REPORT = {
+    "timestamp": "2026-01-01T00:00:00",
+    "host": 'hôst "one"',
+    "results": [
+        {"config": {"name": f"test_{index}"}, "duration": 12345.678 * index}
+        for index in range(20)
+    ]
+    + [{"text": "a,b]}{\\n☃", "values": [1e-7, -2, True, None, 123456789]}],
+    "duration": 9876543210,
+    "nested": {"results": [1, 2]},
+}
+
+
+def _write(tmp_path, text, name="report.json"):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def _expected(report):
+    for key, value in report.items():
+        if key == "results" and isinstance(value, list):
+            for item in value:
+                yield key, item
+        else:
+            yield key, value
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 16, 1 << 16])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_chunk_boundaries(tmp_path, chunk_size, indent) -> None:
+    path = _write(tmp_path, json.dumps(REPORT, indent=indent))
+    reader = ReportReaderService(chunk_size=chunk_size)
+    assert list(reader.iter_report(path)) == list(_expected(REPORT))
+    assert list(reader.iter_results(path)) == REPORT["results"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 16])
+def test_number_at_end_of_window(tmp_path, chunk_size) -> None:
+    # Every prefix of a number is a valid number: it must not be cut short
+    path = _write(tmp_path, '{"results":[1234567,89],"duration":31415926}')
+    reader = ReportReaderService(chunk_size=chunk_size)
+    assert list(reader.iter_report(path)) == [
+        ("results", 1234567),
+        ("results", 89),
+        ("duration", 31415926),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("{}", []),
+        ('{"results": []}', []),
+        (' \n{ "results" : [ ] , "a" : 1 }\n', [("a", 1)]),
+        ('{"results": {"a": 1}}', [("results", {"a": 1})]),
+    ],
+)
+def test_edge_cases(tmp_path, text, expected) -> None:
+    path = _write(tmp_path, text)
+    assert list(ReportReaderService(chunk_size=2).iter_report(path)) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "[1, 2]",
+        '{"results": [1, 2',
+        '{"results": [1 2]}',
+        '{"results": [1, 2] "a": 1}',
+        '{"a" 1}',
+        '{"a": tru}',
+        '{"a": "unterminated}',
+        '{"results": [{"a": 1},]}',
+    ],
+)
+def test_malformed(tmp_path, text) -> None:
+    path = _write(tmp_path, text)
+    with pytest.raises(ValueError):
+        list(ReportReaderService(chunk_size=3).iter_report(path))
+
+
+def test_discover(tmp_path) -> None:
+    (tmp_path / "reports").mkdir()
+    first = _write(tmp_path / "reports", "{}", "b.json")
+    second = _write(tmp_path / "reports", "{}", "a.json")
+    _write(tmp_path / "reports", "{}", "notes.txt")
+    third = _write(tmp_path, "{}", "c.json")
+    reader = ReportReaderService()
+    assert reader.discover([tmp_path / "reports", tmp_path / "*.json", third]) == [
+        second,
+        first,
+        third,
+    ]
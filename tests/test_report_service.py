@@ -0,0 +1,128 @@
+import threading
+import time
+
+import pytest
+
+from athena.models import BaseModel
+from athena.models.plugin import Plugin
+from athena.models.plugin_metadata import PluginMetadata
+from athena.models.reporter_config import ReporterConfig
+from athena.models.test_suite_config import TestSuiteConfig as SuiteConfig
+from athena.models.test_suite_summary import TestSuiteSummary as Summary
+from athena.services.plugin_service import PluginService
+from athena.services.report_service import ReportService
+
+
+class _Parameters(BaseModel):
+    summary: Summary
+    delay: float = 0.0
+    fail: bool = False
+    block: bool = False
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.calls = []
+        self.release = threading.Event()
+
+    def __call__(self, parameters: _Parameters) -> None:
+        self.calls.append(parameters)
+        if parameters.block:
+            self.release.wait(10)
+        time.sleep(parameters.delay)
+        if parameters.fail:
+            raise RuntimeError("reporter failed")
+
+
+@pytest.fixture
+def recorder():
+    recorder = _Recorder()
+    yield recorder
+    recorder.release.set()
+
+
+@pytest.fixture
+def service(recorder):
+    plugins = PluginService()
+    plugins.register_plugin(
+        Plugin(
+            metadata=PluginMetadata(name="recorder", description="Records calls"),
+            executor=recorder,
+            parameters_model=_Parameters,
+            identifiers={"recorder"},
+        )
+    )
+    return lambda **kwargs: ReportService(plugins, **kwargs)
+
+
+def _config(*reports):
+    return SuiteConfig(
+        parameters=None,
+        tests=[],
+        reports=[
+            ReporterConfig(name=name, plugin_identifier=identifier, **fields)
+            for name, identifier, fields in reports
+        ],
+    )
+
+
+SUMMARY = Summary(results=())
+
+
+def test_reporters_share_the_summary(service, recorder) -> None:
+    config = _config(("a", "recorder", {}), ("b", "recorder", {}))
+    service().generate_reports(config, SUMMARY)
+    assert len(recorder.calls) == 2
+    assert all(call.summary is SUMMARY for call in recorder.calls)
+
+
+def test_reporters_run_concurrently(service, recorder) -> None:
+    config = _config(
+        *((name, "recorder", {"parameters": {"delay": 0.3}}) for name in "abc")
+    )
+    start = time.monotonic()
+    service(max_workers=3).generate_reports(config, SUMMARY)
+    assert time.monotonic() - start < 0.8
+    assert len(recorder.calls) == 3
+
+
+def test_failures_do_not_stop_other_reporters(service, recorder) -> None:
+    config = _config(
+        ("broken", "recorder", {"parameters": {"fail": True}}),
+        ("missing", "unknown", {}),
+        ("invalid", "recorder", {"parameters": {"delay": "soon"}}),
+        ("ok", "recorder", {"parameters": {"delay": 0.1}}),
+    )
+    with pytest.raises(RuntimeError, match="3 reporter") as error:
+        service(max_workers=1).generate_reports(config, SUMMARY)
+    failed = str(error.value).split(": ", 1)[1].split(", ")
+    assert sorted(failed) == ["broken", "invalid", "missing"]
+    assert len(recorder.calls) == 2
+
+
+def test_timed_out_reporter_is_abandoned(service, recorder) -> None:
+    config = _config(
+        ("frozen", "recorder", {"parameters": {"block": True}, "timeout": 0.2}),
+        ("ok", "recorder", {}),
+    )
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="1 reporter.*frozen"):
+        service(max_workers=2).generate_reports(config, SUMMARY)
+    assert time.monotonic() - start < 2
+    assert len(recorder.calls) == 2
+
+
+def test_timeout_runs_from_the_start_of_the_reporter(service, recorder) -> None:
+    # The second reporter waits for the only worker longer than its timeout
+    config = _config(
+        ("slow", "recorder", {"parameters": {"delay": 0.4}}),
+        ("queued", "recorder", {"parameters": {"delay": 0.05}, "timeout": 0.3}),
+    )
+    service(max_workers=1).generate_reports(config, SUMMARY)
+    assert len(recorder.calls) == 2
+
+
+def test_default_timeout(service, recorder) -> None:
+    config = _config(("frozen", "recorder", {"parameters": {"block": True}}))
+    with pytest.raises(RuntimeError, match="frozen"):
+        service(timeout=0.1).generate_reports(config, SUMMARY)
@@ -0,0 +1,136 @@
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from athena.models.execution_plan import ExecutionPlan
+from athena.models.planned_test import PlannedTest
+from athena.models.plugin import Plugin
+from athena.models.plugin_metadata import PluginMetadata
+from athena.models.resource_budget import BudgetAction, ResourceBudget
+from athena.models.resource_usage import ResourceUsage
+from athena.models.test_config import TestConfig as Config
+from athena.models.test_result import ResultType
+from athena.models.test_result import TestResult as Result
+from athena.models.test_suite_config import TestSuiteConfig as SuiteConfig
+from athena.plugins.builtin.test_runners.noop_test_runner import (
+    NoopTestRunnerParameters,
+)
+from athena.services.resource_monitor_service import ResourceMonitorService, resource
+from athena.services.test_service import TestService as Service
+
+BURN = """import time
+end = time.process_time() + {0}
+while time.process_time() < end:
+    pass
+"""
+
+
+def _burn(seconds: float) -> None:
+    end = time.thread_time() + seconds
+    while time.thread_time() < end:
+        pass
+
+
+def test_child_processes_are_counted() -> None:
+    monitor = ResourceMonitorService()
+    snapshot = monitor.snapshot()
+    subprocess.run([sys.executable, "-c", BURN.format(0.3)], check=True)
+    assert monitor.usage_since(snapshot).cpu_time >= 0.25
+
+
+@pytest.mark.skipif(
+    not hasattr(resource, "RUSAGE_THREAD"), reason="per-thread CPU time unsupported"
+)
+@pytest.mark.parametrize("per_thread, counted", [(False, True), (True, False)])
+def test_helper_threads(per_thread, counted) -> None:
+    monitor = ResourceMonitorService(per_thread=per_thread)
+    snapshot = monitor.snapshot()
+    helper = threading.Thread(target=_burn, args=(0.3,))
+    helper.start()
+    helper.join()
+    assert (monitor.usage_since(snapshot).cpu_time >= 0.25) == counted
+
+
+def _usage(cpu=0.0, rss_mb=0.0, traced_mb=None):
+    megabyte = 1024 * 1024
+    return ResourceUsage(
+        cpu_user=cpu,
+        cpu_system=0.0,
+        peak_rss_delta=int(rss_mb * megabyte),
+        traced_peak=None if traced_mb is None else int(traced_mb * megabyte),
+    )
+
+
+def test_budget_within_limits() -> None:
+    budget = ResourceBudget(cpu_seconds=1, peak_rss_mb=10, action=BudgetAction.FAIL)
+    result, usage = Service().apply_budget(budget, Result.passed(), _usage(0.5, 5))
+    assert result.type == ResultType.PASSED
+    assert usage.exceeded == ()
+
+
+def test_budget_flags_by_default() -> None:
+    budget = ResourceBudget(cpu_seconds=1, traced_mb=1)
+    result, usage = Service().apply_budget(
+        budget, Result.passed(), _usage(2, traced_mb=3)
+    )
+    assert result.type == ResultType.PASSED
+    assert usage.exceeded == ("cpu 2s > 1s", "traced memory 3MB > 1MB")
+
+
+def test_budget_fails_and_keeps_message() -> None:
+    budget = ResourceBudget(peak_rss_mb=1, action=BudgetAction.FAIL)
+    result, usage = Service().apply_budget(
+        budget, Result.passed(message="ok"), _usage(rss_mb=2)
+    )
+    assert result.type == ResultType.FAILED
+    assert result.message == "ok (Resource budget exceeded: peak rss 2MB > 1MB)"
+
+
+def test_budget_applies_per_run() -> None:
+    budget = ResourceBudget(cpu_seconds=1)
+    _, usage = Service().apply_budget(budget, Result.passed(), _usage(3), runs=4)
+    assert usage.exceeded == ()
+    _, usage = Service().apply_budget(budget, Result.passed(), _usage(3), runs=2)
+    assert usage.exceeded == ("cpu per run 1.5s > 1s",)
+
+
+def _plan(budgets, concurrency=1):
+    def busy(parameters):
+        subprocess.run([sys.executable, "-c", BURN.format(0.3)], check=True)
+        return Result.passed()
+
+    plugin = Plugin(
+        metadata=PluginMetadata(name="busy", description="Burn CPU in a child"),
+        executor=busy,
+        parameters_model=NoopTestRunnerParameters,
+        identifiers={"busy"},
+    )
+    config = SuiteConfig(
+        parameters=None,
+        tests=[Config(name="busy", plugin_identifier="busy")],
+        reports=[],
+        budgets=budgets,
+        concurrency=concurrency,
+    )
+    test = PlannedTest(
+        config=config.tests[0], plugin=plugin, parameters=NoopTestRunnerParameters()
+    )
+    return ExecutionPlan(config=config, tests=(test,))
+
+
+@pytest.mark.parametrize("key", ["busy", "*"])
+def test_budget_enforced_on_run(key) -> None:
+    budget = ResourceBudget(cpu_seconds=0.1, action=BudgetAction.FAIL)
+    (summary,) = Service().run_tests(_plan({key: budget}))
+    assert summary.result.type == ResultType.FAILED
+    assert summary.result.message.startswith("Resource budget exceeded: cpu")
+    assert summary.resources.cpu_time >= 0.25
+
+
+def test_no_budget() -> None:
+    (summary,) = Service().run_tests(_plan({"other": ResourceBudget(cpu_seconds=0.1)}))
+    assert summary.result.type == ResultType.PASSED
+    assert summary.resources.exceeded == ()
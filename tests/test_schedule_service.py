@@ -0,0 +1,154 @@
+import json
+
+import pytest
+
+from athena.models.planned_test import PlannedTest
+from athena.models.plugin import Plugin
+from athena.models.plugin_metadata import PluginMetadata
+from athena.models.test_config import TestConfig as Config
+from athena.plugins.builtin.test_runners.noop_test_runner import (
+    NoopTestRunner,
+    NoopTestRunnerParameters,
+)
+from athena.services.schedule_service import SchedulePolicy, ScheduleService
+
+PLUGIN = Plugin(
+    metadata=PluginMetadata(name="noop", description="Does nothing"),
+    executor=NoopTestRunner(),
+    parameters_model=NoopTestRunnerParameters,
+    identifiers={"noop"},
+)
+
+
+def _tests(*names):
+    return [
+        PlannedTest(
+            config=Config(name=name, plugin_identifier="noop"),
+            plugin=PLUGIN,
+            parameters=NoopTestRunnerParameters(),
+        )
+        for name in names
+    ]
+
+
+@pytest.fixture
+def history(tmp_path):
+    """Write a report per call, results given as name: (status, duration)."""
+    reports = tmp_path / "reports"
+    reports.mkdir()
+
+    def write(timestamp, **results):
+        report = {
+            "timestamp": timestamp,
+            "results": [
+                {
+                    "config": {"name": name},
+                    "result": {"type": status},
+                    "duration": duration,
+                }
+                for name, (status, duration) in results.items()
+            ],
+        }
+        path = reports / f"athena_report_{len(list(reports.iterdir()))}.json"
+        path.write_text(json.dumps(report))
+        return path
+
+    write.directory = reports
+    return write
+
+
+def _order(policy, directory, names, **kwargs):
+    service = ScheduleService(policy, [directory], **kwargs)
+    tests = _tests(*names)
+    return [tests[position].config.name for position in service.order(tests)]
+
+
+def test_config_order_reads_no_report(tmp_path) -> None:
+    service = ScheduleService(SchedulePolicy.CONFIG, [tmp_path / "missing"])
+    assert service.order(_tests("a", "b", "c")) == [0, 1, 2]
+
+
+def test_longest_first(history) -> None:
+    history(
+        "2026-01-01T00:00:00",
+        a=("passed", 1.0),
+        b=("passed", 5.0),
+        c=("failed", 3.0),
+    )
+    names = ["a", "b", "c", "new"]
+    # A test without history is expected to last the median duration, 3s,
+    # and keeps its configuration position among equal durations
+    assert _order(SchedulePolicy.LONGEST_FIRST, history.directory, names) == [
+        "b",
+        "c",
+        "new",
+        "a",
+    ]
+
+
+def test_failing_first_then_longest(history) -> None:
+    history(
+        "2026-01-01T00:00:00",
+        a=("failed", 1.0),
+        b=("passed", 5.0),
+        c=("failed", 3.0),
+        d=("skipped", 9.0),
+    )
+    names = ["a", "b", "c", "d"]
+    assert _order(SchedulePolicy.FAILING_FIRST, history.directory, names) == [
+        "c",
+        "a",
+        "d",
+        "b",
+    ]
+
+
+def test_recent_reports_weigh_more(history) -> None:
+    # Written newest first: reports are ordered by timestamp, not file name
+    history("2026-01-03T00:00:00", a=("passed", 1.0), b=("passed", 3.5))
+    history("2026-01-02T00:00:00", a=("passed", 1.0), b=("passed", 3.5))
+    history("2026-01-01T00:00:00", a=("passed", 10.0), b=("passed", 3.5))
+    service = ScheduleService(SchedulePolicy.LONGEST_FIRST, [history.directory])
+    loaded = service.load_history()
+
+    # 10 -> 10 + 0.5 * (1 - 10) = 5.5 -> 5.5 + 0.5 * (1 - 5.5) = 3.25, while
+    # the plain mean, 4, would have put it first
+    assert loaded["a"].duration == pytest.approx(3.25)
+    assert loaded["b"].duration == pytest.approx(3.5)
+    assert service.order(_tests("a", "b")) == [1, 0]
+
+
+def test_failure_rate_decays(history) -> None:
+    history("2026-01-01T00:00:00", a=("failed", 1.0))
+    history("2026-01-02T00:00:00", a=("passed", 1.0))
+    history("2026-01-03T00:00:00", a=("skipped", 1.0))
+    service = ScheduleService(SchedulePolicy.FAILING_FIRST, [history.directory])
+    assert service.load_history()["a"].failure_rate == pytest.approx(0.5)
+
+
+def test_only_newest_reports(history) -> None:
+    history("2026-01-01T00:00:00", a=("passed", 100.0))
+    history("2026-01-02T00:00:00", a=("passed", 1.0), b=("passed", 2.0))
+    names = ["a", "b"]
+    assert _order(
+        SchedulePolicy.LONGEST_FIRST, history.directory, names, max_reports=1
+    ) == ["b", "a"]
+    assert _order(SchedulePolicy.LONGEST_FIRST, history.directory, names) == [
+        "a",
+        "b",
+    ]
+
+
+def test_unreadable_reports_ignored(history, caplog) -> None:
+    history("2026-01-01T00:00:00", a=("passed", 1.0), b=("passed", 2.0))
+    broken = history.directory / "athena_report_broken.json"
+    broken.write_text('{"timestamp": "2026-01-02T00:00:00", "results": [{"con')
+    missing_keys = history.directory / "athena_report_keys.json"
+    missing_keys.write_text('{"timestamp": "2026-01-03", "results": [{"a": 1}]}')
+
+    assert _order(SchedulePolicy.LONGEST_FIRST, history.directory, ["a", "b"]) == [
+        "b",
+        "a",
+    ]
+    assert f"Ignoring unreadable report '{broken}'" in caplog.text
+    assert f"Ignoring unreadable report '{missing_keys}'" in caplog.text
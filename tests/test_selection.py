@@ -0,0 +1,37 @@
+import pytest
+
+from athena.selection import TestIndex as Index
+from athena.selection import TestSelector as Selector
+
+TESTS = [
+    {"name": "API health", "tags": ["Smoke", "api"]},
+    {"name": "disk usage", "tags": ["slow"]},
+    {"name": "api latency", "tags": ["API", "SLOW"]},
+    {"tags": ["smoke"]},
+]
+
+
+@pytest.mark.parametrize(
+    "tags, expected",
+    [(["smoke"], (0,)), (["SMOKE"], (0,)), (["Api"], (0, 2)), (["slow"], (1, 2))],
+)
+def test_tags_ignore_case(tags, expected) -> None:
+    assert Index(TESTS).select(Selector(tags=tags)) == expected
+    assert [
+        position
+        for position, test in enumerate(TESTS)
+        if "name" in test and Selector(tags=tags).matches(test["name"], test["tags"])
+    ] == list(expected)
+
+
+@pytest.mark.parametrize(
+    "keyword, expected",
+    [("api", (0, 2)), ("API and not slow", (0,)), ("smoke or disk", (0, 1))],
+)
+def test_keywords_ignore_case(keyword, expected) -> None:
+    assert Index(TESTS).select(Selector(keyword)) == expected
+
+
+def test_invalid_expression() -> None:
+    with pytest.raises(ValueError, match="missing"):
+        Selector("(api")
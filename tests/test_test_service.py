@@ -0,0 +1,125 @@
+from typing import List
+
+import pytest
+
+from athena.models.execution_plan import ExecutionPlan
+from athena.models.planned_test import PlannedTest
+from athena.models.plugin import Plugin
+from athena.models.plugin_metadata import PluginMetadata
+from athena.models.test_config import TestConfig as Config
+from athena.models.test_result import ResultType
+from athena.models.test_result import TestResult as Result
+from athena.models.test_suite_config import TestSuiteConfig as SuiteConfig
+from athena.plugins.builtin.test_runners.noop_test_runner import (
+    NoopTestRunnerParameters,
+)
+from athena.services.test_service import TestService as Service
+
+
+class _Runner:
+    """Runner recording its lifecycle, failing where asked to."""
+
+    def __init__(self, name: str, events: List[str], fail_in: str = "") -> None:
+        self.name = name
+        self.events = events
+        self.fail_in = fail_in
+
+    def _step(self, step: str) -> None:
+        self.events.append(f"{step} {self.name}")
+        if step == self.fail_in:
+            raise RuntimeError(f"{self.name} broke")
+
+    def setup(self, config: SuiteConfig) -> None:
+        self._step("setup")
+
+    def teardown(self, config: SuiteConfig) -> None:
+        self._step("teardown")
+
+    def __call__(self, parameters: NoopTestRunnerParameters) -> Result:
+        self._step("run")
+        return Result.passed()
+
+    def plugin(self, *identifiers: str) -> Plugin:
+        return Plugin(
+            metadata=PluginMetadata(name=self.name, description="Lifecycle"),
+            executor=self,
+            parameters_model=NoopTestRunnerParameters,
+            identifiers=set(identifiers or {self.name}),
+            setup_suite=self.setup,
+            teardown_suite=self.teardown,
+        )
+
+
+def _plan(*tests):
+    """Build a plan running each (identifier, plugin) pair as one test."""
+    configs = [
+        Config(name=f"t{i}", plugin_identifier=p) for i, (p, _) in enumerate(tests)
+    ]
+    suite = SuiteConfig(parameters=None, tests=configs, reports=[])
+    return ExecutionPlan(
+        config=suite,
+        tests=tuple(
+            PlannedTest(
+                config=config, plugin=plugin, parameters=NoopTestRunnerParameters()
+            )
+            for config, (_, plugin) in zip(configs, tests)
+        ),
+    )
+
+
+def test_lifecycle_order() -> None:
+    events: List[str] = []
+    a, b = _Runner("a", events).plugin(), _Runner("b", events).plugin()
+    results = Service().run_tests(_plan(("a", a), ("b", b), ("a", a)))
+
+    assert [summary.result.type for summary in results] == [ResultType.PASSED] * 3
+    assert events == [
+        "setup a",
+        "setup b",
+        "run a",
+        "run b",
+        "run a",
+        "teardown b",
+        "teardown a",
+    ]
+
+
+def test_aliases_set_up_once() -> None:
+    events: List[str] = []
+    plugin = _Runner("a", events).plugin("a", "alias")
+    Service().run_tests(_plan(("a", plugin), ("alias", plugin)))
+    assert events == ["setup a", "run a", "run a", "teardown a"]
+
+
+def test_setup_failure() -> None:
+    events: List[str] = []
+    a = _Runner("a", events).plugin()
+    b = _Runner("b", events, fail_in="setup").plugin()
+    results = Service().run_tests(_plan(("a", a), ("b", b)))
+
+    assert results[0].result.type == ResultType.PASSED
+    assert results[1].result.type == ResultType.FAILED
+    assert results[1].result.message == "Suite setup of runner 'b' failed: b broke"
+    # Runners set up successfully are still torn down; the broken one is not
+    assert events == ["setup a", "setup b", "run a", "teardown a"]
+
+
+def test_teardown_after_test_failure() -> None:
+    events: List[str] = []
+    a = _Runner("a", events, fail_in="run").plugin()
+    b = _Runner("b", events).plugin()
+    with pytest.raises(RuntimeError, match="a broke"):
+        Service().run_tests(_plan(("a", a), ("b", b)))
+    assert events == ["setup a", "setup b", "run a", "teardown b", "teardown a"]
+
+
+def test_teardown_failure_is_logged(caplog) -> None:
+    events: List[str] = []
+    a = _Runner("a", events, fail_in="teardown").plugin()
+    b = _Runner("b", events, fail_in="teardown").plugin()
+    results = Service().run_tests(_plan(("a", a), ("b", b)))
+
+    assert [summary.result.type for summary in results] == [ResultType.PASSED] * 2
+    assert events[-2:] == ["teardown b", "teardown a"]
+    assert "Suite teardown of runner 'b' failed" in caplog.text
+    assert "Suite teardown of runner 'a' failed" in caplog.text